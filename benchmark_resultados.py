@@ -0,0 +1,195 @@
+"""
+Benchmark da gravação e da leitura em lote de resultados.
+
+Gravação: compara a inserção linha a linha (um cursor.execute por resultado,
+como era feito antes) com o caminho atual (um único executemany com IDs
+derivados do intervalo AUTOINCREMENT), em bancos temporários criados pelas
+migrações do sistema.
+
+Memória: mede com tracemalloc quantos bytes cada resultado carregado ocupa
+como objeto com __dict__ (como era antes), como Resultado com __slots__ e
+dentro de um LoteResultados.
+
+Uso:
+    python benchmark_resultados.py [quantidade ...]
+
+Por padrão mede 1.000, 10.000 e 100.000 resultados.
+"""
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from entidade.resultado import Resultado
+from persistencia.conexao import GerenciadorConexao
+from persistencia.migracoes import aplicar_migracoes
+from persistencia.resultado_dao import ResultadoDAO
+
+QUANTIDADES_PADRAO = (1_000, 10_000, 100_000)
+EVENTO_ID = 1
+
+
+def criar_banco(diretorio: str) -> str:
+    """Cria um banco vazio com o esquema do sistema e um evento para os resultados."""
+    db_path = os.path.join(diretorio, 'banco.db')
+    with contextlib.redirect_stdout(io.StringIO()):
+        aplicar_migracoes(db_path)
+
+    with GerenciadorConexao.para(db_path).transacao(imediata=True) as conexao:
+        conexao.execute("""
+            INSERT INTO usuarios (cpf, nome, email, senha_hash, perfil)
+            VALUES ('00000000000', 'Organizador', 'org@pacehub.com', '-', '0')
+        """)
+        conexao.execute("""
+            INSERT INTO Eventos (id, nome, data, distancia, organizador_cpf, data_iso)
+            VALUES (?, 'Benchmark', '01/01/2025', 10, '00000000000', '2025-01-01')
+        """, (EVENTO_ID,))
+    return db_path
+
+
+def gerar_resultados(quantidade: int) -> list:
+    """Gera resultados sintéticos já classificados."""
+    aleatorio = random.Random(quantidade)
+    resultados = []
+    for i in range(quantidade):
+        segundos = aleatorio.randint(1_800, 7_200)
+        resultado = Resultado(
+            cpf_atleta=f'{i:011d}',
+            nome_atleta=f'Atleta {i}',
+            genero_atleta=aleatorio.choice(('Masculino', 'Feminino')),
+            tempo_final=f'{segundos // 3600:02d}:{segundos // 60 % 60:02d}:{segundos % 60:02d}',
+            categoria=aleatorio.choice(('Júnior', 'Adulto', 'Master')),
+            pcd=aleatorio.random() < 0.05
+        )
+        resultado.evento_id = EVENTO_ID
+        resultado.classificacao_categoria = i + 1
+        resultados.append(resultado)
+    return resultados
+
+
+def inserir_linha_a_linha(db_path: str, resultados: list):
+    """Caminho anterior: um execute por resultado para obter cada lastrowid."""
+    with GerenciadorConexao.para(db_path).transacao(imediata=True) as conexao:
+        cursor = conexao.cursor()
+        for resultado in resultados:
+            cursor.execute("""
+                INSERT INTO Resultados
+                (evento_id, cpf_atleta, nome_atleta, genero_atleta,
+                 tempo_final, tempo_ms, categoria, classificacao_geral, classificacao_categoria, pcd)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                resultado.evento_id,
+                resultado.cpf_atleta,
+                resultado.nome_atleta,
+                resultado.genero_atleta,
+                resultado.tempo_final,
+                resultado.tempo_ms,
+                resultado.categoria,
+                resultado.classificacao_geral,
+                resultado.classificacao_categoria,
+                1 if resultado.pcd else 0
+            ))
+            resultado.id = cursor.lastrowid
+
+
+def inserir_em_lote(db_path: str, resultados: list):
+    """Caminho atual do DAO."""
+    if ResultadoDAO(db_path).salvar_lote_resultados(resultados) != len(resultados):
+        raise RuntimeError("Falha ao salvar o lote de resultados")
+
+
+class ResultadoComDict:
+    """Referência: os mesmos campos de Resultado guardados no __dict__ de cada instância."""
+
+    def __init__(self, dados: dict):
+        self.__dict__.update(dados)
+
+
+def carregar_com_dict(db_path: str) -> list:
+    conexao = GerenciadorConexao.para(db_path).conexao()
+    cursor = conexao.execute("""
+        SELECT * FROM Resultados WHERE evento_id = ? ORDER BY tempo_ms ASC, id ASC
+    """, (EVENTO_ID,))
+    return [ResultadoComDict(dict(row)) for row in cursor]
+
+
+def carregar_com_slots(db_path: str) -> list:
+    return ResultadoDAO(db_path).buscar_resultados_por_evento(EVENTO_ID)
+
+
+def carregar_em_lote(db_path: str):
+    return ResultadoDAO(db_path).buscar_lote_resultados_por_evento(EVENTO_ID)
+
+
+def bytes_retidos(funcao, db_path: str) -> int:
+    """Retorna quantos bytes continuam alocados após a carga (o que o resultado retém)."""
+    tracemalloc.start()
+    try:
+        inicio = tracemalloc.get_traced_memory()[0]
+        carregados = funcao(db_path)
+        retidos = tracemalloc.get_traced_memory()[0] - inicio
+    finally:
+        tracemalloc.stop()
+    del carregados
+    return retidos
+
+
+def medir_memoria(quantidade: int) -> tuple:
+    """Grava `quantidade` resultados e mede os bytes por resultado de cada forma de carga."""
+    with tempfile.TemporaryDirectory() as diretorio:
+        db_path = criar_banco(diretorio)
+        inserir_em_lote(db_path, gerar_resultados(quantidade))
+
+        medidas = tuple(
+            bytes_retidos(funcao, db_path) / quantidade
+            for funcao in (carregar_com_dict, carregar_com_slots, carregar_em_lote)
+        )
+
+        GerenciadorConexao.para(db_path).fechar()
+        return medidas
+
+
+def medir(funcao, quantidade: int) -> float:
+    """Executa a gravação em um banco novo e retorna o tempo em segundos."""
+    with tempfile.TemporaryDirectory() as diretorio:
+        db_path = criar_banco(diretorio)
+        resultados = gerar_resultados(quantidade)
+
+        inicio = time.perf_counter()
+        funcao(db_path, resultados)
+        duracao = time.perf_counter() - inicio
+
+        # Confere se os IDs preenchidos correspondem às linhas gravadas
+        conexao = GerenciadorConexao.para(db_path).conexao()
+        ids_banco = dict(conexao.execute("SELECT cpf_atleta, id FROM Resultados").fetchall())
+        if any(ids_banco[r.cpf_atleta] != r.id for r in resultados):
+            raise RuntimeError("IDs preenchidos não correspondem aos gravados")
+
+        GerenciadorConexao.para(db_path).fechar()
+        return duracao
+
+
+def main():
+    quantidades = [int(arg) for arg in sys.argv[1:]] or QUANTIDADES_PADRAO
+
+    print(f"{'Resultados':>12} | {'Linha a linha':>14} | {'executemany':>12} | {'Ganho':>6}")
+    for quantidade in quantidades:
+        linha_a_linha = medir(inserir_linha_a_linha, quantidade)
+        em_lote = medir(inserir_em_lote, quantidade)
+        print(f"{quantidade:>12,} | {linha_a_linha * 1000:>11.1f} ms | "
+              f"{em_lote * 1000:>9.1f} ms | {linha_a_linha / em_lote:>5.1f}x")
+
+    print()
+    print("Memória retida por resultado carregado (bytes)")
+    print(f"{'Resultados':>12} | {'__dict__':>9} | {'__slots__':>9} | {'Lote':>9}")
+    for quantidade in quantidades:
+        com_dict, com_slots, em_lote = medir_memoria(quantidade)
+        print(f"{quantidade:>12,} | {com_dict:>9.0f} | {com_slots:>9.0f} | {em_lote:>9.0f}")
+
+
+if __name__ == '__main__':
+    main()
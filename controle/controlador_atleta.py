@@ -3,6 +3,7 @@ import FreeSimpleGUI as sg
 import re
 from datetime import datetime
 from entidade.atleta import Atleta
+from entidade.inscricao import gerar_token_kit
 from limite.tela_cadastro import TelaCadastro
 from limite.tela_atleta import TelaAtleta
 from persistencia.evento_dao import EventoDAO
@@ -96,7 +97,8 @@ class ControladorAtleta:
                 inscricao['evento_nome'],
                 inscricao['evento_data'],
                 data_insc_formatada,
-                inscricao['kit_nome']
+                inscricao['kit_nome'],
+                gerar_token_kit(inscricao['evento_id'], inscricao['id'])
             ])
         return dados_formatados
 
@@ -0,0 +1,281 @@
+# controle/controlador_entrega_kits.py
+import csv
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from entidade.inscricao import ler_token_kit
+from persistencia.inscricao_dao import (
+    InscricaoDAO, KIT_ATUALIZADO, KIT_INALTERADO, INSCRICAO_NAO_ENCONTRADA
+)
+
+# Situações de uma leitura no balcão
+ENTREGUE = 'entregue'
+JA_ENTREGUE = 'ja_entregue'
+TOKEN_INVALIDO = 'token_invalido'
+OUTRO_EVENTO = 'outro_evento'
+NAO_ENCONTRADO = 'nao_encontrado'
+
+
+class ControladorEntregaKits:
+    """
+    Entrega de kits por leitor de código de barras/QR (modo leitor do balcão).
+
+    As inscrições do evento ficam em um índice em memória, de modo que cada
+    leitura é conferida sem acessar o banco. As entregas confirmadas entram em
+    uma fila e são gravadas em lote, a cada TAMANHO_LOTE_GRAVACAO leituras ou
+    INTERVALO_GRAVACAO_S segundos, em uma única transação.
+    """
+
+    # Entregas acumuladas que disparam a gravação
+    TAMANHO_LOTE_GRAVACAO = 20
+
+    # Tempo máximo (s) que uma entrega fica apenas em memória
+    INTERVALO_GRAVACAO_S = 5.0
+
+    def __init__(self, inscricao_dao: InscricaoDAO, evento_id: int):
+        """
+        Inicializa o controlador e carrega as inscrições do evento.
+
+        Args:
+            inscricao_dao: DAO para leitura das inscrições e gravação das entregas
+            evento_id: ID do evento atendido pelo balcão
+        """
+        self.__inscricao_dao = inscricao_dao
+        self.__evento_id = evento_id
+        self.__inscricoes: Dict[int, Dict[str, Any]] = {}
+        self.__ids_por_cpf: Dict[str, int] = {}
+        self.__pendentes: List[int] = []
+        self.__total_entregues = 0
+        self.__inicio_fila = 0.0
+        self.__entregues_na_sessao = 0
+        self.carregar_inscricoes()
+
+    @property
+    def evento_id(self) -> int:
+        return self.__evento_id
+
+    @property
+    def total_inscritos(self) -> int:
+        return len(self.__inscricoes)
+
+    @property
+    def total_entregues(self) -> int:
+        return self.__total_entregues
+
+    @property
+    def entregues_na_sessao(self) -> int:
+        return self.__entregues_na_sessao
+
+    @property
+    def total_pendentes(self) -> int:
+        return len(self.__pendentes)
+
+    def carregar_inscricoes(self):
+        """Recarrega o índice de inscrições do evento, mantendo as entregas ainda não gravadas."""
+        self.__inscricoes = {
+            inscricao['id']: inscricao
+            for inscricao in self.__inscricao_dao.get_all_by_evento(self.__evento_id)
+        }
+        self.__ids_por_cpf = {
+            inscricao['atleta_cpf']: inscricao_id
+            for inscricao_id, inscricao in self.__inscricoes.items()
+        }
+        for inscricao_id in self.__pendentes:
+            if inscricao_id in self.__inscricoes:
+                self.__inscricoes[inscricao_id]['kit_entregue'] = 1
+        self.__total_entregues = sum(
+            1 for inscricao in self.__inscricoes.values() if inscricao['kit_entregue']
+        )
+
+    def __identificar(self, leitura: str) -> Tuple[Optional[str], Optional[int], Optional[str]]:
+        """
+        Interpreta o texto lido: um código de retirada ou, como alternativa
+        digitada, o CPF do atleta.
+
+        Returns:
+            Tupla (situacao_de_erro, inscricao_id, cpf)
+        """
+        token = ler_token_kit(leitura)
+        if token:
+            evento_id, inscricao_id = token
+            if evento_id != self.__evento_id:
+                return OUTRO_EVENTO, None, None
+            return None, inscricao_id, None
+
+        if re.fullmatch(r'[\d.\-\s]+', leitura):
+            cpf = re.sub(r'[^0-9]', '', leitura)
+            if len(cpf) == 11:
+                return None, None, cpf
+
+        return TOKEN_INVALIDO, None, None
+
+    def __localizar(self, inscricao_id: Optional[int], cpf: Optional[str]) -> Optional[Dict[str, Any]]:
+        if inscricao_id is None:
+            inscricao_id = self.__ids_por_cpf.get(cpf)
+        return self.__inscricoes.get(inscricao_id)
+
+    def registrar_leitura(self, leitura: str) -> Dict[str, Any]:
+        """
+        Confere uma leitura e, se o kit ainda não foi entregue, registra a entrega.
+
+        Uma inscrição que não está no índice (feita depois da abertura do modo
+        leitor) provoca uma única recarga antes de ser dada como não encontrada.
+
+        Args:
+            leitura: Texto enviado pelo leitor (código de retirada ou CPF)
+
+        Returns:
+            Dicionário {'situacao', 'inscricao'} com a inscrição encontrada (ou None)
+        """
+        situacao, inscricao_id, cpf = self.__identificar(leitura)
+        if situacao:
+            return {'situacao': situacao, 'inscricao': None}
+
+        inscricao = self.__localizar(inscricao_id, cpf)
+        if inscricao is None:
+            self.carregar_inscricoes()
+            inscricao = self.__localizar(inscricao_id, cpf)
+            if inscricao is None:
+                return {'situacao': NAO_ENCONTRADO, 'inscricao': None}
+
+        if inscricao['kit_entregue']:
+            return {'situacao': JA_ENTREGUE, 'inscricao': inscricao}
+
+        inscricao['kit_entregue'] = 1
+        if not self.__pendentes:
+            self.__inicio_fila = time.monotonic()
+        self.__pendentes.append(inscricao['id'])
+        self.__entregues_na_sessao += 1
+        self.__total_entregues += 1
+        return {'situacao': ENTREGUE, 'inscricao': inscricao}
+
+    def deve_gravar(self) -> bool:
+        """Indica se a fila de entregas atingiu o tamanho ou a idade de gravação."""
+        if not self.__pendentes:
+            return False
+        return (len(self.__pendentes) >= self.TAMANHO_LOTE_GRAVACAO
+                or time.monotonic() - self.__inicio_fila >= self.INTERVALO_GRAVACAO_S)
+
+    def gravar_pendentes(self) -> List[Dict[str, Any]]:
+        """
+        Grava as entregas da fila em uma única transação.
+
+        Se a gravação falhar (por exemplo, banco bloqueado), a fila é mantida
+        para a próxima tentativa.
+
+        Returns:
+            Inscrições cujo kit já havia sido entregue por outro balcão
+            (não contam como entregues nesta sessão)
+
+        Raises:
+            sqlite3.Error: Se a gravação falhar
+        """
+        if not self.__pendentes:
+            return []
+
+        lote = list(self.__pendentes)
+        atualizadas = set(self.__inscricao_dao.marcar_kits_entregues(self.__evento_id, lote))
+        self.__pendentes.clear()
+
+        conflitos = [self.__inscricoes[inscricao_id] for inscricao_id in lote
+                     if inscricao_id not in atualizadas and inscricao_id in self.__inscricoes]
+        self.__entregues_na_sessao -= len(conflitos)
+        return conflitos
+
+    @staticmethod
+    def ler_cpfs_csv(caminho_arquivo: str) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """
+        Lê a lista de CPFs conferida no balcão (CPF na primeira coluna).
+
+        Um cabeçalho na primeira linha e linhas em branco são ignorados.
+
+        Args:
+            caminho_arquivo: Caminho do arquivo CSV
+
+        Returns:
+            Tupla (cpfs somente com dígitos, erros no formato {'linha', 'tipo', 'mensagem'})
+
+        Raises:
+            Exception: Se o arquivo não puder ser lido
+        """
+        cpfs = []
+        erros = []
+        try:
+            with open(caminho_arquivo, 'r', encoding='utf-8') as arquivo:
+                for num_linha, linha in enumerate(csv.reader(arquivo), 1):
+                    texto = linha[0].strip() if linha else ''
+                    if not texto:
+                        continue
+
+                    cpf = re.sub(r'[^0-9]', '', texto)
+                    if num_linha == 1 and not cpf:
+                        continue
+
+                    if len(cpf) != 11 or re.search(r'[^\d.\-\s]', texto):
+                        erros.append({
+                            'linha': num_linha,
+                            'tipo': 'cpf_invalido',
+                            'mensagem': f'CPF inválido: {texto}'
+                        })
+                        continue
+                    cpfs.append(cpf)
+
+        except Exception as e:
+            raise Exception(f"Erro ao ler arquivo CSV: {e}")
+
+        return cpfs, erros
+
+    def conciliar_cpfs_csv(self, caminho_arquivo: str, kit_entregue: bool = True) -> Dict[str, Any]:
+        """
+        Aplica a lista de CPFs de um CSV ao status dos kits, em uma única transação.
+
+        Usado para conciliar ao fim do turno as listas em papel do balcão.
+        Entregas ainda na fila do modo leitor são gravadas antes.
+
+        Args:
+            caminho_arquivo: Caminho do arquivo CSV com os CPFs
+            kit_entregue: Marcar os kits como entregues (True) ou não entregues (False)
+
+        Returns:
+            Resumo com os totais por situação, a situação de cada CPF
+            ('resultados'), os CPFs sem inscrição no evento
+            ('cpfs_nao_encontrados') e as linhas rejeitadas ('erros')
+
+        Raises:
+            sqlite3.Error: Se a gravação falhar
+        """
+        cpfs, erros = self.ler_cpfs_csv(caminho_arquivo)
+        self.gravar_pendentes()
+
+        resultados = self.__inscricao_dao.atualizar_kits_por_cpfs(self.__evento_id, cpfs, kit_entregue)
+
+        novo_status = int(bool(kit_entregue))
+        for resultado in resultados:
+            inscricao = self.__inscricoes.get(resultado['inscricao_id'])
+            if inscricao is not None and resultado['situacao'] == KIT_ATUALIZADO:
+                self.__total_entregues += 1 if novo_status else -1
+                inscricao['kit_entregue'] = novo_status
+
+        def contar(situacao: str) -> int:
+            return sum(1 for resultado in resultados if resultado['situacao'] == situacao)
+
+        cpfs_nao_encontrados = [resultado['chave'] for resultado in resultados
+                                if resultado['situacao'] == INSCRICAO_NAO_ENCONTRADA]
+
+        return {
+            'evento_id': self.__evento_id,
+            'kit_entregue': bool(kit_entregue),
+            'total_cpfs': len(resultados),
+            'atualizados': contar(KIT_ATUALIZADO),
+            'inalterados': contar(KIT_INALTERADO),
+            'nao_encontrados': len(cpfs_nao_encontrados),
+            'linhas_invalidas': len(erros),
+            'cpfs_nao_encontrados': cpfs_nao_encontrados,
+            'resultados': [
+                {'cpf': resultado['chave'], 'inscricao_id': resultado['inscricao_id'],
+                 'situacao': resultado['situacao']}
+                for resultado in resultados
+            ],
+            'erros': erros
+        }
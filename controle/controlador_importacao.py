@@ -2,13 +2,55 @@
 import csv
 import os
 import re
-from typing import List, Tuple, Dict, Any, Optional
-from entidade.resultado import Resultado, criar_resultado_para_atleta, ordenar_resultados_por_tempo, separar_resultados_por_genero
+import threading
+from typing import List, Tuple, Dict, Any, Optional, Set, Callable, Iterator
+from entidade.resultado import Resultado, criar_resultado_para_atleta, tempo_para_ms
+from entidade.ranking import calcular_classificacoes
 from entidade.atleta import Atleta
 from persistencia.resultado_dao import ResultadoDAO
 from persistencia.inscricao_dao import InscricaoDAO
 from persistencia.usuario_dao import UsuarioDAO
 from persistencia.evento_dao import EventoDAO
+from persistencia.estatistica_dao import EstatisticaDAO
+from persistencia.conexao import GerenciadorConexao
+
+
+class ImportacaoCancelada(Exception):
+    """Lançada quando a importação é cancelada antes da gravação dos resultados."""
+
+
+class ContadorErrosImportacao:
+    """
+    Destino dos erros de linha de processar_csv (parâmetro ao_erro).
+
+    Conta os erros por tipo e guarda apenas os primeiros EXEMPLOS_POR_TIPO de
+    cada tipo, de modo que a memória não cresce com a quantidade de linhas
+    rejeitadas (ex.: leituras repetidas do sistema de cronometragem).
+    """
+
+    # Erros guardados por tipo para exibição
+    EXEMPLOS_POR_TIPO = 10
+
+    def __init__(self, ao_erro: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        Args:
+            ao_erro: Função chamada também com cada erro (ex.: para registrá-lo em log)
+        """
+        self.erros_por_tipo: Dict[str, int] = {}
+        self.exemplos: List[Dict[str, Any]] = []
+        self.__ao_erro = ao_erro
+
+    def __call__(self, erro: Dict[str, Any]):
+        quantidade = self.erros_por_tipo.get(erro['tipo'], 0) + 1
+        self.erros_por_tipo[erro['tipo']] = quantidade
+        if quantidade <= self.EXEMPLOS_POR_TIPO:
+            self.exemplos.append(erro)
+        if self.__ao_erro:
+            self.__ao_erro(erro)
+
+    @property
+    def total(self) -> int:
+        return sum(self.erros_por_tipo.values())
 
 
 class ControladorImportacao:
@@ -17,8 +59,15 @@ class ControladorImportacao:
     Implementa as regras de negócio RN04, RN06 e RN07.
     """
     
+    # Linhas do CSV validadas e consultadas no banco por vez
+    TAMANHO_LOTE_LEITURA = 1000
+    
+    # A partir de quantos resultados gravados o WAL é descarregado ao final da importação
+    LIMIAR_CHECKPOINT = 10_000
+    
     def __init__(self, resultado_dao: ResultadoDAO, inscricao_dao: InscricaoDAO, 
-                 usuario_dao: UsuarioDAO, evento_dao: EventoDAO):
+                 usuario_dao: UsuarioDAO, evento_dao: EventoDAO,
+                 estatistica_dao: Optional[EstatisticaDAO] = None):
         """
         Inicializa o controlador com instâncias dos DAOs.
         
@@ -27,22 +76,41 @@ class ControladorImportacao:
             inscricao_dao: DAO para validação de inscrições
             usuario_dao: DAO para buscar atletas
             evento_dao: DAO para buscar eventos
+            estatistica_dao: DAO das estatísticas do evento, recalculadas ao
+                final da importação (opcional)
         """
         self.__resultado_dao = resultado_dao
         self.__inscricao_dao = inscricao_dao
         self.__usuario_dao = usuario_dao
         self.__evento_dao = evento_dao
+        self.__estatistica_dao = estatistica_dao
     
-    def processar_csv(self, caminho_arquivo: str, evento_id: int) -> Tuple[int, List[Dict[str, Any]]]:
+    def processar_csv(self, caminho_arquivo: str, evento_id: int,
+                      ao_erro: Optional[Callable[[Dict[str, Any]], None]] = None,
+                      ao_progresso: Optional[Callable[[Dict[str, Any]], None]] = None,
+                      cancelamento: Optional[threading.Event] = None
+                      ) -> Tuple[int, List[Dict[str, Any]]]:
         """
         Processa um arquivo CSV de resultados e salva no banco.
         
+        O arquivo é lido uma única vez, em lotes de TAMANHO_LOTE_LEITURA linhas.
+        
         Args:
             caminho_arquivo: Caminho para o arquivo CSV
             evento_id: ID do evento
+            ao_erro: Função chamada com cada erro de linha assim que é encontrado
+                (ex.: um ContadorErrosImportacao); quando informada, os erros não
+                são acumulados na lista retornada
+            ao_progresso: Função chamada a cada lote e mudança de fase com um
+                dicionário {'fase', 'linhas_lidas', 'linhas_validas', 'linhas_com_erro', 'salvos'}
+            cancelamento: Evento que, quando sinalizado, interrompe a importação
+                antes da gravação (nada é alterado no banco)
             
         Returns:
             Tupla (total_importados, lista_erros)
+            
+        Raises:
+            ImportacaoCancelada: Se o cancelamento foi sinalizado
         """
         print(f"\n[CONTROLADOR] Processando CSV: {caminho_arquivo}")
         print(f"[CONTROLADOR] Evento ID: {evento_id}")
@@ -70,71 +138,238 @@ class ControladorImportacao:
                 raise e
             raise ValueError(f"Formato de data do evento inválido: {evento.data}")
         
-        # Ler e processar CSV
+        # Ler o CSV em uma única passada, lote a lote: a memória fica limitada ao
+        # lote atual e a um resultado por atleta (CPFs repetidos são rejeitados)
         resultados = []
         erros = []
+        total_erros = 0
+        linhas_lidas = 0
+        cpfs_importados = set()
+        
+        def informar_progresso(fase: str, salvos: int = 0):
+            if ao_progresso:
+                ao_progresso({
+                    'fase': fase,
+                    'linhas_lidas': linhas_lidas,
+                    'linhas_validas': len(resultados),
+                    'linhas_com_erro': total_erros,
+                    'salvos': salvos
+                })
+        
+        def verificar_cancelamento():
+            if cancelamento is not None and cancelamento.is_set():
+                print("[CONTROLADOR] Importação cancelada")
+                raise ImportacaoCancelada("Importação cancelada pelo usuário")
+        
+        informar_progresso('leitura')
+        
+        for lote in self._ler_lotes_csv(caminho_arquivo):
+            verificar_cancelamento()
+            
+            # Buscar atletas e inscrições do lote de uma só vez
+            cpfs = {
+                re.sub(r'[^0-9]', '', linha[0])
+                for _, linha in lote
+                if len(linha) >= 2 and self._validar_cpf(linha[0].strip())
+            }
+            usuarios = self.__usuario_dao.get_many(cpfs)
+            cpfs_inscritos = self.__inscricao_dao.get_cpfs_inscritos(evento_id, usuarios.keys())
+            
+            for num_linha, linha in lote:
+                resultado, erro = self._processar_linha(linha, evento.data, usuarios, cpfs_inscritos)
+                if resultado:
+                    if resultado.cpf_atleta in cpfs_importados:
+                        # Cada atleta tem um único resultado; vale a primeira ocorrência
+                        resultado, erro = None, {
+                            'tipo': 'cpf_duplicado',
+                            'mensagem': f'CPF {resultado.cpf_atleta} aparece mais de uma vez no arquivo',
+                            'dados': {'cpf': linha[0].strip(), 'tempo': linha[1].strip()}
+                        }
+                    else:
+                        cpfs_importados.add(resultado.cpf_atleta)
+                        resultados.append(resultado)
+                if erro:
+                    erro['linha'] = num_linha
+                    total_erros += 1
+                    if ao_erro:
+                        ao_erro(erro)
+                    else:
+                        erros.append(erro)
+            
+            linhas_lidas = lote[-1][0]
+            informar_progresso('leitura')
+        
+        print(f"[CONTROLADOR] Linhas processadas: {len(resultados)} válidas, {total_erros} com erro")
+        
+        if not resultados:
+            print("[CONTROLADOR] ERRO: Nenhum resultado válido encontrado!")
+            raise ValueError("Nenhum resultado válido encontrado no arquivo")
+        
+        for resultado in resultados:
+            resultado.evento_id = evento_id
+        
+        # Comparar com os resultados já salvos e gravar apenas as diferenças
+        verificar_cancelamento()
+        informar_progresso('gravacao')
+        print(f"[CONTROLADOR] Sincronizando resultados do evento {evento_id}...")
+        if not self._sincronizar_resultados(evento_id, resultados):
+            raise Exception("Erro ao salvar resultados no banco")
+        
+        total_salvos = len(resultados)
+        if total_salvos >= self.LIMIAR_CHECKPOINT:
+            # Evita que o arquivo -wal continue grande após importações volumosas
+            self.__resultado_dao.checkpoint()
+        if self.__estatistica_dao:
+            # Deixa as estatísticas prontas para a tela do organizador
+            self.__estatistica_dao.atualizar(evento_id)
+        informar_progresso('concluido', total_salvos)
+        print(f"[CONTROLADOR] Total de resultados do evento: {total_salvos}")
+        
+        return total_salvos, erros
+    
+    def processar_csv_em_thread(self, caminho_arquivo: str, evento_id: int,
+                                ao_erro: Optional[Callable[[Dict[str, Any]], None]] = None,
+                                ao_progresso: Optional[Callable[[Dict[str, Any]], None]] = None,
+                                cancelamento: Optional[threading.Event] = None
+                                ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Variante de processar_csv para threads de trabalho.
+        
+        Fecha ao final as conexões abertas pela thread (cada thread tem as suas).
         
+        Args:
+            caminho_arquivo: Caminho para o arquivo CSV
+            evento_id: ID do evento
+            ao_erro: Ver processar_csv
+            ao_progresso: Ver processar_csv
+            cancelamento: Ver processar_csv
+            
+        Returns:
+            Tupla (total_importados, lista_erros)
+        """
+        try:
+            return self.processar_csv(caminho_arquivo, evento_id, ao_erro=ao_erro,
+                                      ao_progresso=ao_progresso, cancelamento=cancelamento)
+        finally:
+            GerenciadorConexao.fechar_conexoes_da_thread()
+    
+    def _sincronizar_resultados(self, evento_id: int, resultados: List[Resultado]) -> bool:
+        """
+        Sincroniza os resultados salvos do evento com os do arquivo, por CPF.
+        
+        Insere os CPFs novos, atualiza os que mudaram e remove os que saíram do
+        arquivo, mantendo o id das linhas existentes. Só os grupos (PCD, gênero)
+        afetados são reclassificados; os demais mantêm as posições salvas.
+        
+        Args:
+            evento_id: ID do evento
+            resultados: Resultados válidos do arquivo (um por CPF, na ordem do arquivo)
+            
+        Returns:
+            True se as alterações foram gravadas, False caso contrário
+        """
+        existentes = {}
+        ids_remover = []
+        grupos_afetados = set()
+        for existente in self.__resultado_dao.buscar_resultados_por_evento(evento_id):
+            if existente.cpf_atleta in existentes:
+                # Duplicata deixada por importações antigas: o grupo dela fica
+                # com um buraco nas posições e precisa ser reclassificado
+                ids_remover.append(existente.id)
+                grupos_afetados.add(self._grupo_classificacao(existente))
+            else:
+                existentes[existente.cpf_atleta] = existente
+        
+        inserir = []
+        alterados = set()
+        
+        for resultado in resultados:
+            existente = existentes.pop(resultado.cpf_atleta, None)
+            if existente is None:
+                inserir.append(resultado)
+                grupos_afetados.add(self._grupo_classificacao(resultado))
+                continue
+            
+            resultado.id = existente.id
+            resultado.classificacao_geral = existente.classificacao_geral
+            resultado.classificacao_categoria = existente.classificacao_categoria
+            if self._dados_alterados(existente, resultado):
+                alterados.add(resultado.id)
+                grupos_afetados.add(self._grupo_classificacao(existente))
+                grupos_afetados.add(self._grupo_classificacao(resultado))
+        
+        for removido in existentes.values():
+            ids_remover.append(removido.id)
+            grupos_afetados.add(self._grupo_classificacao(removido))
+        
+        # Reclassificar apenas os grupos afetados (cada grupo é recalculado inteiro)
+        reclassificar = [r for r in resultados if self._grupo_classificacao(r) in grupos_afetados]
+        classificacoes_salvas = {
+            r.id: (r.classificacao_geral, r.classificacao_categoria)
+            for r in reclassificar if r.id is not None
+        }
+        self.calcular_rankings(reclassificar)
+        
+        atualizar = [
+            r for r in reclassificar
+            if r.id is not None and (
+                r.id in alterados
+                or classificacoes_salvas[r.id] != (r.classificacao_geral, r.classificacao_categoria)
+            )
+        ]
+        
+        print(f"[CONTROLADOR] {len(inserir)} novos, {len(atualizar)} atualizados, "
+              f"{len(ids_remover)} removidos, {len(resultados) - len(inserir) - len(atualizar)} inalterados")
+        
+        return self.__resultado_dao.sincronizar_resultados(inserir, atualizar, ids_remover)
+    
+    def _grupo_classificacao(self, resultado: Resultado) -> Tuple[bool, str]:
+        """Grupo em que o resultado é classificado: (PCD, gênero)."""
+        return bool(resultado.pcd), resultado.genero_atleta
+    
+    def _dados_alterados(self, existente: Resultado, novo: Resultado) -> bool:
+        """Verifica se o resultado do arquivo difere do salvo no banco."""
+        return (existente.tempo_ms != novo.tempo_ms
+                or existente.tempo_final != novo.tempo_final
+                or existente.nome_atleta != novo.nome_atleta
+                or existente.genero_atleta != novo.genero_atleta
+                or existente.categoria != novo.categoria
+                or bool(existente.pcd) != bool(novo.pcd))
+    
+    def _ler_lotes_csv(self, caminho_arquivo: str) -> Iterator[List[Tuple[int, List[str]]]]:
+        """
+        Lê o CSV em uma única passada, entregando lotes de linhas de dados.
+        
+        Args:
+            caminho_arquivo: Caminho para o arquivo CSV
+            
+        Yields:
+            Listas de até TAMANHO_LOTE_LEITURA tuplas (num_linha, linha)
+        """
         try:
             with open(caminho_arquivo, 'r', encoding='utf-8') as arquivo:
                 leitor = csv.reader(arquivo)
+                lote = []
                 
                 # Pular cabeçalho se existir
                 primeira_linha = next(leitor, None)
-                num_linha = 1
                 
-                if primeira_linha and not self._eh_linha_dados(primeira_linha):
-                    # É cabeçalho, pular
-                    num_linha = 2
-                else:
+                if primeira_linha and self._eh_linha_dados(primeira_linha):
                     # Primeira linha é dados, processar
-                    if primeira_linha:
-                        resultado, erro = self._processar_linha(primeira_linha, evento.data, evento_id)
-                        if resultado:
-                            resultados.append(resultado)
-                        if erro:
-                            erro['linha'] = num_linha
-                            erros.append(erro)
-                        num_linha = 2
+                    lote.append((1, primeira_linha))
                 
-                # Processar demais linhas
-                for linha in leitor:
-                    resultado, erro = self._processar_linha(linha, evento.data, evento_id)
-                    if resultado:
-                        resultados.append(resultado)
-                    if erro:
-                        erro['linha'] = num_linha
-                        erros.append(erro)
-                    num_linha += 1
+                # Demais linhas
+                for num_linha, linha in enumerate(leitor, 2):
+                    lote.append((num_linha, linha))
+                    if len(lote) >= self.TAMANHO_LOTE_LEITURA:
+                        yield lote
+                        lote = []
+                
+                if lote:
+                    yield lote
         
         except Exception as e:
             raise Exception(f"Erro ao ler arquivo CSV: {e}")
-        
-        print(f"[CONTROLADOR] Linhas processadas: {len(resultados)} válidas, {len(erros)} com erro")
-        
-        if not resultados:
-            print("[CONTROLADOR] ERRO: Nenhum resultado válido encontrado!")
-            raise ValueError("Nenhum resultado válido encontrado no arquivo")
-        
-        # Calcular rankings
-        print(f"[CONTROLADOR] Calculando rankings...")
-        resultados_com_rankings = self.calcular_rankings(resultados)
-        
-        # Limpar resultados anteriores do evento
-        print(f"[CONTROLADOR] Limpando resultados anteriores do evento {evento_id}...")
-        removidos = self.__resultado_dao.limpar_resultados_evento(evento_id)
-        print(f"[CONTROLADOR] {removidos} resultados anteriores removidos")
-        
-        # Definir evento_id nos resultados
-        print(f"[CONTROLADOR] Definindo evento_id={evento_id} em {len(resultados_com_rankings)} resultados")
-        for resultado in resultados_com_rankings:
-            resultado.evento_id = evento_id
-        
-        # Salvar no banco
-        print(f"[CONTROLADOR] Salvando resultados no banco...")
-        total_salvos = self.__resultado_dao.salvar_lote_resultados(resultados_com_rankings)
-        print(f"[CONTROLADOR] Total salvo: {total_salvos}")
-        
-        return total_salvos, erros
     
     def _eh_linha_dados(self, linha: List[str]) -> bool:
         """
@@ -153,14 +388,16 @@ class ControladorImportacao:
         tempo = linha[1].strip()
         return self._validar_formato_tempo(tempo)
     
-    def _processar_linha(self, linha: List[str], data_evento: str, evento_id: int) -> Tuple[Optional[Resultado], Optional[Dict[str, Any]]]:
+    def _processar_linha(self, linha: List[str], data_evento: str, usuarios: Dict[str, Any],
+                         cpfs_inscritos: Set[str]) -> Tuple[Optional[Resultado], Optional[Dict[str, Any]]]:
         """
         Processa uma linha do CSV.
         
         Args:
             linha: Lista de strings da linha
             data_evento: Data do evento
-            evento_id: ID do evento para validação de inscrição
+            usuarios: Usuários já carregados do banco, indexados por CPF
+            cpfs_inscritos: CPFs com inscrição no evento
             
         Returns:
             Tupla (resultado, erro)
@@ -200,8 +437,8 @@ class ControladorImportacao:
         # Limpar CPF para busca
         cpf_limpo = re.sub(r'[^0-9]', '', cpf)
         
-        # Buscar atleta no banco
-        usuario = self.__usuario_dao.get(cpf_limpo)
+        # Buscar atleta entre os carregados
+        usuario = usuarios.get(cpf_limpo)
         if not usuario:
             erro = {
                 'tipo': 'atleta_nao_encontrado',
@@ -222,8 +459,7 @@ class ControladorImportacao:
         atleta = usuario
         
         # Validar se atleta está inscrito no evento
-        inscricao, kit = self.__inscricao_dao.get_by_atleta_e_evento(cpf_limpo, evento_id)
-        if not inscricao:
+        if cpf_limpo not in cpfs_inscritos:
             erro = {
                 'tipo': 'atleta_nao_inscrito',
                 'mensagem': f'Atleta com CPF {cpf} não está inscrito no evento',
@@ -261,7 +497,7 @@ class ControladorImportacao:
     
     def _validar_formato_tempo(self, tempo: str) -> bool:
         """
-        Valida formato do tempo HH:MM:SS.
+        Valida formato do tempo HH:MM:SS (aceita fração de segundo, ex.: HH:MM:SS.fff).
         
         Args:
             tempo: Tempo para validar
@@ -270,22 +506,9 @@ class ControladorImportacao:
             True se formato é válido, False caso contrário
         """
         try:
-            partes = tempo.split(':')
-            if len(partes) != 3:
-                return False
-            
-            horas = int(partes[0])
-            minutos = int(partes[1])
-            segundos = int(partes[2])
-            
-            # Validações básicas
-            if horas < 0 or minutos < 0 or segundos < 0:
-                return False
-            if minutos >= 60 or segundos >= 60:
-                return False
-            
+            tempo_para_ms(tempo)
             return True
-        except (ValueError, IndexError):
+        except ValueError:
             return False
     
     def calcular_rankings(self, resultados: List[Resultado]) -> List[Resultado]:
@@ -303,95 +526,40 @@ class ControladorImportacao:
         Returns:
             Lista de resultados com classificações calculadas
         """
-        # Limpar classificações existentes
-        for resultado in resultados:
-            resultado.limpar_classificacoes()
-        
-        # Separar PCD dos demais
-        resultados_pcd = [r for r in resultados if r.pcd]
-        resultados_nao_pcd = [r for r in resultados if not r.pcd]
-        
-        # Processar PCD separadamente
-        if resultados_pcd:
-            masculino_pcd, feminino_pcd = separar_resultados_por_genero(resultados_pcd)
-            masculino_pcd_ordenado = ordenar_resultados_por_tempo(masculino_pcd)
-            feminino_pcd_ordenado = ordenar_resultados_por_tempo(feminino_pcd)
-            
-            # PCD: Top 5 de cada gênero = Geral, demais por categoria
-            for i, resultado in enumerate(masculino_pcd_ordenado[:5], 1):
-                resultado.definir_classificacao_geral(i)
-            for i, resultado in enumerate(feminino_pcd_ordenado[:5], 1):
-                resultado.definir_classificacao_geral(i)
-            
-            self._calcular_classificacao_categoria(masculino_pcd_ordenado[5:])
-            self._calcular_classificacao_categoria(feminino_pcd_ordenado[5:])
-        
-        # Processar não-PCD
-        if resultados_nao_pcd:
-            # Separar por gênero
-            masculino, feminino = separar_resultados_por_genero(resultados_nao_pcd)
-            
-            # Ordenar por tempo
-            masculino_ordenado = ordenar_resultados_por_tempo(masculino)
-            feminino_ordenado = ordenar_resultados_por_tempo(feminino)
-            
-            # RN06: Classificação Geral (Top 5 de cada gênero)
-            for i, resultado in enumerate(masculino_ordenado[:5], 1):
-                resultado.definir_classificacao_geral(i)
-            
-            for i, resultado in enumerate(feminino_ordenado[:5], 1):
-                resultado.definir_classificacao_geral(i)
-            
-            # RN07: Classificação por categoria para os demais
-            self._calcular_classificacao_categoria(masculino_ordenado[5:])
-            self._calcular_classificacao_categoria(feminino_ordenado[5:])
+        classificacao_geral, classificacao_categoria = calcular_classificacoes(
+            [resultado.tempo_ms for resultado in resultados],
+            [resultado.genero_atleta for resultado in resultados],
+            [resultado.categoria for resultado in resultados],
+            [resultado.pcd for resultado in resultados]
+        )
+        
+        for resultado, posicao_geral, posicao_categoria in zip(
+                resultados, classificacao_geral, classificacao_categoria):
+            resultado.classificacao_geral = posicao_geral
+            resultado.classificacao_categoria = posicao_categoria
         
         return resultados
     
-    def _calcular_classificacao_categoria(self, resultados: List[Resultado]):
-        """
-        Calcula classificação por categoria para uma lista de resultados.
-        
-        Args:
-            resultados: Lista de resultados (já ordenados por tempo)
-        """
-        # Separar por categoria
-        categorias = {}
-        for resultado in resultados:
-            categoria = resultado.categoria
-            if categoria not in categorias:
-                categorias[categoria] = []
-            categorias[categoria].append(resultado)
-        
-        # Calcular posição em cada categoria
-        for categoria, resultados_categoria in categorias.items():
-            # Já estão ordenados por tempo
-            for i, resultado in enumerate(resultados_categoria, 1):
-                resultado.definir_classificacao_categoria(i)
-    
-    def obter_resumo_importacao(self, total_importados: int, erros: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def obter_resumo_importacao(self, total_importados: int, erros_por_tipo: Dict[str, int]) -> Dict[str, Any]:
         """
         Cria um resumo da importação para exibição.
         
         Args:
             total_importados: Número de resultados importados
-            erros: Lista de erros encontrados
+            erros_por_tipo: Quantidade de erros por tipo (ver ContadorErrosImportacao)
             
         Returns:
             Dicionário com resumo da importação
         """
-        # Contar erros por tipo
-        erros_por_tipo = {}
-        for erro in erros:
-            tipo = erro['tipo']
-            erros_por_tipo[tipo] = erros_por_tipo.get(tipo, 0) + 1
+        total_erros = sum(erros_por_tipo.values())
+        total_linhas = total_importados + total_erros
         
         return {
             'total_importados': total_importados,
-            'total_erros': len(erros),
-            'erros_por_tipo': erros_por_tipo,
-            'sucesso': len(erros) == 0,
-            'taxa_sucesso': (total_importados / (total_importados + len(erros))) * 100 if (total_importados + len(erros)) > 0 else 0
+            'total_erros': total_erros,
+            'erros_por_tipo': dict(erros_por_tipo),
+            'sucesso': total_erros == 0,
+            'taxa_sucesso': (total_importados / total_linhas) * 100 if total_linhas > 0 else 0
         }
     
     def validar_arquivo_csv(self, caminho_arquivo: str) -> Tuple[bool, str]:
@@ -423,15 +591,9 @@ class ControladorImportacao:
                 if len(primeira_linha) < 2:
                     return False, "Arquivo deve ter pelo menos 2 colunas (CPF, Tempo)"
                 
-                # Contar linhas
-                total_linhas = 1  # Já lemos a primeira
-                for linha in leitor:
-                    total_linhas += 1
-                
-                if total_linhas < 1:
-                    return False, "Arquivo deve ter pelo menos uma linha de dados"
-                
-                return True, f"Arquivo válido com {total_linhas} linhas"
+                # O conteúdo é validado linha a linha durante a importação,
+                # sem uma leitura completa extra aqui
+                return True, "Arquivo válido"
                 
         except Exception as e:
             return False, f"Erro ao ler arquivo: {e}"
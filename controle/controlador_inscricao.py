@@ -1,5 +1,7 @@
 import FreeSimpleGUI as sg
 import re
+import sqlite3
+from controle.controlador_entrega_kits import ControladorEntregaKits
 from entidade.kit_de_corrida import KitDeCorrida
 from limite.tela_inscricao import TelaInscricao
 from limite.tela_ficha_medica import TelaFichaMedica
@@ -14,17 +16,21 @@ from entidade.ficha_medica import FichaMedica
 
 class ControladorInscricao:
 
+    # Leituras exibidas no histórico do modo leitor
+    TAMANHO_HISTORICO_LEITOR = 50
+
     def __init__(self, controlador_sistema, inscricao_dao: InscricaoDAO, usuario_dao: UsuarioDAO):
         self.__controlador_sistema = controlador_sistema
         self.__tela_inscricao = TelaInscricao()
         self.__tela_ficha_medica = TelaFichaMedica()
         self.__inscricao_dao = inscricao_dao
         self.__usuario_dao = usuario_dao
-        self.__evento_dao = EventoDAO()
-        self.__ficha_medica_dao = FichaMedicaDAO()
+        self.__evento_dao = EventoDAO(inscricao_dao.db_path)
+        self.__ficha_medica_dao = FichaMedicaDAO(inscricao_dao.db_path)
         self.__inscricao_encontrada: Inscricao | None = None
         self.__atleta_encontrado: Atleta | None = None
         self.__kit_encontrado: KitDeCorrida | None = None
+        self.__resultados_busca: list = []
 
     def abre_tela_gerenciar_kits(self, evento_id: int, evento_nome: str):
         self.__inscricao_encontrada = None
@@ -46,6 +52,11 @@ class ControladorInscricao:
 
                 self.buscar_atleta_inscricao(janela, input_busca, evento_id)
 
+            if evento == '-RESULTADOS_BUSCA-':
+                indices = janela['-RESULTADOS_BUSCA-'].get_indexes()
+                if indices:
+                    self.carregar_inscricao(janela, self.__resultados_busca[indices[0]]['atleta_cpf'], evento_id)
+
             if evento == '-SALVAR-':
                 novo_status_kit = valores['-KIT_ENTREGUE-']
                 self.__inscricao_encontrada.kit_entregue = novo_status_kit
@@ -55,15 +66,132 @@ class ControladorInscricao:
                 )
                 self.exibir_popup_sucesso("Status do kit atualizado!")
                 self.limpar_campos_busca(janela)
+                self.__resultados_busca = []
+                janela['-RESULTADOS_BUSCA-'].update(values=[])
+
+            if evento == '-CONCILIAR_CSV-':
+                self.conciliar_lista_csv(evento_id)
+                self.limpar_campos_busca(janela)
+                self.__resultados_busca = []
+                janela['-RESULTADOS_BUSCA-'].update(values=[])
+
+            if evento == '-MODO_LEITOR-':
+                self.abre_modo_leitor(evento_id, evento_nome)
+                self.limpar_campos_busca(janela)
+                self.__resultados_busca = []
+                janela['-RESULTADOS_BUSCA-'].update(values=[])
+
+        janela.close()
+
+    def conciliar_lista_csv(self, evento_id: int):
+        """Aplica ao status dos kits uma lista de CPFs (CSV) conferida no balcão."""
+        caminho, kit_entregue = self.__tela_inscricao.selecionar_csv_conciliacao()
+        if caminho is None:
+            return
+
+        try:
+            resumo = ControladorEntregaKits(self.__inscricao_dao, evento_id).conciliar_cpfs_csv(
+                caminho, kit_entregue
+            )
+        except Exception as e:
+            self.exibir_popup_erro(f"Erro ao conciliar a lista: {e}")
+            return
+
+        self.__tela_inscricao.exibir_resumo_conciliacao(resumo)
+
+    def abre_modo_leitor(self, evento_id: int, evento_nome: str):
+        """
+        Entrega de kits por leitor de código de barras/QR.
+
+        Cada leitura é conferida em memória e respondida na hora; as entregas
+        são gravadas em lote (ver ControladorEntregaKits). A janela acorda a
+        cada segundo mesmo sem leituras, para gravar a fila dentro do prazo, e
+        grava o que restar ao ser fechada.
+        """
+        entrega_kits = ControladorEntregaKits(self.__inscricao_dao, evento_id)
+        janela = self.__tela_inscricao.exibir_tela_leitor_kits(evento_nome)
+        historico = []
+
+        def atualizar_contadores():
+            self.__tela_inscricao.exibir_contadores_leitor(
+                janela,
+                entrega_kits.total_inscritos,
+                entrega_kits.total_entregues,
+                entrega_kits.entregues_na_sessao,
+                entrega_kits.total_pendentes
+            )
+
+        def registrar_historico(linha: str):
+            historico.insert(0, linha)
+            del historico[self.TAMANHO_HISTORICO_LEITOR:]
+            janela['-HISTORICO_LEITURAS-'].update(values=historico)
+
+        def gravar() -> bool:
+            try:
+                conflitos = entrega_kits.gravar_pendentes()
+            except sqlite3.Error:
+                registrar_historico("Falha ao gravar as entregas; nova tentativa em instantes.")
+                return False
+            for inscricao in conflitos:
+                registrar_historico(f"Kit de {inscricao['atleta_nome']} já havia sido entregue em outro balcão.")
+            return True
+
+        atualizar_contadores()
+
+        while True:
+            evento, valores = janela.read(timeout=1000)
+
+            if evento in (sg.WIN_CLOSED, '-FECHAR-'):
+                if not gravar():
+                    self.exibir_popup_erro(
+                        f"{entrega_kits.total_pendentes} entrega(s) não puderam ser gravadas. "
+                        "Tente fechar novamente."
+                    )
+                    if evento == '-FECHAR-':
+                        continue
+                break
+
+            if evento == '-LER-':
+                leitura = valores['-CODIGO-']
+                janela['-CODIGO-'].update('')
+                janela['-CODIGO-'].set_focus()
+                if not leitura.strip():
+                    continue
+
+                resultado = entrega_kits.registrar_leitura(leitura)
+                inscricao = resultado['inscricao']
+                self.__tela_inscricao.exibir_leitura(janela, resultado['situacao'], inscricao)
+                descricao = inscricao['atleta_nome'] if inscricao else leitura.strip()
+                registrar_historico(f"{resultado['situacao']}: {descricao}")
+
+            if evento == '-GRAVAR-' or entrega_kits.deve_gravar():
+                gravar()
+
+            atualizar_contadores()
 
         janela.close()
 
     def buscar_atleta_inscricao(self, janela, input_busca: str, evento_id: int):
+        """Busca inscritos por nome ou CPF; com um único resultado, ele já é carregado."""
+        self.limpar_campos_busca(janela)
 
+        self.__resultados_busca = self.__inscricao_dao.buscar_por_nome_ou_cpf(evento_id, input_busca)
+        janela['-RESULTADOS_BUSCA-'].update(
+            values=[self.__tela_inscricao.formatar_resultado_busca(i) for i in self.__resultados_busca]
+        )
+
+        if not self.__resultados_busca:
+            self.exibir_popup_erro("Nenhum inscrito neste evento encontrado com este nome ou CPF.")
+            return
+
+        if len(self.__resultados_busca) == 1:
+            self.carregar_inscricao(janela, self.__resultados_busca[0]['atleta_cpf'], evento_id)
+
+    def carregar_inscricao(self, janela, atleta_cpf: str, evento_id: int):
+        """Exibe os dados da inscrição do atleta no evento para a entrega do kit."""
         self.limpar_campos_busca(janela)
 
-        cpf_busca = re.sub(r'[^0-9]', '', input_busca)
-        usuario = self.__usuario_dao.get(cpf_busca)
+        usuario = self.__usuario_dao.get(atleta_cpf)
 
         if not isinstance(usuario, Atleta):
             self.exibir_popup_erro("Nenhum atleta encontrado com este CPF.")
@@ -116,6 +244,33 @@ class ControladorInscricao:
     def exibir_popup_sucesso(self, mensagem: str):
         sg.popup_ok(mensagem, title="Sucesso")
 
+    def registrar_inscricao_com_ficha_medica(self, inscricao: Inscricao, respostas_ficha: dict) -> FichaMedica:
+        """
+        Salva a inscrição e a ficha médica em uma única transação.
+
+        Se qualquer um dos dois INSERTs falhar, nada é gravado: não fica
+        inscrição sem ficha médica (RN05).
+        """
+        with self.__inscricao_dao.transacao():
+            self.__inscricao_dao.add(inscricao)
+
+            # Criar ficha médica com o ID da inscrição
+            ficha_medica = FichaMedica(
+                inscricao_id=inscricao.id,
+                preenchida=True,
+                pergunta1=respostas_ficha['pergunta1'],
+                pergunta2=respostas_ficha['pergunta2'],
+                pergunta3=respostas_ficha['pergunta3'],
+                pergunta4=respostas_ficha['pergunta4'],
+                pergunta5=respostas_ficha['pergunta5'],
+                pergunta6=respostas_ficha['pergunta6'],
+                pergunta7=respostas_ficha['pergunta7'],
+                declaracao_saude=True
+            )
+            self.__ficha_medica_dao.add(ficha_medica)
+
+        return ficha_medica
+
     def abre_tela_inscricao_atleta(self, evento_id: int, atleta: Atleta):
         """Abre a tela de inscrição para o atleta se inscrever em um evento."""
         # Buscar evento
@@ -255,25 +410,8 @@ class ControladorInscricao:
                         kit_entregue=0
                     )
 
-                    # Salvar inscrição
-                    self.__inscricao_dao.add(nova_inscricao)
-
-                    # Criar ficha médica com o ID da inscrição
-                    ficha_medica_obj = FichaMedica(
-                        inscricao_id=nova_inscricao.id,
-                        preenchida=True,
-                        pergunta1=ficha_medica_respostas['pergunta1'],
-                        pergunta2=ficha_medica_respostas['pergunta2'],
-                        pergunta3=ficha_medica_respostas['pergunta3'],
-                        pergunta4=ficha_medica_respostas['pergunta4'],
-                        pergunta5=ficha_medica_respostas['pergunta5'],
-                        pergunta6=ficha_medica_respostas['pergunta6'],
-                        pergunta7=ficha_medica_respostas['pergunta7'],
-                        declaracao_saude=True
-                    )
-
-                    # Salvar ficha médica
-                    self.__ficha_medica_dao.add(ficha_medica_obj)
+                    # Salvar inscrição e ficha médica na mesma transação
+                    self.registrar_inscricao_com_ficha_medica(nova_inscricao, ficha_medica_respostas)
 
                     self.exibir_popup_sucesso(f'Inscrição realizada com sucesso!\n\nKit Selecionado: {kit_selecionado}')
                     break
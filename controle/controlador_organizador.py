@@ -142,9 +142,12 @@ class ControladorOrganizador:
             except Exception as e:
                 print(f"Erro ao deletar evento {evento.id}: {e}")
 
-        # Deleta o organizador
+        # Deleta o organizador (falha se ainda houver eventos concluídos vinculados à conta)
         try:
-            self.__usuario_dao.remove(organizador.cpf)
-            self.__controlador_sistema.exibir_popup_sucesso('Conta e eventos não concluídos apagados com sucesso.')
+            if self.__usuario_dao.remove(organizador.cpf):
+                self.__controlador_sistema.exibir_popup_sucesso('Conta e eventos não concluídos apagados com sucesso.')
+            else:
+                self.__controlador_sistema.exibir_popup_erro(
+                    'Não foi possível apagar a conta: existem eventos concluídos vinculados a este organizador.')
         except Exception as e:
             self.__controlador_sistema.exibir_popup_erro(f'Erro ao deletar organizador: {e}')
\ No newline at end of file
@@ -1,52 +1,121 @@
 import re
 from datetime import datetime
-import FreeSimpleGUI as sg
-from controle.controlador_organizador import ControladorOrganizador
 from entidade.atleta import Atleta
 from entidade.organizador import Organizador
-from limite.tela_organizador import TelaOrganizador
 from limite.tela_principal import TelaPrincipal
-from limite.tela_atleta import TelaAtleta
-from controle.controlador_atleta import ControladorAtleta
-from persistencia.inscricao_dao import InscricaoDAO
-from persistencia.usuario_dao import UsuarioDAO
-from controle.controlador_evento import ControladorEvento
-from persistencia.evento_dao import EventoDAO
-from controle.controlador_inscricao import ControladorInscricao
-from controle.controlador_importacao import ControladorImportacao
-from persistencia.resultado_dao import ResultadoDAO
-from limite.tela_importar_resultados import executar_janela_importacao
-from limite.tela_resultados import TelaResultados
-from limite.tela_inscricao import TelaInscricao
 
 
 class ControladorSistema:
     def __init__(self):
+        # Apenas a tela de login é criada na partida; telas, DAOs e controladores
+        # (e os módulos que os definem, inclusive o FreeSimpleGUI) são carregados
+        # no primeiro uso
         self.__tela_principal = TelaPrincipal()
-        self.__evento_dao = EventoDAO()
-        self.__usuario_dao = UsuarioDAO()
-        self.__inscricao_dao = InscricaoDAO()
-        self.__tela_organizador = TelaOrganizador()
-        self.__tela_atleta = TelaAtleta()
-        self.__controlador_atleta = ControladorAtleta(self, self.__usuario_dao)
-        self.__controlador_organizador = ControladorOrganizador(self, self.__usuario_dao)
-        self.__controlador_evento = ControladorEvento(self, self.__evento_dao, self.__usuario_dao)
-        self.__controlador_inscricao = ControladorInscricao(self,self.__inscricao_dao, self.__usuario_dao)
-        self.__resultado_dao = ResultadoDAO()
-        self.__controlador_importacao = ControladorImportacao(
+        self.__componentes = {}
+
+    def __obter(self, nome: str, fabrica):
+        """
+        Retorna o componente registrado com o nome informado, criando-o na primeira chamada.
+
+        Args:
+            nome: Chave do componente
+            fabrica: Função sem argumentos que cria o componente
+
+        Returns:
+            Instância compartilhada do componente
+        """
+        componente = self.__componentes.get(nome)
+        if componente is None:
+            componente = fabrica()
+            self.__componentes[nome] = componente
+        return componente
+
+    @property
+    def __usuario_dao(self):
+        from persistencia.usuario_dao import UsuarioDAO
+        return self.__obter('usuario_dao', UsuarioDAO)
+
+    @property
+    def __evento_dao(self):
+        from persistencia.evento_dao import EventoDAO
+        return self.__obter('evento_dao', EventoDAO)
+
+    @property
+    def __inscricao_dao(self):
+        from persistencia.inscricao_dao import InscricaoDAO
+        return self.__obter('inscricao_dao', InscricaoDAO)
+
+    @property
+    def __resultado_dao(self):
+        from persistencia.resultado_dao import ResultadoDAO
+        return self.__obter('resultado_dao', ResultadoDAO)
+
+    @property
+    def __estatistica_dao(self):
+        from persistencia.estatistica_dao import EstatisticaDAO
+        return self.__obter('estatistica_dao', EstatisticaDAO)
+
+    @property
+    def __tela_organizador(self):
+        from limite.tela_organizador import TelaOrganizador
+        return self.__obter('tela_organizador', TelaOrganizador)
+
+    @property
+    def __tela_resultados(self):
+        from limite.tela_resultados import TelaResultados
+        return self.__obter('tela_resultados', TelaResultados)
+
+    @property
+    def __tela_estatisticas(self):
+        from limite.tela_estatisticas import TelaEstatisticas
+        return self.__obter('tela_estatisticas', TelaEstatisticas)
+
+    @property
+    def __tela_inscricao(self):
+        from limite.tela_inscricao import TelaInscricao
+        return self.__obter('tela_inscricao', TelaInscricao)
+
+    @property
+    def __controlador_atleta(self):
+        from controle.controlador_atleta import ControladorAtleta
+        return self.__obter('controlador_atleta',
+                            lambda: ControladorAtleta(self, self.__usuario_dao))
+
+    @property
+    def __controlador_organizador(self):
+        from controle.controlador_organizador import ControladorOrganizador
+        return self.__obter('controlador_organizador',
+                            lambda: ControladorOrganizador(self, self.__usuario_dao))
+
+    @property
+    def __controlador_evento(self):
+        from controle.controlador_evento import ControladorEvento
+        return self.__obter('controlador_evento',
+                            lambda: ControladorEvento(self, self.__evento_dao, self.__usuario_dao))
+
+    @property
+    def __controlador_inscricao(self):
+        from controle.controlador_inscricao import ControladorInscricao
+        return self.__obter('controlador_inscricao',
+                            lambda: ControladorInscricao(self, self.__inscricao_dao, self.__usuario_dao))
+
+    @property
+    def __controlador_importacao(self):
+        from controle.controlador_importacao import ControladorImportacao
+        return self.__obter('controlador_importacao', lambda: ControladorImportacao(
             self.__resultado_dao,
             self.__inscricao_dao,
             self.__usuario_dao,
-            self.__evento_dao
-        )
-        self.__tela_resultados = TelaResultados()
-        self.__tela_inscricao = TelaInscricao()
+            self.__evento_dao,
+            self.__estatistica_dao
+        ))
 
     def iniciar(self):
         while True:
             evento, valores = self.__tela_principal.exibir_janela_login()
 
-            if evento is None or evento == sg.WIN_CLOSED:
+            # A tela de login devolve None quando a janela é fechada
+            if evento is None:
                 break
             if evento == '-CADASTRO_ATLETA-':
                 self.__controlador_atleta.abre_tela_cadastro()
@@ -91,8 +160,9 @@ class ControladorSistema:
             self.exibir_popup_erro(f"Erro ao verificar credenciais: {e}")
 
     def iniciar_painel_organizador(self, organizador: Organizador):
+        import FreeSimpleGUI as sg
 
-        eventos_do_organizador = self.__evento_dao.get_all_by_organizador(organizador.cpf)
+        eventos_do_organizador = self.__evento_dao.get_resumo_by_organizador(organizador.cpf)
 
         dados_tabela = self.preparar_dados_tabela_eventos(eventos_do_organizador)
 
@@ -113,7 +183,7 @@ class ControladorSistema:
             if evento == '-CRIAR_EVENTO-':
                 self.__controlador_evento.abre_tela_novo_evento(organizador)
 
-                eventos_do_organizador = self.__evento_dao.get_all_by_organizador(organizador.cpf)
+                eventos_do_organizador = self.__evento_dao.get_resumo_by_organizador(organizador.cpf)
                 dados_tabela_novos = self.preparar_dados_tabela_eventos(eventos_do_organizador)
                 janela_painel['-TABELA_EVENTOS-'].update(values=dados_tabela_novos)
 
@@ -145,7 +215,7 @@ class ControladorSistema:
                     organizador
                 )
                 
-                eventos_do_organizador = self.__evento_dao.get_all_by_organizador(organizador.cpf)
+                eventos_do_organizador = self.__evento_dao.get_resumo_by_organizador(organizador.cpf)
                 dados_tabela_novos = self.preparar_dados_tabela_eventos(eventos_do_organizador)
                 janela_painel['-TABELA_EVENTOS-'].update(values=dados_tabela_novos)
             if evento == '-IMPORTAR_TEMPOS-':
@@ -165,6 +235,7 @@ class ControladorSistema:
                 except ValueError:
                     self.exibir_popup_erro("Data do evento inválida.")
                     continue
+                from limite.tela_importar_resultados import executar_janela_importacao
                 sucesso = executar_janela_importacao(
                     self.__controlador_importacao,
                     evento_selecionado.id,
@@ -172,7 +243,7 @@ class ControladorSistema:
                 )
                 
                 if sucesso:
-                    eventos_do_organizador = self.__evento_dao.get_all_by_organizador(organizador.cpf)
+                    eventos_do_organizador = self.__evento_dao.get_resumo_by_organizador(organizador.cpf)
                     dados_tabela_novos = self.preparar_dados_tabela_eventos(eventos_do_organizador)
                     janela_painel['-TABELA_EVENTOS-'].update(values=dados_tabela_novos)
             if evento == '-VER_RESULTADOS-':
@@ -184,17 +255,17 @@ class ControladorSistema:
                 indice_selecionado = indices_selecionados[0]
                 evento_selecionado = eventos_do_organizador[indice_selecionado]
                 
-                # Buscar resultados do evento
-                resultados = self.__resultado_dao.buscar_resultados_por_evento(evento_selecionado.id)
+                # Buscar as tabelas de resultados do evento (em cache por versão)
+                quadro = self.__resultado_dao.buscar_quadro_resultados(evento_selecionado.id)
                 
-                if not resultados:
+                if quadro is None or not quadro.total_resultados:
                     self.exibir_popup_erro("Este evento ainda não possui resultados importados.")
                     continue
                 
                 # Exibir resultados por categoria
                 self.__tela_resultados.exibir_resultados_por_categoria(
                     evento_selecionado.nome,
-                    resultados
+                    quadro
                 )
             if evento == '-VER_INSCRITOS-':
                 indices_selecionados = valores['-TABELA_EVENTOS-']
@@ -217,6 +288,21 @@ class ControladorSistema:
                     evento_selecionado.nome,
                     inscricoes
                 )
+            if evento == '-VER_ESTATISTICAS-':
+                indices_selecionados = valores['-TABELA_EVENTOS-']
+                if not indices_selecionados:
+                    self.exibir_popup_erro("Por favor, selecione um evento na tabela primeiro.")
+                    continue
+
+                indice_selecionado = indices_selecionados[0]
+                evento_selecionado = eventos_do_organizador[indice_selecionado]
+
+                estatisticas = self.__estatistica_dao.obter(evento_selecionado.id)
+                if estatisticas is None:
+                    self.exibir_popup_erro("Não foi possível carregar as estatísticas do evento.")
+                    continue
+
+                self.__tela_estatisticas.exibir_estatisticas(evento_selecionado.nome, estatisticas)
             if evento == '-PUBLICAR_RESULTADOS-':
                 indices_selecionados = valores['-TABELA_EVENTOS-']
                 if not indices_selecionados:
@@ -237,14 +323,12 @@ class ControladorSistema:
                     continue
                 
                 # Validar que existem resultados importados
-                resultados = self.__resultado_dao.buscar_resultados_por_evento(evento_selecionado.id)
-                if not resultados:
+                if not evento_selecionado.total_resultados:
                     self.exibir_popup_erro("Este evento ainda não possui resultados importados. Importe os resultados primeiro.")
                     continue
                 
                 # Validar que os resultados ainda não foram publicados
-                evento_atualizado = self.__evento_dao.get_by_id(evento_selecionado.id)
-                if evento_atualizado and evento_atualizado.resultados_publicados == 1:
+                if evento_selecionado.resultados_publicados == 1:
                     self.exibir_popup_erro("Os resultados deste evento já foram publicados.")
                     continue
                 
@@ -253,7 +337,7 @@ class ControladorSistema:
                 if sucesso:
                     self.exibir_popup_sucesso("Resultados publicados com sucesso! Os atletas agora podem consultar seus resultados individuais.")
                     # Atualizar lista de eventos
-                    eventos_do_organizador = self.__evento_dao.get_all_by_organizador(organizador.cpf)
+                    eventos_do_organizador = self.__evento_dao.get_resumo_by_organizador(organizador.cpf)
                     dados_tabela_novos = self.preparar_dados_tabela_eventos(eventos_do_organizador)
                     janela_painel['-TABELA_EVENTOS-'].update(values=dados_tabela_novos)
                 else:
@@ -263,19 +347,18 @@ class ControladorSistema:
     def preparar_dados_tabela_eventos(self, eventos_do_organizador) -> list:
         dados_formatados = []
         for evento in eventos_do_organizador:
-            contagem_inscritos = self.__inscricao_dao.count_by_evento(evento.id)
             status = "Inscrições Abertas"
             try:
                 data_evento_obj = datetime.strptime(evento.data, '%d/%m/%Y')
                 if data_evento_obj < datetime.now():
-                    status = "Concluído"
+                    status = "Resultados Publicados" if evento.resultados_publicados else "Concluído"
             except ValueError:
                 status = "Data Inválida"
 
             dados_formatados.append([
                 evento.nome,
                 evento.data,
-                contagem_inscritos,
+                evento.total_inscritos,
                 status
             ])
 
@@ -287,7 +370,9 @@ class ControladorSistema:
         self.__controlador_inscricao.abre_tela_inscricao_atleta(evento_id, atleta)
 
     def exibir_popup_erro(self, mensagem: str):
+        import FreeSimpleGUI as sg
         sg.popup_error(mensagem, title="Erro")
 
     def exibir_popup_sucesso(self, mensagem: str):
+        import FreeSimpleGUI as sg
         sg.popup_ok(mensagem, title="Sucesso")
\ No newline at end of file
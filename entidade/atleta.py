@@ -1,5 +1,59 @@
 from entidade.usuario import Usuario
 from datetime import datetime
+from functools import lru_cache
+
+# RN07: idade máxima (em 31/12 do ano do evento) de cada faixa; acima disso, Master
+IDADE_MAXIMA_JUNIOR = 17
+IDADE_MAXIMA_ADULTO = 49
+
+
+@lru_cache(maxsize=None)
+def ano_do_evento(data_evento: str) -> int:
+    """
+    Extrai o ano de uma data de evento no formato DD/MM/YYYY.
+
+    Args:
+        data_evento: Data do evento
+
+    Returns:
+        Ano do evento
+
+    Raises:
+        ValueError: Se a data for inválida
+    """
+    try:
+        return datetime.strptime(data_evento, '%d/%m/%Y').year
+    except ValueError:
+        raise ValueError(f"Formato de data inválido: {data_evento}")
+
+
+@lru_cache(maxsize=None)
+def resolver_categoria(ano_nascimento: int, ano_evento: int, pcd: bool) -> str:
+    """
+    Resolve a categoria de um atleta (RN04/RN07).
+
+    A idade é a que o atleta terá em 31 de dezembro do ano do evento, ou seja,
+    depende apenas dos anos; por isso o resultado é memorizado por
+    (ano de nascimento, ano do evento, PCD).
+
+    Args:
+        ano_nascimento: Ano de nascimento do atleta
+        ano_evento: Ano do evento
+        pcd: Se o atleta é pessoa com deficiência
+
+    Returns:
+        Categoria: 'PCD', 'Júnior', 'Adulto' ou 'Master'
+    """
+    if pcd:
+        return 'PCD'
+
+    idade = ano_evento - ano_nascimento
+    if idade <= IDADE_MAXIMA_JUNIOR:
+        return 'Júnior'
+    if idade <= IDADE_MAXIMA_ADULTO:
+        return 'Adulto'
+    return 'Master'
+
 
 class Atleta(Usuario):
     def __init__(self, nome, cpf, email, senha_hash, data_nascimento, genero, pcd):
@@ -17,6 +71,28 @@ class Atleta(Usuario):
         self.__genero = genero
         self.__pcd = pcd
 
+    @classmethod
+    def from_row(cls, dados) -> 'Atleta':
+        """
+        Monta um Atleta a partir de uma linha da tabela usuarios, sem revalidar
+        CPF, email e data de nascimento (já validados no cadastro).
+
+        Args:
+            dados: Linha da tabela usuarios (sqlite3.Row ou dicionário)
+
+        Returns:
+            Objeto Atleta
+        """
+        atleta = cls._hidratar(dados['cpf'], dados['nome'], dados['email'], dados['senha_hash'])
+        data_nascimento = dados['data_nascimento'].split(' ')[0]
+        try:
+            atleta.__data_nascimento = datetime.fromisoformat(data_nascimento)
+        except ValueError:
+            atleta.__data_nascimento = datetime.strptime(data_nascimento, "%d/%m/%Y")
+        atleta.__genero = dados['genero']
+        atleta.__pcd = bool(dados['pcd'])
+        return atleta
+
     @property
     def data_nascimento(self):
         return self.__data_nascimento
@@ -57,27 +133,4 @@ class Atleta(Usuario):
         Returns:
             Categoria: 'PCD', 'Júnior', 'Adulto' ou 'Master'
         """
-        # Se é PCD, sempre compete na categoria PCD
-        if self.pcd:
-            return 'PCD'
-        
-        # Calcular idade em 31/12 do ano do evento
-        try:
-            ano_evento = datetime.strptime(data_evento, '%d/%m/%Y').year
-            idade = ano_evento - self.__data_nascimento.year
-            
-            # Ajustar para idade em 31/12
-            data_31_dezembro = datetime(ano_evento, 12, 31)
-            if (data_31_dezembro.month, data_31_dezembro.day) < (self.__data_nascimento.month, self.__data_nascimento.day):
-                idade -= 1
-            
-            # RN07: Classificação por faixas etárias
-            if idade <= 17:
-                return 'Júnior'
-            elif idade <= 49:
-                return 'Adulto'
-            else:  # 50+ anos
-                return 'Master'
-                
-        except ValueError:
-            raise ValueError(f"Formato de data inválido: {data_evento}")
\ No newline at end of file
+        return resolver_categoria(self.__data_nascimento.year, ano_do_evento(data_evento), bool(self.pcd))
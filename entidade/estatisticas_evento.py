@@ -0,0 +1,69 @@
+import math
+from typing import Dict, List, Optional, Tuple
+
+# Largura de cada faixa do histograma de tempos de conclusão
+LARGURA_FAIXA_HISTOGRAMA_MS = 5 * 60 * 1000
+
+# Percentis de ritmo (min/km) exibidos nas estatísticas
+PERCENTIS_RITMO = (10, 25, 50, 75, 90)
+
+
+def posicao_percentil(percentil: int, total: int) -> int:
+    """
+    Posição (1 = mais rápido) do percentil pelo método do posto mais próximo.
+
+    Args:
+        percentil: Percentil entre 1 e 100
+        total: Quantidade de tempos
+
+    Returns:
+        Posição na lista de tempos em ordem crescente
+    """
+    return max(1, math.ceil(percentil * total / 100))
+
+
+def formatar_tempo_ms(tempo_ms: int) -> str:
+    """Formata milissegundos como HH:MM:SS (frações de segundo descartadas)."""
+    segundos = tempo_ms // 1000
+    return f"{segundos // 3600:02d}:{segundos % 3600 // 60:02d}:{segundos % 60:02d}"
+
+
+def formatar_ritmo(ms_por_km: int) -> str:
+    """Formata um ritmo em milissegundos por km como M:SS/km."""
+    segundos = round(ms_por_km / 1000)
+    return f"{segundos // 60}:{segundos % 60:02d}/km"
+
+
+class EstatisticasEvento:
+    """
+    Estatísticas consolidadas de um evento, lidas da tabela EstatisticasEventos.
+
+    São duas seções independentes, recalculadas separadamente: a de inscrições
+    (gênero, categoria, kit e PCD) e a de resultados (histograma de tempos e
+    percentis de ritmo).
+    """
+
+    def __init__(self, evento_id: int, inscricoes: dict, resultados: dict, atualizada_em: str):
+        self.evento_id = evento_id
+        self.atualizada_em = atualizada_em
+
+        self.total_inscritos: int = inscricoes['total']
+        self.inscritos_por_genero: Dict[str, int] = inscricoes['por_genero']
+        self.inscritos_por_categoria: Dict[str, int] = inscricoes['por_categoria']
+        self.inscritos_por_kit: Dict[str, int] = inscricoes['por_kit']
+        self.inscritos_pcd: int = inscricoes['pcd']
+
+        self.total_concluintes: int = resultados['total']
+        self.concluintes_por_genero: Dict[str, int] = resultados['por_genero']
+        self.melhor_tempo_ms: Optional[int] = resultados['melhor_tempo_ms']
+        self.tempo_medio_ms: Optional[int] = resultados['tempo_medio_ms']
+        # Pares (início da faixa em ms, quantidade), em ordem de tempo
+        self.histograma_tempos: List[Tuple[int, int]] = [tuple(faixa) for faixa in resultados['histograma']]
+        # Percentil -> ritmo em ms/km
+        self.percentis_ritmo: Dict[int, int] = {
+            int(percentil): ritmo for percentil, ritmo in resultados['percentis_ritmo'].items()
+        }
+
+    @staticmethod
+    def percentual(parte: int, total: int) -> float:
+        return (parte / total) * 100 if total else 0.0
@@ -1,5 +1,23 @@
+from datetime import datetime
 from entidade.kit_de_corrida import KitDeCorrida
-from typing import List
+from typing import List, Optional
+
+
+def converter_data_iso(data: str) -> Optional[str]:
+    """
+    Converte uma data 'DD/MM/AAAA' para o formato ordenável 'AAAA-MM-DD'.
+
+    Args:
+        data: Data no formato usado pelas telas ('DD/MM/AAAA')
+
+    Returns:
+        Data no formato ISO, ou None se a data for inválida
+    """
+    try:
+        return datetime.strptime(data, '%d/%m/%Y').strftime('%Y-%m-%d')
+    except (TypeError, ValueError):
+        return None
+
 
 class Evento:
     def __init__(self, nome: str, data: str, distancia: int, local_largada: str, tempo_corte: str, data_limite_cred: str, organizador_cpf: str):
@@ -11,4 +29,12 @@ class Evento:
         self.data_limite_cred = data_limite_cred
         self.organizador_cpf = organizador_cpf
         self.kits: List[KitDeCorrida] = []
-        self.resultados_publicados: int = 0
\ No newline at end of file
+        self.resultados_publicados: int = 0
+        # Preenchidos pelas listagens agregadas do EventoDAO
+        self.total_inscritos: int = 0
+        self.total_resultados: int = 0
+
+    @property
+    def data_iso(self) -> Optional[str]:
+        """Data do evento em 'AAAA-MM-DD', espelhada na coluna Eventos.data_iso."""
+        return converter_data_iso(self.data)
@@ -1,20 +1,93 @@
+import re
 from datetime import datetime
+from typing import Optional, Tuple
+
+FORMATO_DATA_INSCRICAO = '%Y-%m-%d %H:%M:%S'
+
+# Código impresso no comprovante do atleta e lido no balcão de kits:
+# PH-<evento>-<inscrição>-<dígitos verificadores>
+PREFIXO_TOKEN_KIT = 'PH'
+_PADRAO_TOKEN_KIT = re.compile(r'PH-?(\d+)-(\d+)-(\d{2})')
+
+
+def _numero_token_kit(evento_id: int, inscricao_id: int) -> int:
+    return evento_id * 10 ** 10 + inscricao_id
+
+
+def gerar_token_kit(evento_id: int, inscricao_id: int) -> str:
+    """
+    Gera o código de retirada do kit de uma inscrição.
+
+    Os dígitos verificadores (ISO 7064 MOD 97-10) detectam leituras parciais e
+    erros de digitação antes de qualquer consulta.
+
+    Args:
+        evento_id: ID do evento
+        inscricao_id: ID da inscrição
+
+    Returns:
+        Código no formato PH-<evento>-<inscrição>-<dv>
+    """
+    digito = 98 - (_numero_token_kit(evento_id, inscricao_id) * 100) % 97
+    return f"{PREFIXO_TOKEN_KIT}-{evento_id}-{inscricao_id}-{digito:02d}"
+
+
+def ler_token_kit(token: str) -> Optional[Tuple[int, int]]:
+    """
+    Interpreta um código de retirada lido pelo leitor (maiúsculas/minúsculas e
+    espaços nas pontas são ignorados).
+
+    Args:
+        token: Texto enviado pelo leitor
+
+    Returns:
+        Tupla (evento_id, inscricao_id) ou None se o código for inválido
+    """
+    correspondencia = _PADRAO_TOKEN_KIT.fullmatch(token.strip().upper())
+    if not correspondencia:
+        return None
+
+    evento_id, inscricao_id, digito = (int(grupo) for grupo in correspondencia.groups())
+    if (_numero_token_kit(evento_id, inscricao_id) * 100 + digito) % 97 != 1:
+        return None
+    return evento_id, inscricao_id
+
 
 class Inscricao:
+    __slots__ = ('id', '__atleta_cpf', '__evento_id', '__kit_id', '__status',
+                 '__data_inscricao', '__data_inscricao_texto', '__kit_entregue')
+
     def __init__(self, atleta_cpf, evento_id, kit_id, status, data_inscricao, kit_entregue: int = 0):
+        self.id = None
         self.__atleta_cpf = atleta_cpf
         self.__evento_id = evento_id
         self.__kit_id = kit_id
         self.__status = status
         if data_inscricao:
-            self.data_inscricao = datetime.strptime(data_inscricao, '%Y-%m-%d %H:%M:%S')
+            # Convertida para datetime apenas quando for lida
+            self.__data_inscricao = None
+            self.__data_inscricao_texto = data_inscricao
         else:
-            self.data_inscricao = datetime.now()
+            self.__data_inscricao = datetime.now()
+            self.__data_inscricao_texto = None
         self.__kit_entregue = kit_entregue
 
+    @property
+    def data_inscricao(self):
+        if self.__data_inscricao is None:
+            self.__data_inscricao = datetime.strptime(self.__data_inscricao_texto, FORMATO_DATA_INSCRICAO)
+        return self.__data_inscricao
+
+    @data_inscricao.setter
+    def data_inscricao(self, data_inscricao):
+        self.__data_inscricao = data_inscricao
+        self.__data_inscricao_texto = None
+
     @property
     def data_inscricao_str(self):
-        return self.data_inscricao.strftime('%Y-%m-%d %H:%M:%S')
+        if self.__data_inscricao_texto is None:
+            self.__data_inscricao_texto = self.__data_inscricao.strftime(FORMATO_DATA_INSCRICAO)
+        return self.__data_inscricao_texto
 
     @property
     def atleta_cpf_str(self):
@@ -38,4 +111,8 @@ class Inscricao:
 
     @property
     def status(self):
-        return self.__status
\ No newline at end of file
+        return self.__status
+
+    @property
+    def token_kit(self):
+        return gerar_token_kit(self.__evento_id, self.id)
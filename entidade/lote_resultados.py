@@ -0,0 +1,110 @@
+from array import array
+from typing import Iterator, Mapping
+
+from entidade.resultado import Resultado
+
+# Valor gravado nas colunas de classificação quando não há posição (posições começam em 1)
+SEM_CLASSIFICACAO = 0
+
+# Valor gravado na coluna de tempos quando o tempo salvo é inválido (tempo_ms NULL)
+SEM_TEMPO = -1
+
+
+class LoteResultados:
+    """
+    Coleção compacta de resultados, armazenada por colunas.
+
+    Campos numéricos ficam em arrays tipados e os textos repetidos (gênero e
+    categoria) são compartilhados entre as linhas, em vez de um objeto
+    Resultado por atleta. Os objetos Resultado são montados apenas quando um
+    item é acessado.
+    """
+
+    __slots__ = ('ids', 'eventos_id', 'cpfs_atleta', 'nomes_atleta', 'generos_atleta',
+                 'tempos_finais', 'tempos_ms', 'categorias', 'classificacoes_geral',
+                 'classificacoes_categoria', 'pcds', '__textos')
+
+    def __init__(self):
+        self.ids = array('q')
+        self.eventos_id = array('q')
+        self.cpfs_atleta = []
+        self.nomes_atleta = []
+        self.generos_atleta = []
+        self.tempos_finais = []
+        self.tempos_ms = array('q')
+        self.categorias = []
+        self.classificacoes_geral = array('i')
+        self.classificacoes_categoria = array('i')
+        self.pcds = array('b')
+        self.__textos = {}
+
+    def __compartilhar(self, texto: str) -> str:
+        return self.__textos.setdefault(texto, texto)
+
+    def adicionar_linha(self, dados: Mapping):
+        """
+        Acrescenta uma linha da tabela Resultados (sqlite3.Row ou dicionário).
+
+        Args:
+            dados: Mapeamento com as colunas da tabela Resultados
+        """
+        self.ids.append(dados['id'])
+        self.eventos_id.append(dados['evento_id'])
+        self.cpfs_atleta.append(dados['cpf_atleta'])
+        self.nomes_atleta.append(dados['nome_atleta'])
+        self.generos_atleta.append(self.__compartilhar(dados['genero_atleta']))
+        self.tempos_finais.append(dados['tempo_final'])
+        tempo_ms = dados['tempo_ms']
+        self.tempos_ms.append(SEM_TEMPO if tempo_ms is None else tempo_ms)
+        self.categorias.append(self.__compartilhar(dados['categoria']))
+        self.classificacoes_geral.append(dados['classificacao_geral'] or SEM_CLASSIFICACAO)
+        self.classificacoes_categoria.append(dados['classificacao_categoria'] or SEM_CLASSIFICACAO)
+        self.pcds.append(1 if dados['pcd'] else 0)
+
+    def adicionar(self, resultado: Resultado):
+        """
+        Acrescenta um objeto Resultado já salvo no banco.
+
+        Args:
+            resultado: Resultado com id e evento_id preenchidos
+        """
+        self.adicionar_linha(resultado.to_dict())
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, indice: int) -> Resultado:
+        """
+        Monta o Resultado da posição informada (aceita índices negativos).
+
+        Args:
+            indice: Posição no lote
+
+        Returns:
+            Novo objeto Resultado com os dados da linha
+        """
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice fora do lote de resultados")
+
+        resultado = Resultado(
+            cpf_atleta=self.cpfs_atleta[indice],
+            nome_atleta=self.nomes_atleta[indice],
+            genero_atleta=self.generos_atleta[indice],
+            tempo_final=self.tempos_finais[indice],
+            categoria=self.categorias[indice],
+            pcd=bool(self.pcds[indice]),
+            tempo_ms=self.tempos_ms[indice]
+        )
+        if resultado.tempo_ms == SEM_TEMPO:
+            resultado.tempo_ms = None
+        resultado.id = self.ids[indice]
+        resultado.evento_id = self.eventos_id[indice]
+        resultado.classificacao_geral = self.classificacoes_geral[indice] or None
+        resultado.classificacao_categoria = self.classificacoes_categoria[indice] or None
+        return resultado
+
+    def __iter__(self) -> Iterator[Resultado]:
+        for indice in range(len(self)):
+            yield self[indice]
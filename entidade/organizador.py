@@ -3,4 +3,18 @@ from datetime import datetime
 
 class Organizador(Usuario):
     def __init__(self, nome, cpf, email, senha_hash):
-        super().__init__(cpf, nome, email, senha_hash)
\ No newline at end of file
+        super().__init__(cpf, nome, email, senha_hash)
+
+    @classmethod
+    def from_row(cls, dados) -> 'Organizador':
+        """
+        Monta um Organizador a partir de uma linha da tabela usuarios, sem
+        revalidar CPF e email (já validados no cadastro).
+
+        Args:
+            dados: Linha da tabela usuarios (sqlite3.Row ou dicionário)
+
+        Returns:
+            Objeto Organizador
+        """
+        return cls._hidratar(dados['cpf'], dados['nome'], dados['email'], dados['senha_hash'])
@@ -0,0 +1,81 @@
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from entidade.ranking import GENEROS_CLASSIFICADOS
+
+# Aba com os TOP_GERAL de cada gênero (RN06), sem os atletas PCD
+ABA_GERAL = 'Geral'
+
+# Abas da tela de resultados, além da 'Geral', sempre exibidas nesta ordem
+ORDEM_CATEGORIAS = ('Júnior', 'Adulto', 'Master', 'PCD')
+
+# Linha de tabela: (nome, tempo, classificação)
+LinhaResultado = Tuple[str, str, str]
+
+
+class QuadroResultados:
+    """
+    Tabelas prontas da tela de resultados de um evento.
+
+    Para cada aba ('Geral' e as categorias de ORDEM_CATEGORIAS) guarda as linhas
+    do masculino e do feminino, já separadas e ordenadas pela classificação.
+    É montado uma vez por versão dos resultados do evento e compartilhado por
+    todas as exibições (ver ResultadoDAO.buscar_quadro_resultados); as linhas
+    são tuplas e não devem ser alteradas.
+    """
+
+    __slots__ = ('evento_id', 'versao', 'total_resultados', 'abas')
+
+    def __init__(self, evento_id: int, versao: int, total_resultados: int,
+                 abas: Dict[str, Tuple[List[LinhaResultado], List[LinhaResultado]]]):
+        self.evento_id = evento_id
+        self.versao = versao
+        self.total_resultados = total_resultados
+        self.abas = abas
+
+    def tabelas(self, aba: str) -> Tuple[List[LinhaResultado], List[LinhaResultado]]:
+        """
+        Retorna as linhas (masculino, feminino) de uma aba.
+
+        Args:
+            aba: 'Geral' ou uma das categorias de ORDEM_CATEGORIAS
+
+        Returns:
+            Tupla (linhas_masculino, linhas_feminino), vazias se não houver resultados
+        """
+        return self.abas.get(aba, ([], []))
+
+
+def montar_quadro_resultados(evento_id: int, versao: int, linhas: Iterable[Sequence]) -> QuadroResultados:
+    """
+    Distribui nas abas as linhas do modelo de leitura de resultados
+    (ResultadoDAO.buscar_quadro_resultados), que já chegam separadas e
+    ordenadas pelas classificações gravadas na importação.
+
+    Args:
+        evento_id: ID do evento
+        versao: Versão dos resultados do evento (Eventos.versao_resultados)
+        linhas: Tuplas (aba, genero, nome, tempo, classificacao_geral,
+            classificacao_categoria), na ordem de exibição dentro de cada aba
+
+    Returns:
+        QuadroResultados com todas as abas
+    """
+    abas = {aba: ([], []) for aba in (ABA_GERAL,) + ORDEM_CATEGORIAS}
+    indice_genero = {genero: indice for indice, genero in enumerate(GENEROS_CLASSIFICADOS)}
+
+    total = 0
+    for aba, genero, nome, tempo, classificacao_geral, classificacao_categoria in linhas:
+        total += 1
+        indice = indice_genero.get(genero)
+        if indice is None or aba not in abas:
+            continue
+
+        if classificacao_geral:
+            classificacao = f"Geral: {classificacao_geral}º"
+        elif classificacao_categoria:
+            classificacao = f"{classificacao_categoria}º"
+        else:
+            classificacao = ""
+        abas[aba][indice].append((nome, tempo, classificacao))
+
+    return QuadroResultados(evento_id, versao, total, abas)
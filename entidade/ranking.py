@@ -0,0 +1,59 @@
+from typing import List, Optional, Sequence, Tuple
+
+# Gêneros que participam da classificação (RN06); os demais ficam sem posição
+GENEROS_CLASSIFICADOS = ('Masculino', 'Feminino')
+
+# Quantidade de atletas por gênero na classificação geral (RN06)
+TOP_GERAL = 5
+
+
+def calcular_classificacoes(tempos_ms: Sequence[int], generos: Sequence[str],
+                            categorias: Sequence[str], pcds: Sequence[bool]
+                            ) -> Tuple[List[Optional[int]], List[Optional[int]]]:
+    """
+    Calcula as classificações a partir de colunas paralelas (uma posição por atleta).
+
+    Os índices dos atletas são particionados por PCD e gênero em uma única
+    passada e cada grupo é ordenado por tempo (ordenação estável: empates
+    mantêm a ordem de entrada). Em cada grupo, os TOP_GERAL primeiros recebem a
+    classificação geral (RN06) e os demais são numerados dentro da própria
+    categoria, em ordem de tempo (RN07).
+
+    Args:
+        tempos_ms: Tempos finais em milissegundos
+        generos: Gêneros dos atletas
+        categorias: Categorias dos atletas
+        pcds: Indicadores de pessoa com deficiência
+
+    Returns:
+        Tupla (classificacao_geral, classificacao_categoria), listas alinhadas às
+        colunas de entrada com None onde não há classificação
+    """
+    total = len(tempos_ms)
+    classificacao_geral: List[Optional[int]] = [None] * total
+    classificacao_categoria: List[Optional[int]] = [None] * total
+
+    # Grupos: um por gênero para não PCD, seguidos de um por gênero para PCD
+    codigos_genero = {genero: codigo for codigo, genero in enumerate(GENEROS_CLASSIFICADOS)}
+    deslocamento_pcd = len(GENEROS_CLASSIFICADOS)
+    grupos: List[List[int]] = [[] for _ in range(2 * deslocamento_pcd)]
+
+    for i, genero, pcd in zip(range(total), generos, pcds):
+        codigo = codigos_genero.get(genero)
+        if codigo is not None:
+            grupos[codigo + deslocamento_pcd if pcd else codigo].append(i)
+
+    for indices in grupos:
+        indices.sort(key=tempos_ms.__getitem__)
+
+        for posicao, i in enumerate(indices[:TOP_GERAL], 1):
+            classificacao_geral[i] = posicao
+
+        posicoes_categoria = {}
+        for i in indices[TOP_GERAL:]:
+            categoria = categorias[i]
+            posicao_categoria = posicoes_categoria.get(categoria, 0) + 1
+            posicoes_categoria[categoria] = posicao_categoria
+            classificacao_categoria[i] = posicao_categoria
+
+    return classificacao_geral, classificacao_categoria
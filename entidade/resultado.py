@@ -1,14 +1,59 @@
 from datetime import datetime
 from typing import Optional, List, Tuple
 
+
+def tempo_para_ms(tempo: str) -> int:
+    """
+    Converte um tempo HH:MM:SS (com fração de segundo opcional, ex.: 01:02:03.45)
+    para milissegundos.
+
+    Args:
+        tempo: Tempo no formato HH:MM:SS[.fff]
+
+    Returns:
+        Tempo em milissegundos
+
+    Raises:
+        ValueError: Se o formato do tempo for inválido
+    """
+    try:
+        partes = tempo.split(':')
+        if len(partes) != 3:
+            raise ValueError
+
+        segundos_str, separador, fracao = partes[2].partition('.')
+        if separador and not (fracao.isdigit() and fracao.isascii()):
+            raise ValueError
+
+        horas = int(partes[0])
+        minutos = int(partes[1])
+        segundos = int(segundos_str)
+        milissegundos = int(fracao[:3].ljust(3, '0')) if fracao else 0
+
+        if horas < 0 or minutos < 0 or segundos < 0:
+            raise ValueError
+        if minutos >= 60 or segundos >= 60:
+            raise ValueError
+
+        return ((horas * 3600 + minutos * 60 + segundos) * 1000) + milissegundos
+    except (AttributeError, ValueError):
+        raise ValueError(f"Formato de tempo inválido: {tempo}")
+
+
 class Resultado:
     """
     Classe que representa um resultado de corrida de um atleta.
     Contém informações sobre tempo, categoria e classificações.
     """
+
+    # Sem __dict__ por instância: relatórios carregam dezenas de milhares de resultados
+    __slots__ = ('id', 'evento_id', 'cpf_atleta', 'nome_atleta', 'genero_atleta',
+                 'tempo_final', 'tempo_ms', 'categoria', 'classificacao_geral',
+                 'classificacao_categoria', 'pcd')
     
     def __init__(self, cpf_atleta: str, nome_atleta: str, genero_atleta: str, 
-                 tempo_final: str, categoria: str, pcd: bool = False):
+                 tempo_final: str, categoria: str, pcd: bool = False,
+                 tempo_ms: Optional[int] = None):
         """
         Inicializa um resultado.
         
@@ -19,6 +64,8 @@ class Resultado:
             tempo_final: Tempo final no formato HH:MM:SS
             categoria: Categoria do atleta ('Júnior', 'Adulto', 'Master', 'PCD')
             pcd: Se o atleta é pessoa com deficiência
+            tempo_ms: Tempo final em milissegundos (calculado a partir de tempo_final se omitido;
+                fica None se tempo_final for inválido, caso de linhas gravadas antes da validação)
         """
         self.id = None  # Preenchido após salvar no banco
         self.evento_id = None
@@ -26,6 +73,12 @@ class Resultado:
         self.nome_atleta = nome_atleta
         self.genero_atleta = genero_atleta
         self.tempo_final = tempo_final  # string HH:MM:SS
+        if tempo_ms is None:
+            try:
+                tempo_ms = tempo_para_ms(tempo_final)
+            except ValueError:
+                pass
+        self.tempo_ms = tempo_ms
         self.categoria = categoria
         self.classificacao_geral = None  # Posição na classificação geral (top 5)
         self.classificacao_categoria = None  # Posição na categoria
@@ -33,24 +86,17 @@ class Resultado:
     
     def tempo_em_segundos(self) -> int:
         """
-        Converte o tempo HH:MM:SS para segundos.
-        Útil para ordenação e cálculos.
+        Retorna o tempo final em segundos inteiros (frações descartadas).
         
         Returns:
             Tempo em segundos
-        """
-        try:
-            partes = self.tempo_final.split(':')
-            if len(partes) != 3:
-                raise ValueError(f"Formato de tempo inválido: {self.tempo_final}")
             
-            horas = int(partes[0])
-            minutos = int(partes[1])
-            segundos = int(partes[2])
-            
-            return horas * 3600 + minutos * 60 + segundos
-        except (ValueError, IndexError):
+        Raises:
+            ValueError: Se o tempo gravado for inválido
+        """
+        if self.tempo_ms is None:
             raise ValueError(f"Formato de tempo inválido: {self.tempo_final}")
+        return self.tempo_ms // 1000
     
     def tempo_formatado(self) -> str:
         """
@@ -123,6 +169,7 @@ class Resultado:
             'nome_atleta': self.nome_atleta,
             'genero_atleta': self.genero_atleta,
             'tempo_final': self.tempo_final,
+            'tempo_ms': self.tempo_ms,
             'categoria': self.categoria,
             'classificacao_geral': self.classificacao_geral,
             'classificacao_categoria': self.classificacao_categoria,
@@ -147,7 +194,8 @@ class Resultado:
             genero_atleta=dados['genero_atleta'],
             tempo_final=dados['tempo_final'],
             categoria=dados['categoria'],
-            pcd=bool(dados.get('pcd', 0))
+            pcd=bool(dados.get('pcd', 0)),
+            tempo_ms=dados.get('tempo_ms')
         )
         
         resultado.id = dados.get('id')
@@ -176,7 +224,7 @@ class Resultado:
         """
         if not isinstance(other, Resultado):
             return NotImplemented
-        return self.tempo_em_segundos() < other.tempo_em_segundos()
+        return self.tempo_ms < other.tempo_ms
     
     def __eq__(self, other):
         """
@@ -220,9 +268,9 @@ def ordenar_resultados_por_tempo(resultados: List[Resultado]) -> List[Resultado]
         resultados: Lista de objetos Resultado
         
     Returns:
-        Lista ordenada por tempo
+        Lista ordenada por tempo (resultados com tempo inválido no final)
     """
-    return sorted(resultados, key=lambda r: r.tempo_em_segundos())
+    return sorted(resultados, key=lambda r: (r.tempo_ms is None, r.tempo_ms or 0))
 
 
 def separar_resultados_por_genero(resultados: List[Resultado]) -> Tuple[List[Resultado], List[Resultado]]:
@@ -1,6 +1,5 @@
 import re
 from abc import ABC
-import bcrypt
 
 
 class Usuario(ABC):
@@ -21,6 +20,21 @@ class Usuario(ABC):
 
         self.__senha_hash = senha_hash
 
+    @classmethod
+    def _hidratar(cls, cpf, nome, email, senha_hash):
+        """
+        Cria o usuário sem repetir as validações do construtor.
+
+        Reservado a dados lidos do banco do sistema, que passaram pelo
+        construtor antes de serem gravados.
+        """
+        usuario = cls.__new__(cls)
+        usuario.__cpf = cpf
+        usuario.__nome = nome
+        usuario.__email = email
+        usuario.__senha_hash = senha_hash
+        return usuario
+
     @property
     def nome(self):
         return self.__nome
@@ -61,6 +75,8 @@ class Usuario(ABC):
         self.__senha_hash = senha_hash
 
     def verifica_senha_hash(self, senha):
+        # Importado aqui para não pesar na abertura da tela de login
+        import bcrypt
         senha_em_bytes= senha.encode('utf-8')
         hassh_em_bytes = self.__senha_hash.encode('utf-8')
         return bcrypt.checkpw(senha_em_bytes, hassh_em_bytes)
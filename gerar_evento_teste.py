@@ -328,8 +328,8 @@ def criar_evento(cursor):
     
     # Criar evento
     cursor.execute("""
-        INSERT INTO Eventos (nome, data, distancia, local_largada, tempo_corte, data_limite_cred, organizador_cpf)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
+        INSERT INTO Eventos (nome, data, distancia, local_largada, tempo_corte, data_limite_cred, organizador_cpf, data_iso)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
     """, (
         'Maratona Internacional de Florianopolis',
         '11/11/2025',
@@ -337,7 +337,8 @@ def criar_evento(cursor):
         'Av. Beira Mar Norte, Florianópolis',
         '2:0',
         '10/11/2025',
-        ORGANIZADOR_CPF
+        ORGANIZADOR_CPF,
+        '2025-11-11'
     ))
     
     evento_id = cursor.lastrowid
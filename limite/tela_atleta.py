@@ -8,7 +8,7 @@ class TelaAtleta:
         sg.theme('DarkBlue14')
 
         cabecalhos_eventos = ['Nome do Evento', 'Data', 'Distância', 'Status']
-        cabecalhos_inscricoes = ['Nome do Evento', 'Data do Evento', 'Data Inscrição', 'Kit']
+        cabecalhos_inscricoes = ['Nome do Evento', 'Data do Evento', 'Data Inscrição', 'Kit', 'Código do Kit']
         cabecalhos_resultados = ['Nome do Evento', 'Tempo', 'Classificação Geral', 'Classificação Categoria']
 
         # Layout de cada aba
@@ -37,7 +37,7 @@ class TelaAtleta:
                 headings=cabecalhos_inscricoes,
                 key='-TABELA_INSCRICOES-',
                 auto_size_columns=False,
-                col_widths=[25, 12, 12, 20],
+                col_widths=[25, 12, 12, 20, 16],
                 justification='left',
                 num_rows=12,
                 enable_events=True,
@@ -0,0 +1,98 @@
+import FreeSimpleGUI as sg
+
+from entidade.estatisticas_evento import (
+    EstatisticasEvento, LARGURA_FAIXA_HISTOGRAMA_MS, formatar_ritmo, formatar_tempo_ms
+)
+
+
+class TelaEstatisticas:
+
+    # Comprimento da maior barra do histograma, em caracteres
+    LARGURA_BARRA_HISTOGRAMA = 40
+
+    def __init__(self):
+        pass
+
+    def __linhas_distribuicao(self, contagens: dict, total: int) -> list:
+        if not contagens:
+            return [[sg.Text('Sem dados.')]]
+        return [
+            [sg.Text(f'{rotulo}:', size=(22, 1)),
+             sg.Text(f'{quantidade} ({EstatisticasEvento.percentual(quantidade, total):.1f}%)')]
+            for rotulo, quantidade in contagens.items()
+        ]
+
+    def __dados_histograma(self, estatisticas: EstatisticasEvento) -> list:
+        maior = max((quantidade for _, quantidade in estatisticas.histograma_tempos), default=0)
+        dados = []
+        for inicio_ms, quantidade in estatisticas.histograma_tempos:
+            faixa = f'{formatar_tempo_ms(inicio_ms)} - {formatar_tempo_ms(inicio_ms + LARGURA_FAIXA_HISTOGRAMA_MS)}'
+            barra = '█' * max(1, round(quantidade * self.LARGURA_BARRA_HISTOGRAMA / maior))
+            dados.append([faixa, quantidade, barra])
+        return dados
+
+    def exibir_estatisticas(self, nome_evento: str, estatisticas: EstatisticasEvento):
+        """Exibe as estatísticas de inscrições e resultados de um evento."""
+        sg.theme('DarkBlue14')
+
+        total = estatisticas.total_inscritos
+        layout_inscricoes = (
+            [[sg.Text(f'Total de Inscritos: {total}', font=('Helvetica', 13, 'bold'))],
+             [sg.Text(f'PCD: {estatisticas.inscritos_pcd} '
+                      f'({EstatisticasEvento.percentual(estatisticas.inscritos_pcd, total):.1f}%)')],
+             [sg.Text('Distribuição por Gênero:', font=('Helvetica', 12))]]
+            + self.__linhas_distribuicao(estatisticas.inscritos_por_genero, total)
+            + [[sg.Text('Distribuição por Categoria:', font=('Helvetica', 12))]]
+            + self.__linhas_distribuicao(estatisticas.inscritos_por_categoria, total)
+            + [[sg.Text('Distribuição por Kit:', font=('Helvetica', 12))]]
+            + self.__linhas_distribuicao(estatisticas.inscritos_por_kit, total)
+        )
+
+        if estatisticas.total_concluintes:
+            percentis = '   '.join(
+                f'P{percentil}: {formatar_ritmo(ritmo)}'
+                for percentil, ritmo in sorted(estatisticas.percentis_ritmo.items())
+            )
+            layout_resultados = (
+                [[sg.Text(f'Concluintes: {estatisticas.total_concluintes}', font=('Helvetica', 13, 'bold'))]]
+                + self.__linhas_distribuicao(estatisticas.concluintes_por_genero, estatisticas.total_concluintes)
+                + [[sg.Text(f'Melhor tempo: {formatar_tempo_ms(estatisticas.melhor_tempo_ms)}   '
+                            f'Tempo médio: {formatar_tempo_ms(estatisticas.tempo_medio_ms)}')],
+                   [sg.Text(f'Ritmo (min/km) - {percentis or "distância não informada"}')],
+                   [sg.Text('Tempos de Conclusão:', font=('Helvetica', 12))],
+                   [sg.Table(
+                       values=self.__dados_histograma(estatisticas),
+                       headings=['Faixa de Tempo', 'Atletas', ''],
+                       auto_size_columns=False,
+                       col_widths=[20, 8, self.LARGURA_BARRA_HISTOGRAMA],
+                       justification='left',
+                       num_rows=min(12, len(estatisticas.histograma_tempos)),
+                       display_row_numbers=False,
+                       expand_x=True,
+                       expand_y=True
+                   )]]
+            )
+        else:
+            layout_resultados = [[sg.Text('Este evento ainda não possui resultados importados.')]]
+
+        layout = [
+            [sg.Text(f'Estatísticas do Evento - {nome_evento}', font=('Helvetica', 20))],
+            [sg.Text(f'Atualizadas em {estatisticas.atualizada_em}', font=('Helvetica', 9))],
+            [sg.HorizontalSeparator()],
+            [sg.TabGroup([[
+                sg.Tab('Inscrições', [[sg.Column(layout_inscricoes, scrollable=True,
+                                                 vertical_scroll_only=True, expand_x=True, expand_y=True)]]),
+                sg.Tab('Resultados', layout_resultados)
+            ]], expand_x=True, expand_y=True)],
+            [sg.Button('Voltar', key='-VOLTAR-')]
+        ]
+
+        janela = sg.Window('PaceHub - Estatísticas do Evento', layout, size=(750, 600),
+                           finalize=True, resizable=True, modal=True)
+
+        while True:
+            evento, valores = janela.read()
+            if evento in (sg.WIN_CLOSED, '-VOLTAR-'):
+                break
+
+        janela.close()
@@ -1,7 +1,8 @@
 # limite/tela_importar_resultados.py
+import threading
 import FreeSimpleGUI as sg
 from typing import Tuple
-from controle.controlador_importacao import ControladorImportacao
+from controle.controlador_importacao import ContadorErrosImportacao, ControladorImportacao, ImportacaoCancelada
 
 
 def criar_janela_importar_resultados(evento_id: int, evento_nome: str) -> sg.Window:
@@ -45,96 +46,153 @@ def criar_janela_importar_resultados(evento_id: int, evento_nome: str) -> sg.Win
     )
 
 
-def processar_importacao(janela: sg.Window, controlador: ControladorImportacao, 
-                        evento_id: int, arquivo_csv: str) -> Tuple[bool, str]:
+def iniciar_importacao(janela: sg.Window, controlador: ControladorImportacao,
+                       evento_id: int, arquivo_csv: str,
+                       cancelamento: threading.Event) -> threading.Thread:
     """
-    Processa a importação de resultados.
+    Inicia a importação em uma thread de trabalho, mantendo a janela responsiva.
+    
+    A thread envia à janela eventos '-PROGRESSO-' (dicionário de progresso do
+    controlador) e, ao terminar, '-IMPORTACAO_FIM-' com a tupla
+    (total_importados, ContadorErrosImportacao) ou a exceção ocorrida.
     
     Args:
         janela: Janela PySimpleGUI
         controlador: Instância do ControladorImportacao
         evento_id: ID do evento
         arquivo_csv: Caminho do arquivo CSV
+        cancelamento: Evento sinalizado pelo botão Cancelar
         
     Returns:
-        Tupla (sucesso, mensagem)
+        Thread iniciada
     """
-    try:
-        print(f"\n[IMPORTACAO] Iniciando importação para evento ID: {evento_id}")
-        print(f"[IMPORTACAO] Arquivo: {arquivo_csv}")
-        
-        # Atualizar status na janela
-        janela['-STATUS-'].update("Processando arquivo...")
-        janela.refresh()
-        
-        # Processar CSV
-        total_importados, erros = controlador.processar_csv(arquivo_csv, evento_id)
-        
-        print(f"[IMPORTACAO] Processamento concluído: {total_importados} importados, {len(erros)} erros")
-        
-        # Criar mensagem de resultado
-        if erros:
-            mensagem = f"Importação concluída com avisos:\n"
-            mensagem += f"✓ {total_importados} resultados importados\n"
-            mensagem += f"⚠ {len(erros)} linhas com problemas"
-            
-            # Mostrar detalhes dos erros em popup scrollable
-            detalhes_erros = _formatar_erros_detalhados(erros)
-            sg.popup_scrolled(
-                detalhes_erros,
-                title="Detalhes da Importação",
-                size=(1280, 720)
+    print(f"\n[IMPORTACAO] Iniciando importação para evento ID: {evento_id}")
+    print(f"[IMPORTACAO] Arquivo: {arquivo_csv}")
+    
+    def enviar_evento(chave: str, valor):
+        # A janela pode ter sido fechada enquanto a thread terminava
+        if janela.is_closed():
+            return
+        try:
+            janela.write_event_value(chave, valor)
+        except Exception:
+            pass
+    
+    def executar():
+        erros = ContadorErrosImportacao()
+        try:
+            total_importados, _ = controlador.processar_csv_em_thread(
+                arquivo_csv, evento_id,
+                ao_erro=erros,
+                ao_progresso=lambda progresso: enviar_evento('-PROGRESSO-', progresso),
+                cancelamento=cancelamento
             )
-        else:
-            mensagem = f"Importação concluída com sucesso!\n✓ {total_importados} resultados importados"
-            sg.popup(mensagem, title="Importação Bem-sucedida")
+            resultado = (total_importados, erros)
+        except Exception as e:
+            resultado = e
+        enviar_evento('-IMPORTACAO_FIM-', resultado)
+    
+    thread = threading.Thread(target=executar, daemon=True)
+    thread.start()
+    return thread
+
+
+def _formatar_progresso(progresso: dict) -> str:
+    """
+    Formata o progresso da importação para a linha de status.
+    
+    Args:
+        progresso: Dicionário de progresso enviado pelo controlador
         
-        return True, mensagem
+    Returns:
+        Texto de status
+    """
+    fase = progresso['fase']
+    if fase == 'leitura':
+        return (f"Lendo arquivo... {progresso['linhas_lidas']} linhas lidas "
+                f"({progresso['linhas_validas']} válidas, {progresso['linhas_com_erro']} com erro)")
+    if fase == 'gravacao':
+        return f"Classificando e salvando {progresso['linhas_validas']} resultados..."
+    return f"{progresso['salvos']} resultados salvos."
+
+
+def concluir_importacao(resultado) -> Tuple[bool, str]:
+    """
+    Exibe o resultado de uma importação terminada na thread de trabalho.
+    
+    Args:
+        resultado: Tupla (total_importados, ContadorErrosImportacao) ou a exceção lançada
         
-    except FileNotFoundError:
+    Returns:
+        Tupla (sucesso, mensagem)
+    """
+    if isinstance(resultado, ImportacaoCancelada):
+        print("[IMPORTACAO] Cancelada pelo usuário")
+        return False, "Importação cancelada. Nenhum resultado foi alterado."
+    if isinstance(resultado, FileNotFoundError):
         erro_msg = "Arquivo não encontrado!"
         print(f"[IMPORTACAO] ERRO: {erro_msg}")
         return False, erro_msg
-    except ValueError as e:
-        erro_msg = f"Erro de validação: {e}"
+    if isinstance(resultado, ValueError):
+        erro_msg = f"Erro de validação: {resultado}"
         print(f"[IMPORTACAO] ERRO: {erro_msg}")
         return False, erro_msg
-    except Exception as e:
-        erro_msg = f"Erro inesperado: {e}"
+    if isinstance(resultado, Exception):
+        erro_msg = f"Erro inesperado: {resultado}"
         print(f"[IMPORTACAO] ERRO: {erro_msg}")
         import traceback
-        traceback.print_exc()
+        traceback.print_exception(resultado)
         return False, erro_msg
+    
+    total_importados, erros = resultado
+    print(f"[IMPORTACAO] Processamento concluído: {total_importados} importados, {erros.total} erros")
+    
+    # Criar mensagem de resultado
+    if erros.total:
+        mensagem = f"Importação concluída com avisos:\n"
+        mensagem += f"✓ {total_importados} resultados importados\n"
+        mensagem += f"⚠ {erros.total} linhas com problemas"
+        
+        # Mostrar detalhes dos erros em popup scrollable
+        detalhes_erros = _formatar_erros_detalhados(erros)
+        sg.popup_scrolled(
+            detalhes_erros,
+            title="Detalhes da Importação",
+            size=(1280, 720)
+        )
+    else:
+        mensagem = f"Importação concluída com sucesso!\n✓ {total_importados} resultados importados"
+        sg.popup(mensagem, title="Importação Bem-sucedida")
+    
+    return True, mensagem
 
 
-def _formatar_erros_detalhados(erros: list) -> str:
+def _formatar_erros_detalhados(erros: ContadorErrosImportacao) -> str:
     """
-    Formata lista de erros para exibição detalhada.
+    Formata os erros da importação para exibição detalhada.
     
     Args:
-        erros: Lista de dicionários de erro
+        erros: Contagem por tipo e primeiros exemplos de cada tipo
         
     Returns:
         String formatada com detalhes dos erros
     """
-    if not erros:
+    if not erros.total:
         return "Nenhum erro encontrado."
     
     detalhes = []
     
-    # Agrupar erros por tipo
-    erros_por_tipo = {}
-    for erro in erros:
-        tipo = erro['tipo']
-        if tipo not in erros_por_tipo:
-            erros_por_tipo[tipo] = []
-        erros_por_tipo[tipo].append(erro)
+    # Agrupar os exemplos por tipo
+    exemplos_por_tipo = {}
+    for erro in erros.exemplos:
+        exemplos_por_tipo.setdefault(erro['tipo'], []).append(erro)
     
     # Formatar cada tipo de erro
-    for tipo, lista_erros in erros_por_tipo.items():
-        detalhes.append(f"\n=== {_traduzir_tipo_erro(tipo)} ({len(lista_erros)} ocorrências) ===")
+    for tipo, quantidade in erros.erros_por_tipo.items():
+        detalhes.append(f"\n=== {_traduzir_tipo_erro(tipo)} ({quantidade} ocorrências) ===")
         
-        for erro in lista_erros[:10]:  # Limitar a 10 por tipo
+        lista_erros = exemplos_por_tipo.get(tipo, [])
+        for erro in lista_erros:
             linha = erro.get('linha', 'N/A')
             mensagem = erro['mensagem']
             dados = erro.get('dados', {})
@@ -143,8 +201,8 @@ def _formatar_erros_detalhados(erros: list) -> str:
             if dados:
                 detalhes.append(f"  Dados: {dados}")
         
-        if len(lista_erros) > 10:
-            detalhes.append(f"  ... e mais {len(lista_erros) - 10} erros similares")
+        if quantidade > len(lista_erros):
+            detalhes.append(f"  ... e mais {quantidade - len(lista_erros)} erros similares")
     
     return "\n".join(detalhes)
 
@@ -166,6 +224,7 @@ def _traduzir_tipo_erro(tipo: str) -> str:
         'atleta_nao_encontrado': 'Atleta Não Encontrado',
         'atleta_nao_inscrito': 'Atleta Não Inscrito',
         'nao_e_atleta': 'Não é Atleta',
+        'cpf_duplicado': 'CPF Duplicado',
         'erro_criacao': 'Erro na Criação'
     }
     
@@ -191,13 +250,49 @@ def executar_janela_importacao(controlador: ControladorImportacao,
         return False
     
     sucesso = False
+    thread_importacao = None
+    cancelamento = threading.Event()
     
     while True:
         event, values = janela.read()
         
-        if event in (sg.WIN_CLOSED, '-CANCELAR-'):
+        if event == sg.WIN_CLOSED:
+            # A thread em andamento para antes de gravar qualquer resultado
+            cancelamento.set()
             break
         
+        if event == '-CANCELAR-':
+            if not thread_importacao:
+                break
+            cancelamento.set()
+            janela['-STATUS-'].update("Cancelando importação...")
+            janela['-CANCELAR-'].update(disabled=True)
+            continue
+        
+        if event == '-PROGRESSO-':
+            janela['-STATUS-'].update(_formatar_progresso(values['-PROGRESSO-']))
+            continue
+        
+        if event == '-IMPORTACAO_FIM-':
+            thread_importacao = None
+            janela['-IMPORTAR-'].update(disabled=False)
+            janela['-CANCELAR-'].update(disabled=False)
+            
+            sucesso_importacao, mensagem = concluir_importacao(values['-IMPORTACAO_FIM-'])
+            
+            if sucesso_importacao:
+                janela['-STATUS-'].update("Importação concluída com sucesso!")
+                sucesso = True
+                # Aguardar um pouco antes de fechar
+                import time
+                time.sleep(1)
+                break
+            else:
+                janela['-STATUS-'].update(f"Erro: {mensagem}")
+                if not cancelamento.is_set():
+                    sg.popup_error(mensagem)
+            continue
+        
         if event == '-IMPORTAR-':
             arquivo = values['-ARQUIVO-']
             
@@ -212,19 +307,11 @@ def executar_janela_importacao(controlador: ControladorImportacao,
                 sg.popup_error(f'Arquivo inválido: {mensagem_validacao}')
                 continue
             
-            # Processar importação
-            sucesso_importacao, mensagem = processar_importacao(janela, controlador, evento_id, arquivo)
-            
-            if sucesso_importacao:
-                janela['-STATUS-'].update("Importação concluída com sucesso!")
-                sucesso = True
-                # Aguardar um pouco antes de fechar
-                import time
-                time.sleep(1)
-                break
-            else:
-                janela['-STATUS-'].update(f"Erro: {mensagem}")
-                sg.popup_error(mensagem)
+            # Processar importação em segundo plano
+            cancelamento.clear()
+            janela['-IMPORTAR-'].update(disabled=True)
+            janela['-STATUS-'].update("Processando arquivo...")
+            thread_importacao = iniciar_importacao(janela, controlador, evento_id, arquivo, cancelamento)
     
     janela.close()
     return sucesso
@@ -1,5 +1,7 @@
 import FreeSimpleGUI as sg
 
+from entidade.inscricao import gerar_token_kit
+
 
 class TelaInscricao:
 
@@ -12,7 +14,8 @@ class TelaInscricao:
         layout_busca = [
             [sg.Text('Buscar por Nome ou CPF:'),
              sg.Input(key='-INPUT_BUSCA-', size=(30, 1)),
-             sg.Button('Buscar', key='-BUSCAR-')]
+             sg.Button('Buscar', key='-BUSCAR-', bind_return_key=True)],
+            [sg.Listbox(values=[], key='-RESULTADOS_BUSCA-', size=(70, 6), enable_events=True)]
         ]
 
         coluna_atleta = sg.Column([
@@ -32,16 +35,115 @@ class TelaInscricao:
             [sg.Text(f'Gerenciar Entrega de Kits - {nome_evento}', font=('Helvetica', 20, 'bold'))],
             [sg.Frame('Buscar Inscrição', layout_busca)],
             [sg.Frame('Dados da Inscrição', layout_dados)],
-            [sg.Button('Salvar', key='-SALVAR-', disabled=True), sg.Button('Voltar', key='-VOLTAR-')]
+            [sg.Button('Salvar', key='-SALVAR-', disabled=True),
+             sg.Button('Modo Leitor', key='-MODO_LEITOR-'),
+             sg.Button('Conciliar Lista (CSV)', key='-CONCILIAR_CSV-'),
+             sg.Button('Voltar', key='-VOLTAR-')]
         ]
 
         return sg.Window('PaceHub - Gerenciar Kits', layout, finalize=True, modal=True)
 
+    def exibir_tela_leitor_kits(self, nome_evento: str):
+        """
+        Exibe a tela de entrega de kits por leitor de código de barras/QR.
+
+        O leitor funciona como teclado: digita o código no campo e envia Enter,
+        que aciona o botão '-LER-'.
+        """
+        sg.theme('DarkBlue14')
+
+        layout = [
+            [sg.Text(f'Entrega de Kits por Leitor - {nome_evento}', font=('Helvetica', 20, 'bold'))],
+            [sg.Text('Código ou CPF:'),
+             sg.Input(key='-CODIGO-', size=(30, 1), focus=True),
+             sg.Button('Ler', key='-LER-', bind_return_key=True)],
+            [sg.Text('Aguardando leitura...', key='-SITUACAO_LEITURA-', size=(50, 1),
+                     font=('Helvetica', 16, 'bold'))],
+            [sg.Text('', key='-DETALHES_LEITURA-', size=(70, 1))],
+            [sg.HSeparator()],
+            [sg.Text('', key='-CONTADORES-', size=(70, 1))],
+            [sg.Listbox(values=[], key='-HISTORICO_LEITURAS-', size=(80, 10))],
+            [sg.Button('Gravar Agora', key='-GRAVAR-'), sg.Button('Fechar', key='-FECHAR-')]
+        ]
+
+        return sg.Window('PaceHub - Modo Leitor', layout, finalize=True, modal=True)
+
+    def exibir_leitura(self, janela, situacao: str, inscricao: dict | None):
+        """Mostra o resultado da última leitura em destaque (verde para entrega, vermelho para recusa)."""
+        mensagens = {
+            'entregue': ('ENTREGAR KIT', 'light green'),
+            'ja_entregue': ('KIT JÁ ENTREGUE', 'orange'),
+            'token_invalido': ('CÓDIGO INVÁLIDO - leia novamente', 'red'),
+            'outro_evento': ('CÓDIGO DE OUTRO EVENTO', 'red'),
+            'nao_encontrado': ('INSCRIÇÃO NÃO ENCONTRADA', 'red'),
+        }
+        mensagem, cor = mensagens.get(situacao, (situacao, 'white'))
+        janela['-SITUACAO_LEITURA-'].update(mensagem, text_color=cor)
+
+        detalhes = f"{inscricao['atleta_nome']} - CPF {inscricao['atleta_cpf']} - Kit {inscricao['kit_nome']}" if inscricao else ''
+        janela['-DETALHES_LEITURA-'].update(detalhes)
+
+    def exibir_contadores_leitor(self, janela, total_inscritos: int, total_entregues: int,
+                                 entregues_na_sessao: int, pendentes: int):
+        janela['-CONTADORES-'].update(
+            f"Entregues: {total_entregues}/{total_inscritos}  |  Nesta sessão: {entregues_na_sessao}"
+            f"  |  Aguardando gravação: {pendentes}"
+        )
+
+    def formatar_resultado_busca(self, inscricao: dict) -> str:
+        """Formata uma inscrição encontrada na busca para a lista do balcão de kits."""
+        situacao_kit = 'Kit entregue' if inscricao['kit_entregue'] else 'Kit pendente'
+        return f"{inscricao['atleta_nome']} - CPF {inscricao['atleta_cpf']} - {inscricao['kit_nome']} ({situacao_kit})"
+
+    def selecionar_csv_conciliacao(self):
+        """
+        Pede o CSV de CPFs conferidos no balcão e o status a aplicar.
+
+        Returns:
+            Tupla (caminho_arquivo, kit_entregue) ou (None, None) se cancelado
+        """
+        caminho = sg.popup_get_file(
+            'Selecione o CSV com os CPFs (um por linha, na primeira coluna):',
+            title='Conciliar Lista de Kits',
+            file_types=(('Arquivos CSV', '*.csv'),)
+        )
+        if not caminho:
+            return None, None
+
+        resposta = sg.popup_yes_no(
+            'Marcar os kits destes CPFs como ENTREGUES?\n\n'
+            '(Escolha "No" para marcá-los como NÃO entregues.)',
+            title='Conciliar Lista de Kits'
+        )
+        if resposta is None:
+            return None, None
+        return caminho, resposta == 'Yes'
+
+    def exibir_resumo_conciliacao(self, resumo: dict):
+        """Exibe os totais da conciliação e os CPFs que não puderam ser aplicados."""
+        status = 'entregues' if resumo['kit_entregue'] else 'não entregues'
+        linhas = [
+            f"Kits marcados como {status}: {resumo['atualizados']}",
+            f"Já estavam {status}: {resumo['inalterados']}",
+            f"CPFs sem inscrição no evento: {resumo['nao_encontrados']}",
+            f"Linhas inválidas: {resumo['linhas_invalidas']}",
+        ]
+
+        detalhes = [f"CPF {cpf}: sem inscrição no evento" for cpf in resumo['cpfs_nao_encontrados']]
+        detalhes += [f"Linha {erro['linha']}: {erro['mensagem']}" for erro in resumo['erros']]
+        if detalhes:
+            linhas.append('')
+            linhas.extend(detalhes[:20])
+            if len(detalhes) > 20:
+                linhas.append(f"... e mais {len(detalhes) - 20}")
+
+        sg.popup_scrolled('\n'.join(linhas), title='Conciliação de Kits', size=(70, 20))
+
     def exibir_lista_inscritos(self, nome_evento: str, dados_inscritos: list):
         """Exibe uma janela com a lista de inscritos no evento."""
         sg.theme('DarkBlue14')
 
-        cabecalhos = ['Nome', 'CPF', 'Data Inscrição', 'Kit', 'Status']
+        cabecalhos = ['Nome', 'CPF', 'Data Inscrição', 'Kit', 'Status', 'Código do Kit']
 
         # Preparar dados para a tabela
         dados_tabela = []
@@ -63,7 +165,8 @@ class TelaInscricao:
                 inscricao['atleta_cpf'],
                 data_formatada,
                 inscricao['kit_nome'],
-                status
+                status,
+                gerar_token_kit(inscricao['evento_id'], inscricao['id'])
             ])
 
         layout = [
@@ -74,7 +177,7 @@ class TelaInscricao:
                 values=dados_tabela,
                 headings=cabecalhos,
                 auto_size_columns=False,
-                col_widths=[30, 15, 18, 25, 12],
+                col_widths=[30, 15, 18, 25, 12, 18],
                 justification='left',
                 num_rows=min(15, len(dados_tabela)) if dados_tabela else 1,
                 display_row_numbers=False,
@@ -89,7 +192,7 @@ class TelaInscricao:
             f'PaceHub - Lista de Inscritos - {nome_evento}',
             layout,
             finalize=True,
-            size=(900, 600),
+            size=(1050, 600),
             resizable=True
         )
 
@@ -28,7 +28,8 @@ class TelaOrganizador:
              sg.Button('Importar Tempo dos Participantes', key='-IMPORTAR_TEMPOS-')],
             [sg.Button('Ver Resultados por Categoria', key='-VER_RESULTADOS-'),
              sg.Button('Visualizar Lista de Inscritos', key='-VER_INSCRITOS-'),
-             sg.Button('Publicar Resultados da Corrida', key='-PUBLICAR_RESULTADOS-')]
+             sg.Button('Publicar Resultados da Corrida', key='-PUBLICAR_RESULTADOS-')],
+            [sg.Button('Ver Estatísticas do Evento', key='-VER_ESTATISTICAS-')]
         ]
 
         # Coluna com botões à direita (mesmo tamanho)
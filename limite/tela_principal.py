@@ -1,5 +1,4 @@
 # limite/tela_principal_psg.py
-import FreeSimpleGUI as sg
 
 
 class TelaPrincipal:
@@ -8,6 +7,10 @@ class TelaPrincipal:
         pass
 
     def exibir_janela_login(self):
+        # Carregado só ao desenhar a janela: a partida (migrações e controlador)
+        # não espera pelo FreeSimpleGUI
+        import FreeSimpleGUI as sg
+
         sg.theme('DarkBlue14')
 
         layout_login = [
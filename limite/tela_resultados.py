@@ -1,218 +1,72 @@
 import FreeSimpleGUI as sg
-from entidade.resultado import Resultado, separar_resultados_por_categoria, separar_resultados_por_genero, ordenar_resultados_por_tempo
+from entidade.quadro_resultados import ORDEM_CATEGORIAS, QuadroResultados
 
 
 class TelaResultados:
     def __init__(self):
         pass
 
-    def _criar_tabela_resultados(self, resultados, mostrar_classificacao=True):
+    def _criar_layout_aba(self, linhas_masculino: list, linhas_feminino: list,
+                          col_widths: list, mensagem_vazia: str) -> list:
         """
-        Cria uma tabela com os resultados.
-        
+        Cria o layout de uma aba com as tabelas do masculino e do feminino.
+
         Args:
-            resultados: Lista de objetos Resultado
-            mostrar_classificacao: Se deve mostrar coluna de classificação
-            
+            linhas_masculino: Linhas (nome, tempo, classificação) do masculino
+            linhas_feminino: Linhas (nome, tempo, classificação) do feminino
+            col_widths: Larguras das colunas
+            mensagem_vazia: Texto exibido quando não há resultados
+
         Returns:
-            Lista de dados para a tabela
+            Layout da aba
         """
-        dados = []
-        for resultado in resultados:
-            classificacao = ""
-            if mostrar_classificacao:
-                if resultado.classificacao_geral:
-                    classificacao = f"Geral: {resultado.classificacao_geral}º"
-                elif resultado.classificacao_categoria:
-                    classificacao = f"{resultado.classificacao_categoria}º"
-            
-            linha = [resultado.nome_atleta, resultado.tempo_final]
-            if mostrar_classificacao:
-                linha.append(classificacao)
-            dados.append(linha)
-        
-        return dados
+        if not linhas_masculino and not linhas_feminino:
+            return [[sg.Text(mensagem_vazia, font=('Helvetica', 12))]]
+
+        layout = []
+        cabecalhos = ['Nome', 'Tempo', 'Classificação']
+        for titulo, linhas in (('Masculino', linhas_masculino), ('Feminino', linhas_feminino)):
+            if not linhas:
+                continue
+            if layout:
+                layout.append([sg.Text('')])  # Espaçamento
+            layout.append([sg.Text(titulo, font=('Helvetica', 14, 'bold'))])
+            layout.append([sg.Table(
+                values=linhas,
+                headings=cabecalhos,
+                auto_size_columns=False,
+                col_widths=col_widths,
+                justification='left',
+                num_rows=min(10, len(linhas)),
+                display_row_numbers=False,
+                expand_x=True
+            )])
+        return layout
 
-    def exibir_resultados_por_categoria(self, nome_evento: str, resultados: list):
+    def exibir_resultados_por_categoria(self, nome_evento: str, quadro: QuadroResultados):
         """
         Exibe uma janela com os resultados do evento separados por categoria em abas.
-        Aba Geral mostra top 5 de cada gênero.
+        Aba Geral mostra top 5 de cada gênero (sem PCD).
         Atletas no top 5 não aparecem nas categorias normais.
+        Atletas PCD aparecem todos na aba PCD.
         Todas as abas são sempre exibidas, mesmo que vazias.
         Cada aba separa resultados por gênero.
         
         Args:
             nome_evento: Nome do evento
-            resultados: Lista de objetos Resultado
+            quadro: Tabelas já separadas e ordenadas pelo ResultadoDAO
         """
         sg.theme('DarkBlue14')
         
-        # Separar por gênero primeiro
-        masculino, feminino = separar_resultados_por_genero(resultados)
-        
-        # Ordenar por tempo
-        masculino_ordenado = ordenar_resultados_por_tempo(masculino)
-        feminino_ordenado = ordenar_resultados_por_tempo(feminino)
-        
-        # Top 5 de cada gênero para categoria Geral
-        top5_masculino = masculino_ordenado[:5]
-        top5_feminino = feminino_ordenado[:5]
-        
-        # Criar conjunto de CPFs dos top 5 para filtrar das categorias normais
-        cpfs_top5 = set()
-        for resultado in top5_masculino:
-            cpfs_top5.add(resultado.cpf_atleta)
-        for resultado in top5_feminino:
-            cpfs_top5.add(resultado.cpf_atleta)
-        
-        # Filtrar resultados que não estão no top 5
-        resultados_sem_top5 = [r for r in resultados if r.cpf_atleta not in cpfs_top5]
-        
-        # Separar resultados restantes por categoria
-        resultados_por_categoria = separar_resultados_por_categoria(resultados_sem_top5)
-        
-        # Ordenar cada categoria por tempo
-        for categoria in resultados_por_categoria:
-            resultados_por_categoria[categoria] = ordenar_resultados_por_tempo(resultados_por_categoria[categoria])
-        
-        # Criar aba Geral com separação por gênero
-        dados_masc_geral = []
-        dados_fem_geral = []
-        
-        # Preparar dados top 5 masculino
-        for i, resultado in enumerate(top5_masculino, 1):
-            classificacao = f"Geral: {i}º"
-            dados_masc_geral.append([
-                resultado.nome_atleta,
-                resultado.tempo_final,
-                classificacao
-            ])
-        
-        # Preparar dados top 5 feminino
-        for i, resultado in enumerate(top5_feminino, 1):
-            classificacao = f"Geral: {i}º"
-            dados_fem_geral.append([
-                resultado.nome_atleta,
-                resultado.tempo_final,
-                classificacao
-            ])
-        
-        # Layout da aba Geral
-        layout_geral = []
-        cabecalhos_geral = ['Nome', 'Tempo', 'Classificação']
-        
-        if dados_masc_geral or dados_fem_geral:
-            if dados_masc_geral:
-                layout_geral.append([sg.Text('Masculino', font=('Helvetica', 14, 'bold'))])
-                layout_geral.append([sg.Table(
-                    values=dados_masc_geral,
-                    headings=cabecalhos_geral,
-                    auto_size_columns=False,
-                    col_widths=[40, 15, 20],
-                    justification='left',
-                    num_rows=min(10, len(dados_masc_geral)),
-                    display_row_numbers=False,
-                    expand_x=True
-                )])
-            
-            if dados_fem_geral:
-                if dados_masc_geral:
-                    layout_geral.append([sg.Text('')])  # Espaçamento
-                layout_geral.append([sg.Text('Feminino', font=('Helvetica', 14, 'bold'))])
-                layout_geral.append([sg.Table(
-                    values=dados_fem_geral,
-                    headings=cabecalhos_geral,
-                    auto_size_columns=False,
-                    col_widths=[40, 15, 20],
-                    justification='left',
-                    num_rows=min(10, len(dados_fem_geral)),
-                    display_row_numbers=False,
-                    expand_x=True
-                )])
-        else:
-            layout_geral.append([sg.Text('Nenhum resultado encontrado.', font=('Helvetica', 12))])
-        
         # Criar abas para todas as categorias
-        tabs = [sg.Tab('Geral', layout_geral, key='-TAB_GERAL-')]
-        
-        # Ordem das categorias
-        ordem_categorias = ['Júnior', 'Adulto', 'Master', 'PCD']
-        
-        for categoria in ordem_categorias:
-            # Buscar resultados da categoria (pode estar vazio)
-            resultados_categoria = resultados_por_categoria.get(categoria, [])
-            
-            # Separar por gênero dentro da categoria
-            masc_cat, fem_cat = separar_resultados_por_genero(resultados_categoria)
-            
-            # Ordenar por tempo
-            masc_cat = ordenar_resultados_por_tempo(masc_cat)
-            fem_cat = ordenar_resultados_por_tempo(fem_cat)
-            
-            # Preparar dados
-            dados_masc = []
-            dados_fem = []
-            
-            # Adicionar resultados masculinos
-            for resultado in masc_cat:
-                classificacao = ""
-                if resultado.classificacao_categoria:
-                    classificacao = f"{resultado.classificacao_categoria}º"
-                
-                dados_masc.append([
-                    resultado.nome_atleta,
-                    resultado.tempo_final,
-                    classificacao
-                ])
-            
-            # Adicionar resultados femininos
-            for resultado in fem_cat:
-                classificacao = ""
-                if resultado.classificacao_categoria:
-                    classificacao = f"{resultado.classificacao_categoria}º"
-                
-                dados_fem.append([
-                    resultado.nome_atleta,
-                    resultado.tempo_final,
-                    classificacao
-                ])
-            
-            # Criar layout da categoria com separação por gênero
-            layout_categoria = []
-            cabecalhos = ['Nome', 'Tempo', 'Classificação']
-            
-            if dados_masc or dados_fem:
-                if dados_masc:
-                    layout_categoria.append([sg.Text('Masculino', font=('Helvetica', 14, 'bold'))])
-                    layout_categoria.append([sg.Table(
-                        values=dados_masc,
-                        headings=cabecalhos,
-                        auto_size_columns=False,
-                        col_widths=[40, 15, 15],
-                        justification='left',
-                        num_rows=min(10, len(dados_masc)),
-                        display_row_numbers=False,
-                        expand_x=True
-                    )])
-                
-                if dados_fem:
-                    if dados_masc:
-                        layout_categoria.append([sg.Text('')])  # Espaçamento
-                    layout_categoria.append([sg.Text('Feminino', font=('Helvetica', 14, 'bold'))])
-                    layout_categoria.append([sg.Table(
-                        values=dados_fem,
-                        headings=cabecalhos,
-                        auto_size_columns=False,
-                        col_widths=[40, 15, 15],
-                        justification='left',
-                        num_rows=min(10, len(dados_fem)),
-                        display_row_numbers=False,
-                        expand_x=True
-                    )])
-            else:
-                layout_categoria.append([sg.Text('Nenhum resultado nesta categoria.', font=('Helvetica', 12))])
-            
-            tabs.append(sg.Tab(categoria, layout_categoria, key=f'-TAB_{categoria}-'))
+        tabs = [sg.Tab('Geral', self._criar_layout_aba(
+            *quadro.tabelas('Geral'), [40, 15, 20], 'Nenhum resultado encontrado.'
+        ), key='-TAB_GERAL-')]
+        
+        for categoria in ORDEM_CATEGORIAS:
+            tabs.append(sg.Tab(categoria, self._criar_layout_aba(
+                *quadro.tabelas(categoria), [40, 15, 15], 'Nenhum resultado nesta categoria.'
+            ), key=f'-TAB_{categoria}-'))
         
         # Criar grupo de abas
         tab_group = sg.TabGroup([tabs], key='-TAB_GROUP-', expand_x=True, expand_y=True)
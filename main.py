@@ -1,5 +1,7 @@
 from controle.controlador_sistema import ControladorSistema
+from persistencia.migracoes import aplicar_migracoes
 
 if __name__ == '__main__':
+    aplicar_migracoes()
     sistema = ControladorSistema()
-    sistema.iniciar()
\ No newline at end of file
+    sistema.iniciar()
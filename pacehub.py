@@ -0,0 +1,180 @@
+"""
+Ponto de entrada de linha de comando do PaceHub (sem interface gráfica).
+
+Permite importar resultados e consultar classificações a partir de scripts,
+sem carregar o FreeSimpleGUI.
+
+Uso:
+    python -m pacehub import --evento 42 resultados.csv
+    python -m pacehub ranking --evento 42
+    python -m pacehub kits --evento 42 cpfs_entregues.csv
+
+A saída padrão recebe apenas o resumo em JSON; os registros de andamento dos
+controladores e as linhas rejeitadas na importação vão para a saída de erro.
+
+Códigos de saída:
+    0 - sucesso
+    1 - importação (ou conciliação de kits) concluída, mas com linhas rejeitadas
+    2 - falha (arquivo, evento ou banco)
+"""
+import argparse
+import contextlib
+import json
+import sys
+
+from controle.controlador_entrega_kits import ControladorEntregaKits
+from controle.controlador_importacao import ContadorErrosImportacao, ControladorImportacao
+from persistencia.conexao import DB_PATH_PADRAO
+from persistencia.estatistica_dao import EstatisticaDAO
+from persistencia.evento_dao import EventoDAO
+from persistencia.inscricao_dao import InscricaoDAO
+from persistencia.migracoes import aplicar_migracoes
+from persistencia.resultado_dao import ResultadoDAO
+from persistencia.usuario_dao import UsuarioDAO
+
+SAIDA_SUCESSO = 0
+SAIDA_COM_ERROS = 1
+SAIDA_FALHA = 2
+
+
+def criar_controlador_importacao(db_path: str) -> ControladorImportacao:
+    """Cria o controlador de importação com DAOs apontando para o banco informado."""
+    return ControladorImportacao(
+        ResultadoDAO(db_path),
+        InscricaoDAO(db_path),
+        UsuarioDAO(db_path),
+        EventoDAO(db_path),
+        EstatisticaDAO(db_path)
+    )
+
+
+def imprimir_json(dados: dict):
+    print(json.dumps(dados, ensure_ascii=False, indent=2))
+
+
+def comando_importar(args) -> int:
+    """Importa um CSV de resultados e imprime o resumo da importação."""
+    controlador = criar_controlador_importacao(args.banco)
+
+    arquivo_valido, mensagem = controlador.validar_arquivo_csv(args.arquivo)
+    if not arquivo_valido:
+        imprimir_json({'evento_id': args.evento, 'arquivo': args.arquivo, 'erro': mensagem})
+        return SAIDA_FALHA
+
+    # Cada linha rejeitada vai para a saída de erro assim que é encontrada; o
+    # resumo traz apenas as contagens e os primeiros exemplos de cada tipo
+    erros = ContadorErrosImportacao(
+        lambda erro: print(f"[ERRO] Linha {erro['linha']}: {erro['mensagem']}", file=sys.stderr)
+    )
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            total_importados, _ = controlador.processar_csv(args.arquivo, args.evento, ao_erro=erros)
+    except Exception as e:
+        imprimir_json({'evento_id': args.evento, 'arquivo': args.arquivo, 'erro': str(e)})
+        return SAIDA_FALHA
+
+    resumo = controlador.obter_resumo_importacao(total_importados, erros.erros_por_tipo)
+    resumo['evento_id'] = args.evento
+    resumo['arquivo'] = args.arquivo
+    resumo['erros'] = [
+        {'linha': erro['linha'], 'tipo': erro['tipo'], 'mensagem': erro['mensagem']}
+        for erro in erros.exemplos
+    ]
+    imprimir_json(resumo)
+
+    return SAIDA_SUCESSO if resumo['sucesso'] else SAIDA_COM_ERROS
+
+
+def comando_ranking(args) -> int:
+    """Imprime os resultados classificados de um evento."""
+    evento = EventoDAO(args.banco).get_by_id(args.evento)
+    if not evento:
+        imprimir_json({'evento_id': args.evento, 'erro': f'Evento com ID {args.evento} não encontrado'})
+        return SAIDA_FALHA
+
+    resultados = ResultadoDAO(args.banco).buscar_lote_resultados_por_evento(args.evento)
+    imprimir_json({
+        'evento_id': evento.id,
+        'evento_nome': evento.nome,
+        'resultados_publicados': bool(evento.resultados_publicados),
+        'total_resultados': len(resultados),
+        'resultados': [
+            {
+                'cpf_atleta': resultado.cpf_atleta,
+                'nome_atleta': resultado.nome_atleta,
+                'genero_atleta': resultado.genero_atleta,
+                'categoria': resultado.categoria,
+                'pcd': bool(resultado.pcd),
+                'tempo_final': resultado.tempo_final,
+                'classificacao_geral': resultado.classificacao_geral,
+                'classificacao_categoria': resultado.classificacao_categoria
+            }
+            for resultado in resultados
+        ]
+    })
+    return SAIDA_SUCESSO
+
+
+def comando_kits(args) -> int:
+    """Marca os kits dos CPFs de um CSV como entregues (ou não entregues) e imprime a situação de cada um."""
+    if EventoDAO(args.banco).get_by_id(args.evento) is None:
+        imprimir_json({'evento_id': args.evento, 'erro': f'Evento com ID {args.evento} não encontrado'})
+        return SAIDA_FALHA
+
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            controlador = ControladorEntregaKits(InscricaoDAO(args.banco), args.evento)
+            resumo = controlador.conciliar_cpfs_csv(args.arquivo, not args.nao_entregue)
+    except Exception as e:
+        imprimir_json({'evento_id': args.evento, 'arquivo': args.arquivo, 'erro': str(e)})
+        return SAIDA_FALHA
+
+    resumo['arquivo'] = args.arquivo
+    imprimir_json(resumo)
+
+    if resumo['nao_encontrados'] or resumo['linhas_invalidas']:
+        return SAIDA_COM_ERROS
+    return SAIDA_SUCESSO
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='pacehub',
+        description='Importação e classificação de resultados do PaceHub sem interface gráfica.'
+    )
+    parser.add_argument('--banco', default=DB_PATH_PADRAO,
+                        help=f'arquivo do banco SQLite (padrão: {DB_PATH_PADRAO})')
+    subparsers = parser.add_subparsers(dest='comando', required=True)
+
+    parser_importar = subparsers.add_parser('import', help='importa um CSV de resultados (CPF,Tempo)')
+    parser_importar.add_argument('--evento', type=int, required=True, help='ID do evento')
+    parser_importar.add_argument('arquivo', help='caminho do arquivo CSV')
+    parser_importar.set_defaults(funcao=comando_importar)
+
+    parser_ranking = subparsers.add_parser('ranking', help='exibe a classificação salva de um evento')
+    parser_ranking.add_argument('--evento', type=int, required=True, help='ID do evento')
+    parser_ranking.set_defaults(funcao=comando_ranking)
+
+    parser_kits = subparsers.add_parser('kits', help='concilia a entrega de kits a partir de um CSV de CPFs')
+    parser_kits.add_argument('--evento', type=int, required=True, help='ID do evento')
+    parser_kits.add_argument('--nao-entregue', action='store_true',
+                             help='marca os kits como não entregues (padrão: entregues)')
+    parser_kits.add_argument('arquivo', help='caminho do arquivo CSV (CPF na primeira coluna)')
+    parser_kits.set_defaults(funcao=comando_kits)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = criar_parser().parse_args(argv)
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            aplicar_migracoes(args.banco)
+    except Exception as e:
+        imprimir_json({'erro': f'Erro ao migrar o banco: {e}'})
+        return SAIDA_FALHA
+    return args.funcao(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,220 @@
+# persistencia/conexao.py
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Optional, Tuple
+
+DB_PATH_PADRAO = 'banco.db'
+
+# Aplicados uma única vez, na abertura de cada conexão
+PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -16000",     # ~16 MB
+    "PRAGMA mmap_size = 134217728",   # 128 MB
+)
+
+# Tempo máximo (ms) que uma conexão espera por um bloqueio antes de falhar com
+# "database is locked"; no modo WAL apenas escritores disputam o bloqueio
+BUSY_TIMEOUT_MS_PADRAO = 5000
+
+# Páginas acumuladas no WAL que disparam um checkpoint automático (PASSIVE) ao
+# final de uma transação; 0 desativa
+WAL_AUTOCHECKPOINT_PADRAO = 1000
+
+MODOS_CHECKPOINT = ('PASSIVE', 'FULL', 'RESTART', 'TRUNCATE')
+
+
+class GerenciadorConexao:
+    """
+    Gerencia as conexões SQLite compartilhadas por todos os DAOs.
+
+    Mantém uma conexão por thread para cada arquivo de banco, configurada uma
+    única vez com os PRAGMAs do sistema, e oferece transações que podem
+    envolver vários DAOs.
+
+    O banco opera em modo WAL: leitores (painel do atleta, balcão de kits) não
+    são bloqueados por uma importação em andamento e enxergam os dados
+    confirmados até o início da leitura.
+    """
+
+    __instancias = {}
+    __trava = threading.Lock()
+
+    @classmethod
+    def para(cls, db_path: str = DB_PATH_PADRAO) -> 'GerenciadorConexao':
+        """
+        Retorna o gerenciador associado a um arquivo de banco (um por caminho).
+
+        Args:
+            db_path: Caminho do arquivo SQLite
+
+        Returns:
+            Instância compartilhada de GerenciadorConexao
+        """
+        with cls.__trava:
+            gerenciador = cls.__instancias.get(db_path)
+            if gerenciador is None:
+                gerenciador = cls(db_path)
+                cls.__instancias[db_path] = gerenciador
+            return gerenciador
+
+    def __init__(self, db_path: str = DB_PATH_PADRAO):
+        self.__db_path = db_path
+        self.__local = threading.local()
+        self.__busy_timeout_ms = BUSY_TIMEOUT_MS_PADRAO
+        self.__wal_autocheckpoint = WAL_AUTOCHECKPOINT_PADRAO
+
+    @property
+    def db_path(self) -> str:
+        return self.__db_path
+
+    @property
+    def busy_timeout_ms(self) -> int:
+        return self.__busy_timeout_ms
+
+    @property
+    def wal_autocheckpoint(self) -> int:
+        return self.__wal_autocheckpoint
+
+    def configurar(self, busy_timeout_ms: Optional[int] = None,
+                   wal_autocheckpoint: Optional[int] = None):
+        """
+        Ajusta a espera por bloqueios e a política de checkpoint automático.
+
+        Vale para as conexões abertas a partir de então e para a conexão já
+        aberta pela thread atual.
+
+        Args:
+            busy_timeout_ms: Espera máxima por um bloqueio, em milissegundos
+            wal_autocheckpoint: Páginas no WAL que disparam o checkpoint automático (0 desativa)
+        """
+        if busy_timeout_ms is not None:
+            if busy_timeout_ms < 0:
+                raise ValueError("busy_timeout_ms não pode ser negativo")
+            self.__busy_timeout_ms = int(busy_timeout_ms)
+        if wal_autocheckpoint is not None:
+            if wal_autocheckpoint < 0:
+                raise ValueError("wal_autocheckpoint não pode ser negativo")
+            self.__wal_autocheckpoint = int(wal_autocheckpoint)
+
+        conexao = getattr(self.__local, 'conexao', None)
+        if conexao is not None:
+            self.__aplicar_configuracao(conexao)
+
+    def __aplicar_configuracao(self, conexao: sqlite3.Connection):
+        conexao.execute(f"PRAGMA busy_timeout = {self.__busy_timeout_ms}")
+        conexao.execute(f"PRAGMA wal_autocheckpoint = {self.__wal_autocheckpoint}")
+
+    def conexao(self) -> sqlite3.Connection:
+        """
+        Retorna a conexão da thread atual, abrindo-a na primeira chamada.
+
+        A conexão fica em modo autocommit: comandos fora de transacao() são
+        confirmados imediatamente.
+        """
+        conexao = getattr(self.__local, 'conexao', None)
+        if conexao is None:
+            conexao = sqlite3.connect(self.__db_path, isolation_level=None)
+            conexao.row_factory = sqlite3.Row
+            for pragma in PRAGMAS:
+                conexao.execute(pragma)
+            self.__aplicar_configuracao(conexao)
+            self.__local.conexao = conexao
+            self.__local.profundidade = 0
+            self.__local.abortada = False
+        return conexao
+
+    @contextmanager
+    def transacao(self, imediata: bool = False):
+        """
+        Abre uma transação na conexão da thread atual.
+
+        Transações podem ser aninhadas: apenas a mais externa emite COMMIT ou
+        ROLLBACK (e define se é imediata). Se um bloco interno terminar com
+        exceção, a transação inteira é desfeita ao final, mesmo que a exceção
+        tenha sido tratada por quem chamou.
+
+        Args:
+            imediata: Reserva a escrita já no início (BEGIN IMMEDIATE). Deve ser
+                usado por toda transação que grava: uma transação adiada que lê
+                e depois tenta gravar enquanto outra conexão gravou falha com
+                SQLITE_BUSY_SNAPSHOT, que o busy timeout não repete. Com
+                BEGIN IMMEDIATE a espera ocorre no início, dentro do busy timeout.
+
+        Yields:
+            Conexão SQLite da thread atual
+        """
+        conexao = self.conexao()
+        externa = self.__local.profundidade == 0
+        if externa:
+            conexao.execute("BEGIN IMMEDIATE" if imediata else "BEGIN")
+            self.__local.abortada = False
+        self.__local.profundidade += 1
+        try:
+            yield conexao
+        except BaseException:
+            self.__local.profundidade -= 1
+            if externa:
+                conexao.execute("ROLLBACK")
+            else:
+                self.__local.abortada = True
+            raise
+        self.__local.profundidade -= 1
+        if externa:
+            if self.__local.abortada:
+                conexao.execute("ROLLBACK")
+                raise sqlite3.OperationalError("Transação desfeita por falha em uma operação interna.")
+            conexao.execute("COMMIT")
+
+    def checkpoint(self, modo: str = 'PASSIVE') -> Tuple[int, int, int]:
+        """
+        Copia as páginas do WAL para o arquivo do banco.
+
+        PASSIVE não espera por leitores; TRUNCATE espera (até o busy timeout)
+        e, se conseguir concluir, zera o arquivo -wal.
+
+        Args:
+            modo: 'PASSIVE', 'FULL', 'RESTART' ou 'TRUNCATE'
+
+        Returns:
+            Tupla (ocupado, paginas_no_wal, paginas_copiadas) do PRAGMA wal_checkpoint;
+            ocupado = 1 indica que o checkpoint não pôde ser concluído
+        """
+        modo = modo.upper()
+        if modo not in MODOS_CHECKPOINT:
+            raise ValueError(f"Modo de checkpoint inválido: {modo}")
+        return tuple(self.conexao().execute(f"PRAGMA wal_checkpoint({modo})").fetchone())
+
+    def fechar(self):
+        """Fecha a conexão da thread atual, se houver."""
+        conexao = getattr(self.__local, 'conexao', None)
+        if conexao is not None:
+            conexao.close()
+            self.__local.conexao = None
+
+    @classmethod
+    def fechar_conexoes_da_thread(cls):
+        """
+        Fecha as conexões abertas pela thread atual em todos os bancos.
+
+        Deve ser chamado ao final de threads de trabalho, já que cada thread
+        mantém suas próprias conexões.
+        """
+        with cls.__trava:
+            gerenciadores = list(cls.__instancias.values())
+        for gerenciador in gerenciadores:
+            gerenciador.fechar()
+
+
+def transacao(db_path: str = DB_PATH_PADRAO, imediata: bool = False):
+    """
+    Atalho para abrir uma transação envolvendo vários DAOs do mesmo banco.
+
+    Exemplo:
+        with transacao(db_path, imediata=True):
+            inscricao_dao.add(inscricao)
+            ficha_medica_dao.add(ficha_medica)
+    """
+    return GerenciadorConexao.para(db_path).transacao(imediata)
@@ -0,0 +1,217 @@
+# persistencia/estatistica_dao.py
+import json
+import sqlite3
+from datetime import datetime
+from typing import Optional
+
+from entidade.atleta import ano_do_evento, resolver_categoria
+from entidade.estatisticas_evento import (
+    EstatisticasEvento, LARGURA_FAIXA_HISTOGRAMA_MS, PERCENTIS_RITMO, posicao_percentil
+)
+from persistencia.conexao import GerenciadorConexao
+
+SEM_INFORMACAO = 'Não informado'
+
+
+class EstatisticaDAO:
+    """
+    Estatísticas por evento, consolidadas na tabela EstatisticasEventos.
+
+    Gatilhos no banco marcam como desatualizada a seção (inscrições ou
+    resultados) afetada por cada alteração. A leitura de um evento em dia é uma
+    única linha; apenas as seções desatualizadas são recalculadas, com
+    agregações em SQL.
+    """
+
+    def __init__(self, db_path='banco.db'):
+        self.__banco = GerenciadorConexao.para(db_path)
+
+    def __conectar(self):
+        return self.__banco.conexao()
+
+    def obter(self, evento_id: int) -> Optional[EstatisticasEvento]:
+        """
+        Retorna as estatísticas do evento, recalculando antes as seções desatualizadas.
+
+        Args:
+            evento_id: ID do evento
+
+        Returns:
+            EstatisticasEvento ou None se o evento não existir ou houver erro
+        """
+        try:
+            linha = self.__conectar().execute(
+                "SELECT * FROM EstatisticasEventos WHERE evento_id = ?;", (evento_id,)
+            ).fetchone()
+            if linha and not linha['inscricoes_desatualizadas'] and not linha['resultados_desatualizados']:
+                return self.__montar_estatisticas(linha)
+
+        except sqlite3.Error as e:
+            print(f"Erro ao buscar estatísticas do evento: {e}")
+            return None
+
+        return self.atualizar(evento_id)
+
+    def atualizar(self, evento_id: int) -> Optional[EstatisticasEvento]:
+        """
+        Recalcula e grava as seções desatualizadas das estatísticas do evento.
+
+        Args:
+            evento_id: ID do evento
+
+        Returns:
+            EstatisticasEvento atualizadas ou None se o evento não existir ou houver erro
+        """
+        try:
+            with self.__banco.transacao(imediata=True) as conexao:
+                evento = conexao.execute(
+                    "SELECT data, distancia FROM Eventos WHERE id = ?;", (evento_id,)
+                ).fetchone()
+                if evento is None:
+                    return None
+
+                linha = conexao.execute(
+                    "SELECT * FROM EstatisticasEventos WHERE evento_id = ?;", (evento_id,)
+                ).fetchone()
+
+                if linha and linha['inscricoes'] and not linha['inscricoes_desatualizadas']:
+                    inscricoes = linha['inscricoes']
+                else:
+                    inscricoes = json.dumps(self.__calcular_inscricoes(conexao, evento_id, evento['data']))
+
+                if linha and linha['resultados'] and not linha['resultados_desatualizados']:
+                    resultados = linha['resultados']
+                else:
+                    resultados = json.dumps(self.__calcular_resultados(conexao, evento_id, evento['distancia']))
+
+                atualizada_em = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                conexao.execute("""
+                    INSERT OR REPLACE INTO EstatisticasEventos
+                    (evento_id, inscricoes, resultados, inscricoes_desatualizadas,
+                     resultados_desatualizados, atualizada_em)
+                    VALUES (?, ?, ?, 0, 0, ?);
+                """, (evento_id, inscricoes, resultados, atualizada_em))
+
+            return EstatisticasEvento(evento_id, json.loads(inscricoes), json.loads(resultados), atualizada_em)
+
+        except sqlite3.Error as e:
+            print(f"Erro ao atualizar estatísticas do evento: {e}")
+            return None
+
+    @staticmethod
+    def __montar_estatisticas(linha) -> EstatisticasEvento:
+        return EstatisticasEvento(
+            linha['evento_id'],
+            json.loads(linha['inscricoes']),
+            json.loads(linha['resultados']),
+            linha['atualizada_em']
+        )
+
+    @staticmethod
+    def __calcular_inscricoes(conexao: sqlite3.Connection, evento_id: int, data_evento: str) -> dict:
+        """Contagens de inscritos por gênero, categoria, kit e PCD."""
+        por_genero = {
+            genero or SEM_INFORMACAO: total
+            for genero, total in conexao.execute("""
+                SELECT u.genero, COUNT(*)
+                FROM Inscricoes i JOIN usuarios u ON u.cpf = i.atleta_cpf
+                WHERE i.evento_id = ?
+                GROUP BY u.genero ORDER BY COUNT(*) DESC;
+            """, (evento_id,))
+        }
+
+        por_kit = {
+            kit: total
+            for kit, total in conexao.execute("""
+                SELECT k.nome, COUNT(*)
+                FROM Inscricoes i JOIN KitsDeCorrida k ON k.id = i.kit_id
+                WHERE i.evento_id = ?
+                GROUP BY k.nome ORDER BY COUNT(*) DESC;
+            """, (evento_id,))
+        }
+
+        # A categoria depende só do ano de nascimento e de PCD: o banco agrupa por
+        # esses dois valores e as regras de RN07 são aplicadas a cada grupo
+        try:
+            ano_evento = ano_do_evento(data_evento)
+        except ValueError:
+            ano_evento = None
+
+        por_categoria = {}
+        pcd = 0
+        for ano_nascimento, eh_pcd, total in conexao.execute("""
+            SELECT CAST(CASE WHEN u.data_nascimento LIKE '__/__/____'
+                             THEN substr(u.data_nascimento, 7, 4)
+                             ELSE substr(u.data_nascimento, 1, 4) END AS INTEGER) AS ano,
+                   COALESCE(u.pcd, 0) AS pcd,
+                   COUNT(*)
+            FROM Inscricoes i JOIN usuarios u ON u.cpf = i.atleta_cpf
+            WHERE i.evento_id = ?
+            GROUP BY ano, pcd;
+        """, (evento_id,)):
+            if eh_pcd:
+                pcd += total
+            if eh_pcd or (ano_nascimento and ano_evento):
+                categoria = resolver_categoria(ano_nascimento, ano_evento, bool(eh_pcd))
+            else:
+                categoria = SEM_INFORMACAO
+            por_categoria[categoria] = por_categoria.get(categoria, 0) + total
+
+        return {
+            'total': sum(por_genero.values()),
+            'por_genero': por_genero,
+            'por_categoria': por_categoria,
+            'por_kit': por_kit,
+            'pcd': pcd
+        }
+
+    @staticmethod
+    def __calcular_resultados(conexao: sqlite3.Connection, evento_id: int, distancia_km) -> dict:
+        """Concluintes por gênero, melhor tempo, tempo médio, histograma e percentis de ritmo."""
+        total, melhor_tempo_ms, tempo_medio_ms = conexao.execute("""
+            SELECT COUNT(*), MIN(tempo_ms), AVG(tempo_ms)
+            FROM Resultados WHERE evento_id = ? AND tempo_ms IS NOT NULL;
+        """, (evento_id,)).fetchone()
+
+        por_genero = {
+            genero or SEM_INFORMACAO: quantidade
+            for genero, quantidade in conexao.execute("""
+                SELECT genero_atleta, COUNT(*) FROM Resultados
+                WHERE evento_id = ? AND tempo_ms IS NOT NULL
+                GROUP BY genero_atleta ORDER BY COUNT(*) DESC;
+            """, (evento_id,))
+        }
+
+        histograma = [
+            [faixa * LARGURA_FAIXA_HISTOGRAMA_MS, quantidade]
+            for faixa, quantidade in conexao.execute("""
+                SELECT tempo_ms / ? AS faixa, COUNT(*) FROM Resultados
+                WHERE evento_id = ? AND tempo_ms IS NOT NULL
+                GROUP BY faixa ORDER BY faixa;
+            """, (LARGURA_FAIXA_HISTOGRAMA_MS, evento_id))
+        ]
+
+        percentis_ritmo = {}
+        if total and distancia_km:
+            # Em eventos pequenos, percentis diferentes podem cair na mesma posição
+            posicoes = {}
+            for percentil in PERCENTIS_RITMO:
+                posicoes.setdefault(posicao_percentil(percentil, total), []).append(percentil)
+            marcadores = ', '.join('?' * len(posicoes))
+            for posicao, tempo_ms in conexao.execute(f"""
+                SELECT posicao, tempo_ms FROM (
+                    SELECT ROW_NUMBER() OVER (ORDER BY tempo_ms) AS posicao, tempo_ms
+                    FROM Resultados WHERE evento_id = ? AND tempo_ms IS NOT NULL
+                ) WHERE posicao IN ({marcadores});
+            """, (evento_id, *posicoes)):
+                for percentil in posicoes[posicao]:
+                    percentis_ritmo[percentil] = round(tempo_ms / distancia_km)
+
+        return {
+            'total': total,
+            'por_genero': por_genero,
+            'melhor_tempo_ms': melhor_tempo_ms,
+            'tempo_medio_ms': round(tempo_medio_ms) if tempo_medio_ms is not None else None,
+            'histograma': histograma,
+            'percentis_ritmo': percentis_ritmo
+        }
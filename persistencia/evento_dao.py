@@ -1,72 +1,64 @@
 # persistencia/evento_dao.py
 import sqlite3
-from entidade.evento import Evento
+from entidade.evento import Evento, converter_data_iso
 from entidade.kit_de_corrida import KitDeCorrida
+from persistencia.conexao import GerenciadorConexao
 
 
 class EventoDAO:
 
     def __init__(self, db_path='banco.db'):
-        self.__db_path = db_path
+        self.__banco = GerenciadorConexao.para(db_path)
 
     def __conectar(self):
-        return sqlite3.connect(self.__db_path)
+        return self.__banco.conexao()
 
     def add_evento(self, evento: Evento):
-        conexao = None
         try:
-            conexao = self.__conectar()
-            cursor = conexao.cursor()
+            with self.__banco.transacao(imediata=True) as conexao:
+                cursor = conexao.cursor()
+
+                dados_evento = (
+                    evento.nome,
+                    evento.data,
+                    evento.distancia,
+                    evento.local_largada,
+                    evento.tempo_corte,
+                    evento.data_limite_cred,
+                    evento.organizador_cpf,
+                    evento.data_iso
+                )
 
-            dados_evento = (
-                evento.nome,
-                evento.data,
-                evento.distancia,
-                evento.local_largada,
-                evento.tempo_corte,
-                evento.data_limite_cred,
-                evento.organizador_cpf
-            )
-
-            sql_evento = """
-            INSERT INTO Eventos 
-            (nome, data, distancia, local_largada, tempo_corte, data_limite_cred, organizador_cpf, resultados_publicados)
-            VALUES (?, ?, ?, ?, ?, ?, ?, 0);
-            """
-            cursor.execute(sql_evento, dados_evento)
+                sql_evento = """
+                INSERT INTO Eventos
+                (nome, data, distancia, local_largada, tempo_corte, data_limite_cred, organizador_cpf, data_iso, resultados_publicados)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0);
+                """
+                cursor.execute(sql_evento, dados_evento)
 
-            evento_id = cursor.lastrowid
+                evento_id = cursor.lastrowid
 
-            if evento.kits:
-                sql_kit = """
-                INSERT INTO KitsDeCorrida (nome, descricao, valor, evento_id)
-                VALUES (?, ?, ?, ?);
-                """
-                dados_kits = []
-                for kit in evento.kits:
-                    dados_kits.append((kit.nome, kit.descricao, kit.valor, evento_id))
+                if evento.kits:
+                    sql_kit = """
+                    INSERT INTO KitsDeCorrida (nome, descricao, valor, evento_id)
+                    VALUES (?, ?, ?, ?);
+                    """
+                    dados_kits = []
+                    for kit in evento.kits:
+                        dados_kits.append((kit.nome, kit.descricao, kit.valor, evento_id))
 
-                cursor.executemany(sql_kit, dados_kits)
+                    cursor.executemany(sql_kit, dados_kits)
 
-            conexao.commit()
             print(f"Evento {evento.nome} e {len(evento.kits)} kits salvos com ID {evento_id}.")
 
         except sqlite3.Error as e:
-            if conexao:
-                conexao.rollback()
             print(f"Erro ao salvar evento no SQLite: {e}")
             raise e
 
-        finally:
-            if conexao:
-                conexao.close()
-
     def get_all_by_organizador(self, organizador_cpf: str):
-        conexao = None
         eventos_objs = []
         try:
             conexao = self.__conectar()
-            conexao.row_factory = sqlite3.Row
             cursor = conexao.cursor()
 
             sql = "SELECT * FROM Eventos WHERE organizador_cpf = ?;"
@@ -75,38 +67,64 @@ class EventoDAO:
             lista_dados = cursor.fetchall()
 
             for dados in lista_dados:
-                evento = Evento(
-                    nome=dados['nome'],
-                    data=dados['data'],
-                    distancia=dados['distancia'],
-                    local_largada=dados['local_largada'],
-                    tempo_corte=dados['tempo_corte'],
-                    data_limite_cred=dados['data_limite_cred'],
-                    organizador_cpf=dados['organizador_cpf']
-                )
-                evento.id = dados['id']
-                # Verificar se a coluna existe (para compatibilidade com bancos antigos)
-                try:
-                    evento.resultados_publicados = dados['resultados_publicados'] or 0
-                except (KeyError, IndexError):
-                    evento.resultados_publicados = 0
-                eventos_objs.append(evento)
+                eventos_objs.append(self.__montar_evento(dados))
 
             return eventos_objs
 
         except sqlite3.Error as e:
             print(f"Erro ao buscar eventos: {e}")
             return []
-        finally:
-            if conexao:
-                conexao.close()
+
+    def get_resumo_by_organizador(self, organizador_cpf: str):
+        """
+        Lista os eventos do organizador com o total de inscritos e de resultados.
+
+        Os totais vêm de uma única consulta agregada (GROUP BY), evitando uma
+        contagem separada por evento no painel do organizador.
+        """
+        eventos_objs = []
+        try:
+            conexao = self.__conectar()
+            cursor = conexao.cursor()
+
+            sql = """
+                SELECT e.*,
+                       COALESCE(i.total, 0) AS total_inscritos,
+                       COALESCE(r.total, 0) AS total_resultados
+                FROM Eventos e
+                LEFT JOIN (
+                    SELECT evento_id, COUNT(*) AS total
+                    FROM Inscricoes
+                    WHERE evento_id IN (SELECT id FROM Eventos WHERE organizador_cpf = ?)
+                    GROUP BY evento_id
+                ) i ON i.evento_id = e.id
+                LEFT JOIN (
+                    SELECT evento_id, COUNT(*) AS total
+                    FROM Resultados
+                    WHERE evento_id IN (SELECT id FROM Eventos WHERE organizador_cpf = ?)
+                    GROUP BY evento_id
+                ) r ON r.evento_id = e.id
+                WHERE e.organizador_cpf = ?
+                ORDER BY e.id;
+            """
+            cursor.execute(sql, (organizador_cpf, organizador_cpf, organizador_cpf))
+
+            for dados in cursor.fetchall():
+                evento = self.__montar_evento(dados)
+                evento.total_inscritos = dados['total_inscritos']
+                evento.total_resultados = dados['total_resultados']
+                eventos_objs.append(evento)
+
+            return eventos_objs
+
+        except sqlite3.Error as e:
+            print(f"Erro ao buscar resumo dos eventos: {e}")
+            return []
 
     def get_by_id(self, evento_id: int):
         """Busca um evento por ID."""
-        conexao = None
         try:
             conexao = self.__conectar()
-            conexao.row_factory = sqlite3.Row
             cursor = conexao.cursor()
 
             sql = "SELECT * FROM Eventos WHERE id = ?;"
@@ -115,39 +133,19 @@ class EventoDAO:
             dados = cursor.fetchone()
 
             if dados:
-                evento = Evento(
-                    nome=dados['nome'],
-                    data=dados['data'],
-                    distancia=dados['distancia'],
-                    local_largada=dados['local_largada'],
-                    tempo_corte=dados['tempo_corte'],
-                    data_limite_cred=dados['data_limite_cred'],
-                    organizador_cpf=dados['organizador_cpf']
-                )
-                evento.id = dados['id']
-                # Verificar se a coluna existe (para compatibilidade com bancos antigos)
-                try:
-                    evento.resultados_publicados = dados['resultados_publicados'] or 0
-                except (KeyError, IndexError):
-                    evento.resultados_publicados = 0
-                return evento
+                return self.__montar_evento(dados)
 
             return None
 
         except sqlite3.Error as e:
             print(f"Erro ao buscar evento: {e}")
             return None
-        finally:
-            if conexao:
-                conexao.close()
 
     def get_kits_by_evento_id(self, evento_id: int):
         """Busca todos os kits associados a um ID de evento."""
-        conexao = None
         kits_objs = []
         try:
             conexao = self.__conectar()
-            conexao.row_factory = sqlite3.Row
             cursor = conexao.cursor()
 
             sql = "SELECT * FROM KitsDeCorrida WHERE evento_id = ?;"
@@ -169,164 +167,187 @@ class EventoDAO:
         except sqlite3.Error as e:
             print(f"Erro ao buscar kits: {e}")
             return []
-        finally:
-            if conexao:
-                conexao.close()
 
     def update_evento(self, evento: Evento):
-        """Atualiza um evento existente e seus kits no banco."""
-        conexao = None
-        try:
-            conexao = self.__conectar()
-            cursor = conexao.cursor()
-            
-            conexao.execute("BEGIN TRANSACTION;")
-
-            dados_evento = (
-                evento.nome,
-                evento.data,
-                evento.distancia,
-                evento.local_largada,
-                evento.tempo_corte,
-                evento.data_limite_cred,
-                evento.organizador_cpf,
-                evento.id  
-            )
-            sql_evento = """
-            UPDATE Eventos SET
-                nome = ?,
-                data = ?,
-                distancia = ?,
-                local_largada = ?,
-                tempo_corte = ?,
-                data_limite_cred = ?,
-                organizador_cpf = ?
-            WHERE id = ?;
-            """
-            cursor.execute(sql_evento, dados_evento)
+        """
+        Atualiza um evento existente e seus kits no banco.
 
-            cursor.execute("DELETE FROM KitsDeCorrida WHERE evento_id = ?;", (evento.id,))
-
-            if evento.kits:
-                sql_kit = """
-                INSERT INTO KitsDeCorrida (nome, descricao, valor, evento_id)
-                VALUES (?, ?, ?, ?);
+        Kits já salvos (com id) são atualizados no lugar, preservando as
+        inscrições que os referenciam; kits novos são inseridos e os que
+        saíram da lista são removidos.
+        """
+        try:
+            with self.__banco.transacao(imediata=True) as conexao:
+                cursor = conexao.cursor()
+
+                dados_evento = (
+                    evento.nome,
+                    evento.data,
+                    evento.distancia,
+                    evento.local_largada,
+                    evento.tempo_corte,
+                    evento.data_limite_cred,
+                    evento.organizador_cpf,
+                    evento.data_iso,
+                    evento.id
+                )
+                sql_evento = """
+                UPDATE Eventos SET
+                    nome = ?,
+                    data = ?,
+                    distancia = ?,
+                    local_largada = ?,
+                    tempo_corte = ?,
+                    data_limite_cred = ?,
+                    organizador_cpf = ?,
+                    data_iso = ?
+                WHERE id = ?;
                 """
-                dados_kits = []
-                for kit in evento.kits:
-                    dados_kits.append((kit.nome, kit.descricao, kit.valor, evento.id))
-                
-                cursor.executemany(sql_kit, dados_kits)
-            
-            conexao.commit()
+                cursor.execute(sql_evento, dados_evento)
+
+                kits_existentes = [kit for kit in evento.kits if getattr(kit, 'id', None)]
+                kits_novos = [kit for kit in evento.kits if not getattr(kit, 'id', None)]
+
+                ids_mantidos = [kit.id for kit in kits_existentes]
+                marcadores = ', '.join('?' * len(ids_mantidos))
+                sql_remover = "DELETE FROM KitsDeCorrida WHERE evento_id = ?"
+                if ids_mantidos:
+                    sql_remover += f" AND id NOT IN ({marcadores})"
+                cursor.execute(sql_remover + ";", (evento.id, *ids_mantidos))
+
+                if kits_existentes:
+                    sql_kit = """
+                    UPDATE KitsDeCorrida SET nome = ?, descricao = ?, valor = ?
+                    WHERE id = ? AND evento_id = ?;
+                    """
+                    cursor.executemany(sql_kit, [
+                        (kit.nome, kit.descricao, kit.valor, kit.id, evento.id)
+                        for kit in kits_existentes
+                    ])
+
+                if kits_novos:
+                    sql_kit = """
+                    INSERT INTO KitsDeCorrida (nome, descricao, valor, evento_id)
+                    VALUES (?, ?, ?, ?);
+                    """
+                    dados_kits = []
+                    for kit in kits_novos:
+                        dados_kits.append((kit.nome, kit.descricao, kit.valor, evento.id))
+
+                    cursor.executemany(sql_kit, dados_kits)
+
             print(f"Evento ID {evento.id} e {len(evento.kits)} kits atualizados.")
 
         except sqlite3.Error as e:
-            if conexao:
-                conexao.rollback() 
             print(f"Erro ao atualizar evento no SQLite: {e}")
             raise e
-        finally:
-            if conexao:
-                conexao.close()
 
     def delete_evento(self, evento_id: int):
         """Deleta um evento e seus kits do banco de dados."""
-        conexao = None
         try:
-            conexao = self.__conectar()
-            cursor = conexao.cursor()
-            
-            conexao.execute("BEGIN TRANSACTION;")
-            
-            # Deleta os kits do evento primeiro (embora cascade deveria fazer isso)
-            cursor.execute("DELETE FROM KitsDeCorrida WHERE evento_id = ?;", (evento_id,))
-            
-            # Deleta o evento
-            cursor.execute("DELETE FROM Eventos WHERE id = ?;", (evento_id,))
-            
-            conexao.commit()
+            with self.__banco.transacao(imediata=True) as conexao:
+                cursor = conexao.cursor()
+
+                # Deleta os kits do evento primeiro (a FK de KitsDeCorrida não tem cascade)
+                cursor.execute("DELETE FROM KitsDeCorrida WHERE evento_id = ?;", (evento_id,))
+
+                # Deleta o evento
+                cursor.execute("DELETE FROM Eventos WHERE id = ?;", (evento_id,))
+
             print(f"Evento ID {evento_id} e seus kits deletados.")
-            
+
         except sqlite3.Error as e:
-            if conexao:
-                conexao.rollback()
             print(f"Erro ao deletar evento no SQLite: {e}")
             raise e
-        finally:
-            if conexao:
-                conexao.close()
+
+    def __montar_evento(self, dados) -> Evento:
+        """Monta um Evento a partir de uma linha de Eventos (SELECT *)."""
+        evento = Evento(
+            nome=dados['nome'],
+            data=dados['data'],
+            distancia=dados['distancia'],
+            local_largada=dados['local_largada'],
+            tempo_corte=dados['tempo_corte'],
+            data_limite_cred=dados['data_limite_cred'],
+            organizador_cpf=dados['organizador_cpf']
+        )
+        evento.id = dados['id']
+        evento.resultados_publicados = dados['resultados_publicados'] or 0
+        return evento
+
+    def __listar_por_data(self, condicao: str, parametros: tuple = ()):
+        """Executa um SELECT em Eventos filtrando pela coluna indexada data_iso."""
+        conexao = self.__conectar()
+        cursor = conexao.cursor()
+
+        sql = f"SELECT * FROM Eventos WHERE {condicao} ORDER BY data_iso, id;"
+        cursor.execute(sql, parametros)
+
+        return [self.__montar_evento(dados) for dados in cursor.fetchall()]
 
     def get_all_disponiveis(self):
-        """Busca todos os eventos disponíveis (não concluídos, data >= hoje)."""
-        from datetime import datetime
-        conexao = None
-        eventos_objs = []
+        """Busca todos os eventos disponíveis (data posterior a hoje)."""
         try:
-            conexao = self.__conectar()
-            conexao.row_factory = sqlite3.Row
-            cursor = conexao.cursor()
+            return self.__listar_por_data("data_iso > date('now', 'localtime')")
 
-            sql = "SELECT * FROM Eventos;"
-            cursor.execute(sql)
+        except sqlite3.Error as e:
+            print(f"Erro ao buscar eventos disponíveis: {e}")
+            return []
 
-            lista_dados = cursor.fetchall()
-            hoje = datetime.now()
+    def get_all_concluidos(self):
+        """Busca todos os eventos já realizados (data até hoje, inclusive)."""
+        try:
+            return self.__listar_por_data("data_iso <= date('now', 'localtime')")
 
-            for dados in lista_dados:
-                try:
-                    data_evento_obj = datetime.strptime(dados['data'], '%d/%m/%Y')
-                    if data_evento_obj >= hoje:
-                        evento = Evento(
-                            nome=dados['nome'],
-                            data=dados['data'],
-                            distancia=dados['distancia'],
-                            local_largada=dados['local_largada'],
-                            tempo_corte=dados['tempo_corte'],
-                            data_limite_cred=dados['data_limite_cred'],
-                            organizador_cpf=dados['organizador_cpf']
-                        )
-                        evento.id = dados['id']
-                        # Verificar se a coluna existe (para compatibilidade com bancos antigos)
-                        try:
-                            evento.resultados_publicados = dados['resultados_publicados'] or 0
-                        except (KeyError, IndexError):
-                            evento.resultados_publicados = 0
-                        eventos_objs.append(evento)
-                except ValueError:
-                    # Se a data for inválida, ignora o evento
-                    continue
+        except sqlite3.Error as e:
+            print(f"Erro ao buscar eventos concluídos: {e}")
+            return []
 
-            return eventos_objs
+    def get_all_por_periodo(self, data_inicio: str, data_fim: str):
+        """
+        Busca os eventos com data dentro de um intervalo (inclusivo).
+
+        Args:
+            data_inicio: Data inicial no formato 'DD/MM/AAAA'
+            data_fim: Data final no formato 'DD/MM/AAAA'
+
+        Returns:
+            Lista de eventos ordenada por data, ou lista vazia se alguma data for inválida
+        """
+        inicio_iso = converter_data_iso(data_inicio)
+        fim_iso = converter_data_iso(data_fim)
+        if inicio_iso is None or fim_iso is None:
+            return []
+
+        try:
+            return self.__listar_por_data("data_iso BETWEEN ? AND ?", (inicio_iso, fim_iso))
 
         except sqlite3.Error as e:
-            print(f"Erro ao buscar eventos disponíveis: {e}")
+            print(f"Erro ao buscar eventos do período: {e}")
             return []
-        finally:
-            if conexao:
-                conexao.close()
 
     def marcar_resultados_publicados(self, evento_id: int) -> bool:
-        """Marca os resultados de um evento como publicados."""
-        conexao = None
+        """
+        Marca os resultados de um evento como publicados.
+
+        A versão dos resultados também é incrementada, descartando os quadros
+        de resultados em cache (ResultadoDAO.buscar_quadro_resultados).
+        """
         try:
-            conexao = self.__conectar()
-            cursor = conexao.cursor()
+            with self.__banco.transacao(imediata=True) as conexao:
+                cursor = conexao.cursor()
 
-            sql = "UPDATE Eventos SET resultados_publicados = 1 WHERE id = ?;"
-            cursor.execute(sql, (evento_id,))
+                sql = """
+                    UPDATE Eventos SET resultados_publicados = 1, versao_resultados = versao_resultados + 1
+                    WHERE id = ?;
+                """
+                cursor.execute(sql, (evento_id,))
 
-            conexao.commit()
             sucesso = cursor.rowcount > 0
             if sucesso:
                 print(f"Resultados do evento ID {evento_id} marcados como publicados.")
             return sucesso
 
         except sqlite3.Error as e:
-            if conexao:
-                conexao.rollback()
             print(f"Erro ao marcar resultados como publicados: {e}")
             return False
-        finally:
-            if conexao:
-                conexao.close()
\ No newline at end of file
@@ -1,22 +1,48 @@
 # persistencia/inscricao_dao.py
+import re
 import sqlite3
-from typing import LiteralString
+from typing import Any, Dict, List, Optional
 
 from entidade.inscricao import Inscricao
 from entidade.kit_de_corrida import KitDeCorrida
+from persistencia.conexao import GerenciadorConexao
+
+# Situação de cada inscrição em uma atualização de kits em lote
+KIT_ATUALIZADO = 'atualizado'
+KIT_INALTERADO = 'inalterado'  # já estava no estado pedido
+INSCRICAO_NAO_ENCONTRADA = 'nao_encontrada'
 
 
 class InscricaoDAO:
+    # Limite de parâmetros por consulta IN (...), abaixo do máximo do SQLite
+    TAMANHO_LOTE_CONSULTA = 500
+
+    # A ordenação por relevância (bm25) pontua cada inscrito que casa antes do
+    # LIMIT. Ela é dispensada quando algum prefixo é mais curto que o mínimo
+    # ("jo", "ana s" casam com boa parte do evento) ou quando mais inscritos
+    # que o máximo casam
+    PREFIXO_MINIMO_RELEVANCIA = 3
+    MAXIMO_CASAMENTOS_RELEVANCIA = 1500
+
     def __init__(self, db_path='banco.db'):
-        self.__db_path = db_path
+        self.__banco = GerenciadorConexao.para(db_path)
 
     def __conectar(self):
-        return sqlite3.connect(self.__db_path)
+        return self.__banco.conexao()
 
-    def add(self, inscricao: Inscricao):
-        conexao = self.__conectar()
-        cursor = conexao.cursor()
+    @property
+    def db_path(self) -> str:
+        return self.__banco.db_path
 
+    def transacao(self):
+        """
+        Abre uma transação de escrita (BEGIN IMMEDIATE) no banco deste DAO,
+        para envolver também outros DAOs do mesmo banco (ex.: inscrição e
+        ficha médica).
+        """
+        return self.__banco.transacao(imediata=True)
+
+    def add(self, inscricao: Inscricao):
         if isinstance(inscricao, Inscricao):
             dados = (
                 inscricao.data_inscricao_str,
@@ -33,16 +59,15 @@ class InscricaoDAO:
             values (?, ?, ?, ?, ?, ?);
             """
 
-            cursor.execute(sql, dados)
-            inscricao.id = cursor.lastrowid
+            with self.__banco.transacao(imediata=True) as conexao:
+                cursor = conexao.cursor()
+                cursor.execute(sql, dados)
+                inscricao.id = cursor.lastrowid
 
-            conexao.commit()
             print(f"Inscrição ID {inscricao.id} salva para o atleta {inscricao.atleta_cpf_str}")
-            conexao.close()
 
     def get_by_atleta_e_evento(self, atleta_cpf, evento_id):
         conexao = self.__conectar()
-        conexao.row_factory = sqlite3.Row
         cursor = conexao.cursor()
 
         sql = ("""
@@ -76,31 +101,179 @@ class InscricaoDAO:
                 valor = dados['kit_valor']
             )
             return inscricao, kit
-        conexao.close()
         return None, None
 
-    def update_kit_entregue(self, inscricao_id: int, kit_entregue: bool):
-        conexao = None
+    def get_cpfs_inscritos(self, evento_id: int, cpfs) -> set:
+        """
+        Retorna, dentre os CPFs informados, os que possuem inscrição (com kit) no evento.
+
+        Args:
+            evento_id: ID do evento
+            cpfs: Coleção de CPFs (somente dígitos)
+
+        Returns:
+            Conjunto com os CPFs inscritos
+        """
+        cpfs = list(dict.fromkeys(cpfs))
+        inscritos = set()
+        if not cpfs:
+            return inscritos
+
         try:
             conexao = self.__conectar()
             cursor = conexao.cursor()
 
-            sql = "UPDATE inscricoes SET kit_entregue = ? WHERE ID = ?;"
-            cursor.execute(sql, (int(kit_entregue), inscricao_id))
+            for inicio in range(0, len(cpfs), self.TAMANHO_LOTE_CONSULTA):
+                lote = cpfs[inicio:inicio + self.TAMANHO_LOTE_CONSULTA]
+                marcadores = ', '.join('?' * len(lote))
+                sql = f"""
+                    SELECT inscricoes.atleta_cpf
+                    FROM inscricoes
+                    JOIN kitsdecorrida ON inscricoes.kit_id = kitsdecorrida.id
+                    WHERE inscricoes.evento_id = ? AND inscricoes.atleta_cpf IN ({marcadores});
+                """
+                cursor.execute(sql, (evento_id, *lote))
+                inscritos.update(linha[0] for linha in cursor.fetchall())
+
+            return inscritos
+
+        except sqlite3.Error as e:
+            print(f"Erro ao buscar inscritos do evento: {e}")
+            raise e
+
+    def update_kit_entregue(self, inscricao_id: int, kit_entregue: bool):
+        try:
+            with self.__banco.transacao(imediata=True) as conexao:
+                cursor = conexao.cursor()
+
+                sql = "UPDATE inscricoes SET kit_entregue = ? WHERE ID = ?;"
+                cursor.execute(sql, (int(kit_entregue), inscricao_id))
 
-            conexao.commit()
             print(f"Status do kit para Inscrição ID {inscricao_id} atualizado.")
 
         except sqlite3.Error as e:
-            if conexao:
-                conexao.rollback()
             print(f"Erro ao atualizar kit: {e}")
-        finally:
-            if conexao:
-                conexao.close()
+
+    def atualizar_kits_por_ids(self, evento_id: int, inscricao_ids,
+                               kit_entregue: bool = True) -> List[Dict[str, Any]]:
+        """
+        Marca os kits de várias inscrições do evento como entregues ou não entregues.
+
+        Args:
+            evento_id: ID do evento
+            inscricao_ids: IDs das inscrições
+            kit_entregue: Novo status do kit
+
+        Returns:
+            Uma situação por ID informado (sem repetições), na ordem de entrada;
+            ver atualizar_kits_por_cpfs
+
+        Raises:
+            sqlite3.Error: Se a gravação falhar (nenhuma inscrição é alterada)
+        """
+        return self.__atualizar_kits(evento_id, 'ID', inscricao_ids, kit_entregue)
+
+    def atualizar_kits_por_cpfs(self, evento_id: int, cpfs,
+                                kit_entregue: bool = True) -> List[Dict[str, Any]]:
+        """
+        Marca os kits dos atletas informados como entregues ou não entregues no evento.
+
+        Todas as alterações são feitas em uma única transação, com um único
+        executemany, em vez de um commit por inscrição.
+
+        Args:
+            evento_id: ID do evento
+            cpfs: CPFs dos atletas (somente dígitos)
+            kit_entregue: Novo status do kit
+
+        Returns:
+            Uma situação por CPF informado (sem repetições), na ordem de entrada:
+            dicionários {'chave', 'inscricao_id', 'atleta_cpf', 'situacao'}, com
+            situacao KIT_ATUALIZADO, KIT_INALTERADO ou INSCRICAO_NAO_ENCONTRADA
+
+        Raises:
+            sqlite3.Error: Se a gravação falhar (nenhuma inscrição é alterada)
+        """
+        return self.__atualizar_kits(evento_id, 'atleta_cpf', cpfs, kit_entregue)
+
+    def __atualizar_kits(self, evento_id: int, coluna: str, chaves,
+                         kit_entregue: bool) -> List[Dict[str, Any]]:
+        chaves = list(dict.fromkeys(chaves))
+        novo_status = int(bool(kit_entregue))
+        encontradas = {}
+
+        try:
+            with self.__banco.transacao(imediata=True) as conexao:
+                cursor = conexao.cursor()
+
+                for inicio in range(0, len(chaves), self.TAMANHO_LOTE_CONSULTA):
+                    lote = chaves[inicio:inicio + self.TAMANHO_LOTE_CONSULTA]
+                    marcadores = ', '.join('?' * len(lote))
+                    sql = f"""
+                        SELECT ID, atleta_cpf, kit_entregue, {coluna} AS chave
+                        FROM inscricoes
+                        WHERE evento_id = ? AND {coluna} IN ({marcadores});
+                    """
+                    cursor.execute(sql, (evento_id, *lote))
+                    encontradas.update((dados['chave'], dados) for dados in cursor.fetchall())
+
+                alteracoes = [
+                    (novo_status, dados['ID'], novo_status)
+                    for dados in encontradas.values()
+                    if dados['kit_entregue'] != novo_status
+                ]
+                cursor.executemany(
+                    "UPDATE inscricoes SET kit_entregue = ? WHERE ID = ? AND kit_entregue <> ?;",
+                    alteracoes
+                )
+
+            print(f"{len(alteracoes)} kit(s) atualizado(s) no evento ID {evento_id}.")
+
+        except sqlite3.Error as e:
+            print(f"Erro ao atualizar kits em lote: {e}")
+            raise e
+
+        resultados = []
+        for chave in chaves:
+            dados = encontradas.get(chave)
+            if dados is None:
+                situacao = INSCRICAO_NAO_ENCONTRADA
+            elif dados['kit_entregue'] != novo_status:
+                situacao = KIT_ATUALIZADO
+            else:
+                situacao = KIT_INALTERADO
+            resultados.append({
+                'chave': chave,
+                'inscricao_id': dados['ID'] if dados else None,
+                'atleta_cpf': dados['atleta_cpf'] if dados else None,
+                'situacao': situacao
+            })
+        return resultados
+
+    def marcar_kits_entregues(self, evento_id: int, inscricao_ids) -> List[int]:
+        """
+        Marca como entregues os kits de várias inscrições em uma única transação.
+
+        Inscrições de outro evento ou cujo kit já constava como entregue (por
+        exemplo, por outro balcão) não são alteradas.
+
+        Args:
+            evento_id: ID do evento
+            inscricao_ids: IDs das inscrições
+
+        Returns:
+            IDs das inscrições efetivamente atualizadas
+
+        Raises:
+            sqlite3.Error: Se a gravação falhar (nenhuma inscrição é alterada)
+        """
+        return [
+            resultado['inscricao_id']
+            for resultado in self.atualizar_kits_por_ids(evento_id, inscricao_ids, True)
+            if resultado['situacao'] == KIT_ATUALIZADO
+        ]
 
     def count_by_evento(self, evento_id: int):
-        conexao = None
         try:
             conexao = self.__conectar()
             cursor = conexao.cursor()
@@ -113,40 +286,28 @@ class InscricaoDAO:
 
         except sqlite3.Error as e:
             print(f"Erro ao contar inscrições: {e}")
-        finally:
-            if conexao:
-                conexao.close()
 
     def delete_by_evento(self, evento_id: int):
         """Deleta todas as inscrições de um evento específico."""
-        conexao = None
         try:
-            conexao = self.__conectar()
-            cursor = conexao.cursor()
+            with self.__banco.transacao(imediata=True) as conexao:
+                cursor = conexao.cursor()
 
-            sql = "DELETE FROM inscricoes WHERE evento_id = ?;"
-            cursor.execute(sql, (evento_id,))
+                sql = "DELETE FROM inscricoes WHERE evento_id = ?;"
+                cursor.execute(sql, (evento_id,))
 
-            removidas = cursor.rowcount
-            conexao.commit()
+                removidas = cursor.rowcount
             print(f"{removidas} inscrição(ões) deletada(s) para o evento ID {evento_id}.")
             return removidas
 
         except sqlite3.Error as e:
-            if conexao:
-                conexao.rollback()
             print(f"Erro ao deletar inscrições: {e}")
             return 0
-        finally:
-            if conexao:
-                conexao.close()
 
     def get_all_by_evento(self, evento_id: int):
         """Busca todas as inscrições de um evento com dados do atleta e kit."""
-        conexao = None
         try:
             conexao = self.__conectar()
-            conexao.row_factory = sqlite3.Row
             cursor = conexao.cursor()
 
             sql = """
@@ -169,6 +330,7 @@ class InscricaoDAO:
             for dados in lista_dados:
                 inscricao_info = {
                     'id': dados['id'],
+                    'evento_id': dados['evento_id'],
                     'atleta_nome': dados['atleta_nome'],
                     'atleta_cpf': dados['atleta_cpf'],
                     'data_inscricao': dados['data_inscricao'],
@@ -184,16 +346,120 @@ class InscricaoDAO:
         except sqlite3.Error as e:
             print(f"Erro ao buscar inscrições do evento: {e}")
             return []
-        finally:
-            if conexao:
-                conexao.close()
+
+    @staticmethod
+    def montar_consulta_busca(termo: str) -> Optional[str]:
+        """
+        Converte o texto digitado no balcão em uma consulta FTS5 por prefixo.
+
+        Texto sem letras é tratado como CPF (pontuação ignorada); caso contrário
+        cada palavra vira um prefixo do nome e todas precisam casar
+        ("joao ped" encontra "João Pedro").
+
+        Args:
+            termo: Texto digitado
+
+        Returns:
+            Consulta MATCH ou None se não houver o que buscar
+        """
+        if not re.search(r'[^\W\d_]', termo):
+            digitos = re.sub(r'[^0-9]', '', termo)
+            return f'cpf : "{digitos}"*' if digitos else None
+
+        palavras = re.findall(r'\w+', termo)
+        return ' AND '.join(f'nome : "{palavra}"*' for palavra in palavras)
+
+    def buscar_por_nome_ou_cpf(self, evento_id: int, termo: str, limite: int = 20):
+        """
+        Busca inscritos de um evento por prefixo do nome ou do CPF, do mais ao
+        menos relevante (bm25), ignorando acentos e maiúsculas.
+
+        Se algum prefixo tiver menos de PREFIXO_MINIMO_RELEVANCIA caracteres
+        ("jo", "ana s") ou mais de MAXIMO_CASAMENTOS_RELEVANCIA inscritos
+        casarem, não há ordenação por relevância: retorna os primeiros
+        inscritos que casam, em ordem alfabética.
+
+        Args:
+            evento_id: ID do evento
+            termo: Nome (ou parte) ou CPF (ou início) digitado
+            limite: Quantidade máxima de inscrições retornadas
+
+        Returns:
+            Lista de dicionários no formato de get_all_by_evento
+        """
+        consulta = self.montar_consulta_busca(termo)
+        if not consulta:
+            return []
+
+        # O rowid do índice é (evento_id << 32) | ID da inscrição
+        faixa_evento = (evento_id << 32, ((evento_id + 1) << 32) - 1)
+
+        try:
+            conexao = self.__conectar()
+            cursor = conexao.cursor()
+
+            prefixos = re.findall(r'"([^"]*)"', consulta)
+            ordenar_por_relevancia = min(map(len, prefixos)) >= self.PREFIXO_MINIMO_RELEVANCIA
+            if ordenar_por_relevancia:
+                # Contagem limitada: para assim que passa do máximo
+                cursor.execute("""
+                    SELECT COUNT(*) FROM (
+                        SELECT 1 FROM busca_inscritos
+                        WHERE busca_inscritos MATCH ? AND rowid BETWEEN ? AND ?
+                        LIMIT ?
+                    );
+                """, (consulta, *faixa_evento, self.MAXIMO_CASAMENTOS_RELEVANCIA + 1))
+                ordenar_por_relevancia = cursor.fetchone()[0] <= self.MAXIMO_CASAMENTOS_RELEVANCIA
+
+            if ordenar_por_relevancia:
+                relevancia, ordem = 'bm25(busca_inscritos)', 'relevancia'
+            else:
+                # Sem bm25 o FTS5 percorre os casamentos em ordem de rowid e para no LIMIT
+                relevancia, ordem = '0', 'rowid'
+
+            sql = f"""
+                SELECT inscricoes.*,
+                       usuarios.nome as atleta_nome,
+                       usuarios.cpf as atleta_cpf,
+                       kitsdecorrida.nome as kit_nome,
+                       kitsdecorrida.valor as kit_valor
+                FROM (
+                    SELECT rowid, {relevancia} AS relevancia
+                    FROM busca_inscritos
+                    WHERE busca_inscritos MATCH ? AND rowid BETWEEN ? AND ?
+                    ORDER BY {ordem}
+                    LIMIT ?
+                ) busca
+                JOIN inscricoes ON inscricoes.ID = (busca.rowid & 4294967295)
+                JOIN usuarios ON inscricoes.atleta_cpf = usuarios.cpf
+                JOIN kitsdecorrida ON inscricoes.kit_id = kitsdecorrida.id
+                ORDER BY busca.relevancia, usuarios.nome;
+            """
+            cursor.execute(sql, (consulta, *faixa_evento, limite))
+
+            return [
+                {
+                    'id': dados['id'],
+                    'evento_id': dados['evento_id'],
+                    'atleta_nome': dados['atleta_nome'],
+                    'atleta_cpf': dados['atleta_cpf'],
+                    'data_inscricao': dados['data_inscricao'],
+                    'kit_nome': dados['kit_nome'],
+                    'kit_valor': dados['kit_valor'],
+                    'status': dados['status'],
+                    'kit_entregue': dados['kit_entregue']
+                }
+                for dados in cursor.fetchall()
+            ]
+
+        except sqlite3.Error as e:
+            print(f"Erro ao buscar inscritos por nome ou CPF: {e}")
+            return []
 
     def get_all_by_atleta(self, atleta_cpf: str):
         """Busca todas as inscrições de um atleta com dados do evento."""
-        conexao = None
         try:
             conexao = self.__conectar()
-            conexao.row_factory = sqlite3.Row
             cursor = conexao.cursor()
 
             sql = """
@@ -234,33 +500,23 @@ class InscricaoDAO:
         except sqlite3.Error as e:
             print(f"Erro ao buscar inscrições do atleta: {e}")
             return []
-        finally:
-            if conexao:
-                conexao.close()
 
     def delete_by_atleta_e_evento(self, atleta_cpf: str, evento_id: int) -> bool:
         """Deleta uma inscrição específica de um atleta em um evento."""
-        conexao = None
         try:
-            conexao = self.__conectar()
-            cursor = conexao.cursor()
+            with self.__banco.transacao(imediata=True) as conexao:
+                cursor = conexao.cursor()
+
+                sql = "DELETE FROM inscricoes WHERE atleta_cpf = ? AND evento_id = ?;"
+                cursor.execute(sql, (atleta_cpf, evento_id))
 
-            sql = "DELETE FROM inscricoes WHERE atleta_cpf = ? AND evento_id = ?;"
-            cursor.execute(sql, (atleta_cpf, evento_id))
+                removidas = cursor.rowcount
 
-            removidas = cursor.rowcount
-            conexao.commit()
-            
             if removidas > 0:
                 print(f"Inscrição do atleta {atleta_cpf} no evento {evento_id} deletada.")
                 return True
             return False
 
         except sqlite3.Error as e:
-            if conexao:
-                conexao.rollback()
             print(f"Erro ao deletar inscrição: {e}")
             return False
-        finally:
-            if conexao:
-                conexao.close()
\ No newline at end of file
@@ -0,0 +1,412 @@
+# persistencia/migracoes.py
+"""
+Migrações numeradas do esquema do banco.
+
+Cada migração é uma função que recebe a conexão e altera o esquema (ou os
+dados). As migrações pendentes são aplicadas em ordem, todas em uma única
+transação, e registradas na tabela schema_version. A versão atual também fica
+em PRAGMA user_version (lido do cabeçalho do arquivo), o que torna a
+verificação na abertura do sistema praticamente gratuita quando o banco já
+está atualizado.
+
+Para alterar o esquema, acrescente uma função ao final de MIGRACOES; nunca
+altere uma migração já publicada.
+"""
+import sqlite3
+from datetime import datetime
+
+from entidade.evento import converter_data_iso
+from entidade.resultado import tempo_para_ms
+from persistencia.conexao import DB_PATH_PADRAO, GerenciadorConexao
+
+
+def _colunas(conexao: sqlite3.Connection, tabela: str) -> list:
+    return [row[1] for row in conexao.execute(f"PRAGMA table_info({tabela});")]
+
+
+def _criar_esquema_inicial(conexao: sqlite3.Connection):
+    conexao.execute("""
+        CREATE TABLE IF NOT EXISTS usuarios (
+            cpf TEXT PRIMARY KEY,
+            nome TEXT NOT NULL,
+            email TEXT NOT NULL,
+            senha_hash TEXT NOT NULL,
+            perfil TEXT NOT NULL,
+            data_nascimento TEXT,
+            genero TEXT,
+            pcd INTEGER
+        );
+    """)
+    conexao.execute("""
+        CREATE TABLE IF NOT EXISTS Eventos (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nome TEXT NOT NULL,
+            data TEXT NOT NULL,
+            distancia INTEGER NOT NULL,
+            local_largada TEXT,
+            tempo_corte TEXT,
+            data_limite_cred TEXT,
+            organizador_cpf TEXT NOT NULL,
+            resultados_publicados INTEGER DEFAULT 0,
+            FOREIGN KEY (organizador_cpf) REFERENCES usuarios (cpf)
+        );
+    """)
+    conexao.execute("""
+        CREATE TABLE IF NOT EXISTS KitsDeCorrida (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nome TEXT NOT NULL,
+            descricao TEXT,
+            valor REAL NOT NULL,
+            evento_id INTEGER NOT NULL,
+            FOREIGN KEY (evento_id) REFERENCES Eventos (id)
+        );
+    """)
+    conexao.execute("""
+        CREATE TABLE IF NOT EXISTS Inscricoes (
+            ID INTEGER PRIMARY KEY AUTOINCREMENT,
+            data_inscricao text not null,
+            kit_entregue INTEGER NOT NULL DEFAULT 0,
+            status INTEGER NOT NULL,
+            -- FKS
+            atleta_cpf TEXT NOT NULL,
+            evento_id INTEGER NOT NULL,
+            kit_id INTEGER NOT NULL,
+            FOREIGN KEY (atleta_cpf) REFERENCES usuarios (cpf),
+            FOREIGN KEY (evento_id) REFERENCES Eventos (id),
+            FOREIGN KEY (kit_id) REFERENCES KitsDeCorrida (id)
+        );
+    """)
+    conexao.execute("""
+        CREATE TABLE IF NOT EXISTS FichasMedicas (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            inscricao_id INTEGER NOT NULL UNIQUE,
+            preenchida INTEGER NOT NULL DEFAULT 0,
+            pergunta1 INTEGER,
+            pergunta2 INTEGER,
+            pergunta3 INTEGER,
+            pergunta4 INTEGER,
+            pergunta5 INTEGER,
+            pergunta6 INTEGER,
+            pergunta7 INTEGER,
+            declaracao_saude INTEGER NOT NULL DEFAULT 0,
+            FOREIGN KEY (inscricao_id) REFERENCES Inscricoes(ID) ON DELETE CASCADE
+        );
+    """)
+    conexao.execute("""
+        CREATE TABLE IF NOT EXISTS Resultados (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            evento_id INTEGER NOT NULL,
+            cpf_atleta TEXT NOT NULL,
+            nome_atleta TEXT NOT NULL,
+            genero_atleta TEXT NOT NULL,
+            tempo_final TEXT NOT NULL,
+            categoria TEXT NOT NULL,
+            classificacao_geral INTEGER,
+            classificacao_categoria INTEGER,
+            pcd INTEGER DEFAULT 0,
+            FOREIGN KEY (evento_id) REFERENCES Eventos(id) ON DELETE CASCADE
+        );
+    """)
+    conexao.execute("CREATE INDEX IF NOT EXISTS idx_resultados_evento ON Resultados(evento_id);")
+    conexao.execute("CREATE INDEX IF NOT EXISTS idx_resultados_cpf ON Resultados(cpf_atleta);")
+
+
+def _adicionar_resultados_publicados(conexao: sqlite3.Connection):
+    # Bancos criados antes da publicação de resultados
+    if 'resultados_publicados' not in _colunas(conexao, 'Eventos'):
+        conexao.execute("ALTER TABLE Eventos ADD COLUMN resultados_publicados INTEGER DEFAULT 0;")
+
+
+def _adicionar_data_iso_eventos(conexao: sqlite3.Connection):
+    # Espelha a data 'DD/MM/AAAA' em 'AAAA-MM-DD', ordenável e indexada
+    if 'data_iso' not in _colunas(conexao, 'Eventos'):
+        conexao.execute("ALTER TABLE Eventos ADD COLUMN data_iso TEXT;")
+
+    datas_iso = [
+        (converter_data_iso(data), evento_id)
+        for evento_id, data in conexao.execute("SELECT id, data FROM Eventos WHERE data_iso IS NULL;")
+    ]
+    conexao.executemany("UPDATE Eventos SET data_iso = ? WHERE id = ?;", datas_iso)
+    conexao.execute("CREATE INDEX IF NOT EXISTS idx_eventos_data_iso ON Eventos(data_iso);")
+
+
+def _adicionar_tempo_ms_resultados(conexao: sqlite3.Connection):
+    # Tempo final em milissegundos, ordenável sem reinterpretar o texto HH:MM:SS
+    if 'tempo_ms' not in _colunas(conexao, 'Resultados'):
+        conexao.execute("ALTER TABLE Resultados ADD COLUMN tempo_ms INTEGER;")
+
+    tempos_ms = []
+    for resultado_id, tempo_final in conexao.execute(
+            "SELECT id, tempo_final FROM Resultados WHERE tempo_ms IS NULL;").fetchall():
+        try:
+            tempos_ms.append((tempo_para_ms(tempo_final), resultado_id))
+        except ValueError:
+            print(f"Resultado ID {resultado_id} com tempo inválido ignorado: {tempo_final}")
+    conexao.executemany("UPDATE Resultados SET tempo_ms = ? WHERE id = ?;", tempos_ms)
+
+    conexao.execute("""
+        CREATE INDEX IF NOT EXISTS idx_resultados_evento_genero_categoria_tempo
+        ON Resultados(evento_id, genero_atleta, categoria, tempo_ms);
+    """)
+
+
+def _indexar_inscricoes_e_kits(conexao: sqlite3.Connection):
+    # Inscrições repetidas: mantém a que já teve o kit entregue ou, em empate, a mais antiga
+    ids_repetidos = conexao.execute("""
+        SELECT i.ID FROM Inscricoes i
+        WHERE EXISTS (
+            SELECT 1 FROM Inscricoes o
+            WHERE o.atleta_cpf = i.atleta_cpf AND o.evento_id = i.evento_id
+              AND (o.kit_entregue > i.kit_entregue
+                   OR (o.kit_entregue = i.kit_entregue AND o.ID < i.ID))
+        );
+    """).fetchall()
+    conexao.executemany("DELETE FROM FichasMedicas WHERE inscricao_id = ?;", ids_repetidos)
+    conexao.executemany("DELETE FROM Inscricoes WHERE ID = ?;", ids_repetidos)
+    if ids_repetidos:
+        print(f"{len(ids_repetidos)} inscrição(ões) repetida(s) removida(s)")
+
+    # O índice único também atende às buscas só por atleta_cpf (prefixo)
+    conexao.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_inscricoes_atleta_evento
+        ON Inscricoes(atleta_cpf, evento_id);
+    """)
+    conexao.execute("CREATE INDEX IF NOT EXISTS idx_inscricoes_evento ON Inscricoes(evento_id);")
+    conexao.execute("CREATE INDEX IF NOT EXISTS idx_kits_evento ON KitsDeCorrida(evento_id);")
+
+
+def _criar_busca_inscritos(conexao: sqlite3.Connection):
+    # Índice FTS5 de nome e CPF dos inscritos, para a busca no balcão de kits. O rowid
+    # combina evento e inscrição ((evento_id << 32) | ID), de modo que a busca em um
+    # evento é um intervalo de rowids; acentos e maiúsculas são ignorados
+    conexao.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS busca_inscritos USING fts5(
+            nome, cpf,
+            tokenize = 'unicode61 remove_diacritics 2',
+            prefix = '2 3'
+        );
+    """)
+    conexao.execute("DELETE FROM busca_inscritos;")
+    conexao.execute("""
+        INSERT INTO busca_inscritos (rowid, nome, cpf)
+        SELECT (i.evento_id << 32) | i.ID, u.nome, u.cpf
+        FROM Inscricoes i
+        JOIN usuarios u ON u.cpf = i.atleta_cpf;
+    """)
+    conexao.execute("INSERT INTO busca_inscritos (busca_inscritos) VALUES ('optimize');")
+
+    conexao.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_busca_inscritos_inscricao_insert
+        AFTER INSERT ON Inscricoes
+        BEGIN
+            INSERT INTO busca_inscritos (rowid, nome, cpf)
+            SELECT (NEW.evento_id << 32) | NEW.ID, nome, cpf FROM usuarios WHERE cpf = NEW.atleta_cpf;
+        END;
+    """)
+    conexao.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_busca_inscritos_inscricao_delete
+        AFTER DELETE ON Inscricoes
+        BEGIN
+            DELETE FROM busca_inscritos WHERE rowid = (OLD.evento_id << 32) | OLD.ID;
+        END;
+    """)
+    conexao.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_busca_inscritos_inscricao_update
+        AFTER UPDATE OF atleta_cpf, evento_id ON Inscricoes
+        BEGIN
+            DELETE FROM busca_inscritos WHERE rowid = (OLD.evento_id << 32) | OLD.ID;
+            INSERT INTO busca_inscritos (rowid, nome, cpf)
+            SELECT (NEW.evento_id << 32) | NEW.ID, nome, cpf FROM usuarios WHERE cpf = NEW.atleta_cpf;
+        END;
+    """)
+    conexao.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_busca_inscritos_usuario_update
+        AFTER UPDATE OF nome ON usuarios
+        BEGIN
+            UPDATE busca_inscritos SET nome = NEW.nome
+            WHERE rowid IN (
+                SELECT (evento_id << 32) | ID FROM Inscricoes WHERE atleta_cpf = NEW.cpf
+            );
+        END;
+    """)
+
+
+def _criar_estatisticas_eventos(conexao: sqlite3.Connection):
+    # Estatísticas consolidadas por evento (JSON), em duas seções com marcadores
+    # próprios de desatualização. Os gatilhos apenas marcam a seção afetada; o
+    # recálculo fica com o EstatisticaDAO. Evento sem linha = tudo desatualizado
+    conexao.execute("""
+        CREATE TABLE IF NOT EXISTS EstatisticasEventos (
+            evento_id INTEGER PRIMARY KEY,
+            inscricoes TEXT,
+            resultados TEXT,
+            inscricoes_desatualizadas INTEGER NOT NULL DEFAULT 1,
+            resultados_desatualizados INTEGER NOT NULL DEFAULT 1,
+            atualizada_em TEXT,
+            FOREIGN KEY (evento_id) REFERENCES Eventos (id) ON DELETE CASCADE
+        );
+    """)
+
+    # Linhas já marcadas não são regravadas (importações disparam um gatilho por resultado)
+    marcar_inscricoes = ("UPDATE EstatisticasEventos SET inscricoes_desatualizadas = 1 "
+                         "WHERE evento_id = {evento} AND inscricoes_desatualizadas = 0;")
+    marcar_resultados = ("UPDATE EstatisticasEventos SET resultados_desatualizados = 1 "
+                         "WHERE evento_id = {evento} AND resultados_desatualizados = 0;")
+    # A entrega de kits (kit_entregue) e as classificações não alteram as estatísticas
+    gatilhos = {
+        'trg_estatisticas_inscricao_insert': (
+            "AFTER INSERT ON Inscricoes", marcar_inscricoes.format(evento='NEW.evento_id')),
+        'trg_estatisticas_inscricao_delete': (
+            "AFTER DELETE ON Inscricoes", marcar_inscricoes.format(evento='OLD.evento_id')),
+        'trg_estatisticas_inscricao_update': (
+            "AFTER UPDATE OF atleta_cpf, evento_id, kit_id ON Inscricoes",
+            marcar_inscricoes.format(evento='OLD.evento_id') + marcar_inscricoes.format(evento='NEW.evento_id')),
+        'trg_estatisticas_resultado_insert': (
+            "AFTER INSERT ON Resultados", marcar_resultados.format(evento='NEW.evento_id')),
+        'trg_estatisticas_resultado_delete': (
+            "AFTER DELETE ON Resultados", marcar_resultados.format(evento='OLD.evento_id')),
+        'trg_estatisticas_resultado_update': (
+            "AFTER UPDATE OF evento_id, genero_atleta, tempo_ms ON Resultados",
+            marcar_resultados.format(evento='OLD.evento_id') + marcar_resultados.format(evento='NEW.evento_id')),
+        'trg_estatisticas_usuario_update': (
+            "AFTER UPDATE OF genero, data_nascimento, pcd ON usuarios",
+            "UPDATE EstatisticasEventos SET inscricoes_desatualizadas = 1 "
+            "WHERE evento_id IN (SELECT evento_id FROM Inscricoes WHERE atleta_cpf = NEW.cpf);"),
+        'trg_estatisticas_kit_update': (
+            "AFTER UPDATE OF nome ON KitsDeCorrida", marcar_inscricoes.format(evento='NEW.evento_id')),
+        'trg_estatisticas_evento_update': (
+            "AFTER UPDATE OF data, distancia ON Eventos",
+            "UPDATE EstatisticasEventos SET inscricoes_desatualizadas = 1, resultados_desatualizados = 1 "
+            "WHERE evento_id = NEW.id;"),
+    }
+    for nome, (quando, acao) in gatilhos.items():
+        conexao.execute(f"CREATE TRIGGER IF NOT EXISTS {nome} {quando} BEGIN {acao} END;")
+
+
+def _adicionar_versao_resultados(conexao: sqlite3.Connection):
+    # Versão dos resultados de cada evento, usada como chave do cache de quadros
+    # de resultados (ResultadoDAO.buscar_quadro_resultados). Qualquer alteração em
+    # Resultados a incrementa; a publicação também (EventoDAO)
+    if 'versao_resultados' not in _colunas(conexao, 'Eventos'):
+        conexao.execute("ALTER TABLE Eventos ADD COLUMN versao_resultados INTEGER NOT NULL DEFAULT 0;")
+
+    incrementar = "UPDATE Eventos SET versao_resultados = versao_resultados + 1 WHERE id = {evento};"
+    gatilhos = {
+        'trg_versao_resultado_insert': (
+            "AFTER INSERT ON Resultados", incrementar.format(evento='NEW.evento_id')),
+        'trg_versao_resultado_delete': (
+            "AFTER DELETE ON Resultados", incrementar.format(evento='OLD.evento_id')),
+        'trg_versao_resultado_update': (
+            "AFTER UPDATE ON Resultados",
+            incrementar.format(evento='OLD.evento_id')
+            + "UPDATE Eventos SET versao_resultados = versao_resultados + 1 "
+              "WHERE id = NEW.evento_id AND id <> OLD.evento_id;"),
+    }
+    for nome, (quando, acao) in gatilhos.items():
+        conexao.execute(f"CREATE TRIGGER IF NOT EXISTS {nome} {quando} BEGIN {acao} END;")
+
+
+def _restringir_gatilho_estatisticas_usuario(conexao: sqlite3.Connection):
+    # UsuarioDAO.update regrava gênero e PCD a cada edição de perfil ou senha: o
+    # gatilho da migração 7 passa a agir só quando algum desses valores muda, e
+    # não regrava linhas já marcadas
+    conexao.execute("DROP TRIGGER IF EXISTS trg_estatisticas_usuario_update;")
+    conexao.execute("""
+        CREATE TRIGGER trg_estatisticas_usuario_update
+        AFTER UPDATE OF genero, data_nascimento, pcd ON usuarios
+        WHEN OLD.genero IS NOT NEW.genero
+          OR OLD.data_nascimento IS NOT NEW.data_nascimento
+          OR OLD.pcd IS NOT NEW.pcd
+        BEGIN
+            UPDATE EstatisticasEventos SET inscricoes_desatualizadas = 1
+            WHERE evento_id IN (SELECT evento_id FROM Inscricoes WHERE atleta_cpf = NEW.cpf)
+              AND inscricoes_desatualizadas = 0;
+        END;
+    """)
+
+
+def _indexar_chaves_estrangeiras(conexao: sqlite3.Connection):
+    # Com foreign_keys ligado, remover um kit procura inscrições pelo kit_id e
+    # remover um usuário procura eventos pelo organizador_cpf; sem índice, cada
+    # remoção percorria a tabela inteira. O índice do organizador também atende
+    # às listagens do painel do organizador
+    conexao.execute("CREATE INDEX IF NOT EXISTS idx_inscricoes_kit ON Inscricoes(kit_id);")
+    conexao.execute("CREATE INDEX IF NOT EXISTS idx_eventos_organizador ON Eventos(organizador_cpf);")
+
+
+# (versão, descrição, função), em ordem. As migrações precisam ser idempotentes:
+# bancos anteriores a schema_version recebem todas novamente.
+MIGRACOES = (
+    (1, 'Esquema inicial', _criar_esquema_inicial),
+    (2, 'Coluna resultados_publicados em Eventos', _adicionar_resultados_publicados),
+    (3, 'Data ISO indexada em Eventos', _adicionar_data_iso_eventos),
+    (4, 'Tempo em milissegundos indexado em Resultados', _adicionar_tempo_ms_resultados),
+    (5, 'Índices de Inscricoes e KitsDeCorrida e inscrição única por atleta/evento',
+     _indexar_inscricoes_e_kits),
+    (6, 'Busca textual (FTS5) de inscritos por nome e CPF', _criar_busca_inscritos),
+    (7, 'Estatísticas consolidadas por evento', _criar_estatisticas_eventos),
+    (8, 'Versão dos resultados por evento', _adicionar_versao_resultados),
+    (9, 'Gatilho de estatísticas só para mudanças reais no perfil do atleta',
+     _restringir_gatilho_estatisticas_usuario),
+    (10, 'Índices de Inscricoes.kit_id e Eventos.organizador_cpf', _indexar_chaves_estrangeiras),
+)
+
+VERSAO_ATUAL = MIGRACOES[-1][0]
+
+
+def versao_do_banco(db_path: str = DB_PATH_PADRAO) -> int:
+    """
+    Retorna a versão do esquema registrada no banco (0 se nunca migrado).
+
+    Args:
+        db_path: Caminho do arquivo SQLite
+
+    Returns:
+        Maior versão registrada em schema_version
+    """
+    conexao = GerenciadorConexao.para(db_path).conexao()
+    if not conexao.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schema_version';").fetchone():
+        return 0
+    return conexao.execute("SELECT COALESCE(MAX(versao), 0) FROM schema_version;").fetchone()[0]
+
+
+def aplicar_migracoes(db_path: str = DB_PATH_PADRAO) -> int:
+    """
+    Aplica as migrações pendentes em uma única transação.
+
+    Se o banco já está na versão atual, retorna sem ler nenhuma tabela. Em caso
+    de erro nenhuma migração é aplicada e a exceção é propagada.
+
+    Args:
+        db_path: Caminho do arquivo SQLite
+
+    Returns:
+        Quantidade de migrações aplicadas
+    """
+    banco = GerenciadorConexao.para(db_path)
+    if banco.conexao().execute("PRAGMA user_version;").fetchone()[0] >= VERSAO_ATUAL:
+        return 0
+
+    with banco.transacao(imediata=True) as conexao:
+        conexao.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                versao INTEGER PRIMARY KEY,
+                descricao TEXT NOT NULL,
+                aplicada_em TEXT NOT NULL
+            );
+        """)
+        versao_atual = versao_do_banco(db_path)
+
+        pendentes = [migracao for migracao in MIGRACOES if migracao[0] > versao_atual]
+        for versao, descricao, migrar in pendentes:
+            print(f"[MIGRACOES] Aplicando migração {versao}: {descricao}")
+            migrar(conexao)
+            conexao.execute(
+                "INSERT INTO schema_version (versao, descricao, aplicada_em) VALUES (?, ?, ?);",
+                (versao, descricao, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            )
+
+        conexao.execute(f"PRAGMA user_version = {VERSAO_ATUAL};")
+
+    return len(pendentes)
@@ -1,18 +1,28 @@
 # persistencia/resultado_dao.py
 import sqlite3
+import threading
+from collections import OrderedDict
 from typing import List, Optional
 from entidade.resultado import Resultado
+from entidade.lote_resultados import LoteResultados
+from entidade.quadro_resultados import ABA_GERAL, QuadroResultados, montar_quadro_resultados
+from persistencia.conexao import GerenciadorConexao
 
 
 class ResultadoDAO:
+
+    # Quadros de resultados mantidos em memória (os menos usados saem primeiro)
+    CAPACIDADE_CACHE_QUADROS = 8
+
+    # (db_path, evento_id) -> QuadroResultados, compartilhado por todos os DAOs
+    __quadros = OrderedDict()
+    __trava_quadros = threading.Lock()
+
     def __init__(self, db_path='banco.db'):
-        self.__db_path = db_path
+        self.__banco = GerenciadorConexao.para(db_path)
 
     def __conectar(self):
-        conexao = sqlite3.connect(self.__db_path)
-        conexao.row_factory = sqlite3.Row
-        conexao.execute("PRAGMA foreign_keys = ON")
-        return conexao
+        return self.__banco.conexao()
 
     def salvar_resultado(self, resultado: Resultado) -> bool:
         """
@@ -24,40 +34,34 @@ class ResultadoDAO:
         Returns:
             True se salvou com sucesso, False caso contrário
         """
-        conexao = None
         try:
-            conexao = self.__conectar()
-            cursor = conexao.cursor()
-            
-            cursor.execute("""
-                INSERT INTO Resultados 
-                (evento_id, cpf_atleta, nome_atleta, genero_atleta, 
-                 tempo_final, categoria, classificacao_geral, classificacao_categoria, pcd)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                resultado.evento_id,
-                resultado.cpf_atleta,
-                resultado.nome_atleta,
-                resultado.genero_atleta,
-                resultado.tempo_final,
-                resultado.categoria,
-                resultado.classificacao_geral,
-                resultado.classificacao_categoria,
-                1 if resultado.pcd else 0
-            ))
-            
-            resultado.id = cursor.lastrowid
-            conexao.commit()
+            with self.__banco.transacao(imediata=True) as conexao:
+                cursor = conexao.cursor()
+
+                cursor.execute("""
+                    INSERT INTO Resultados 
+                    (evento_id, cpf_atleta, nome_atleta, genero_atleta, 
+                     tempo_final, tempo_ms, categoria, classificacao_geral, classificacao_categoria, pcd)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    resultado.evento_id,
+                    resultado.cpf_atleta,
+                    resultado.nome_atleta,
+                    resultado.genero_atleta,
+                    resultado.tempo_final,
+                    resultado.tempo_ms,
+                    resultado.categoria,
+                    resultado.classificacao_geral,
+                    resultado.classificacao_categoria,
+                    1 if resultado.pcd else 0
+                ))
+
+                resultado.id = cursor.lastrowid
             return True
             
         except sqlite3.Error as e:
-            if conexao:
-                conexao.rollback()
             print(f"Erro ao salvar resultado: {e}")
             return False
-        finally:
-            if conexao:
-                conexao.close()
 
     def salvar_lote_resultados(self, resultados: List[Resultado]) -> int:
         """
@@ -72,44 +76,96 @@ class ResultadoDAO:
         if not resultados:
             return 0
         
-        conexao = None
         try:
-            conexao = self.__conectar()
-            cursor = conexao.cursor()
-            
-            # Inserir resultados e obter IDs
-            # SQLite não retorna lastrowid corretamente com executemany,
-            # então inserimos um por um para obter os IDs
-            for i, resultado in enumerate(resultados):
-                cursor.execute("""
-                    INSERT INTO Resultados 
-                    (evento_id, cpf_atleta, nome_atleta, genero_atleta, 
-                     tempo_final, categoria, classificacao_geral, classificacao_categoria, pcd)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    resultado.evento_id,
-                    resultado.cpf_atleta,
-                    resultado.nome_atleta,
-                    resultado.genero_atleta,
-                    resultado.tempo_final,
-                    resultado.categoria,
-                    resultado.classificacao_geral,
-                    resultado.classificacao_categoria,
-                    1 if resultado.pcd else 0
-                ))
-                resultado.id = cursor.lastrowid
-            
-            conexao.commit()
+            with self.__banco.transacao(imediata=True) as conexao:
+                self.__inserir(conexao.cursor(), resultados)
+
             return len(resultados)
             
         except sqlite3.Error as e:
-            if conexao:
-                conexao.rollback()
             print(f"Erro ao salvar lote de resultados: {e}")
             return 0
-        finally:
-            if conexao:
-                conexao.close()
+
+    def sincronizar_resultados(self, inserir: List[Resultado], atualizar: List[Resultado],
+                               ids_remover: List[int]) -> bool:
+        """
+        Aplica as diferenças de uma reimportação em uma única transação.
+        
+        Args:
+            inserir: Resultados novos (recebem o id gerado)
+            atualizar: Resultados existentes (com id) cujos dados ou classificações mudaram
+            ids_remover: IDs dos resultados que saíram do arquivo
+            
+        Returns:
+            True se aplicou todas as alterações, False caso contrário
+        """
+        try:
+            with self.__banco.transacao(imediata=True) as conexao:
+                cursor = conexao.cursor()
+
+                if ids_remover:
+                    cursor.executemany("DELETE FROM Resultados WHERE id = ?",
+                                       [(resultado_id,) for resultado_id in ids_remover])
+
+                if atualizar:
+                    cursor.executemany("""
+                        UPDATE Resultados SET
+                            nome_atleta = ?, genero_atleta = ?, tempo_final = ?, tempo_ms = ?,
+                            categoria = ?, classificacao_geral = ?, classificacao_categoria = ?, pcd = ?
+                        WHERE id = ?
+                    """, [(
+                        resultado.nome_atleta,
+                        resultado.genero_atleta,
+                        resultado.tempo_final,
+                        resultado.tempo_ms,
+                        resultado.categoria,
+                        resultado.classificacao_geral,
+                        resultado.classificacao_categoria,
+                        1 if resultado.pcd else 0,
+                        resultado.id
+                    ) for resultado in atualizar])
+
+                self.__inserir(cursor, inserir)
+
+            return True
+
+        except sqlite3.Error as e:
+            print(f"Erro ao sincronizar resultados: {e}")
+            return False
+
+    def __inserir(self, cursor, resultados: List[Resultado]):
+        """
+        Insere os resultados com um único executemany, preenchendo resultado.id.
+
+        Deve ser chamado dentro de uma transação: com AUTOINCREMENT, as linhas
+        inseridas por um mesmo comando recebem IDs consecutivos, terminando em
+        last_insert_rowid().
+        """
+        if not resultados:
+            return
+
+        cursor.executemany("""
+            INSERT INTO Resultados 
+            (evento_id, cpf_atleta, nome_atleta, genero_atleta, 
+             tempo_final, tempo_ms, categoria, classificacao_geral, classificacao_categoria, pcd)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, [(
+            resultado.evento_id,
+            resultado.cpf_atleta,
+            resultado.nome_atleta,
+            resultado.genero_atleta,
+            resultado.tempo_final,
+            resultado.tempo_ms,
+            resultado.categoria,
+            resultado.classificacao_geral,
+            resultado.classificacao_categoria,
+            1 if resultado.pcd else 0
+        ) for resultado in resultados])
+
+        ultimo_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+        primeiro_id = ultimo_id - len(resultados) + 1
+        for deslocamento, resultado in enumerate(resultados):
+            resultado.id = primeiro_id + deslocamento
 
     def buscar_resultados_por_evento(self, evento_id: int) -> List[Resultado]:
         """
@@ -121,7 +177,6 @@ class ResultadoDAO:
         Returns:
             Lista de objetos Resultado ordenados por tempo
         """
-        conexao = None
         try:
             conexao = self.__conectar()
             cursor = conexao.cursor()
@@ -129,7 +184,7 @@ class ResultadoDAO:
             cursor.execute("""
                 SELECT * FROM Resultados 
                 WHERE evento_id = ? 
-                ORDER BY tempo_final ASC
+                ORDER BY tempo_ms ASC, id ASC
             """, (evento_id,))
             
             rows = cursor.fetchall()
@@ -142,7 +197,8 @@ class ResultadoDAO:
                     genero_atleta=row['genero_atleta'],
                     tempo_final=row['tempo_final'],
                     categoria=row['categoria'],
-                    pcd=bool(row['pcd'])
+                    pcd=bool(row['pcd']),
+                    tempo_ms=row['tempo_ms']
                 )
                 resultado.id = row['id']
                 resultado.evento_id = row['evento_id']
@@ -155,9 +211,168 @@ class ResultadoDAO:
         except sqlite3.Error as e:
             print(f"Erro ao buscar resultados por evento: {e}")
             return []
-        finally:
-            if conexao:
-                conexao.close()
+
+    def buscar_quadro_resultados(self, evento_id: int) -> Optional[QuadroResultados]:
+        """
+        Retorna as tabelas da tela de resultados do evento, montadas uma vez por
+        versão dos resultados.
+
+        Os quadros ficam em um cache LRU em memória indexado por evento e
+        validado pela coluna Eventos.versao_resultados, incrementada pelos
+        gatilhos de Resultados (importação) e pela publicação. Uma exibição
+        repetida custa apenas a leitura dessa versão.
+
+        Args:
+            evento_id: ID do evento
+
+        Returns:
+            QuadroResultados (compartilhado, não deve ser alterado) ou None se o
+            evento não existir ou houver erro
+        """
+        chave = (self.__banco.db_path, evento_id)
+        try:
+            with self.__banco.transacao() as conexao:
+                linha = conexao.execute(
+                    "SELECT versao_resultados FROM Eventos WHERE id = ?;", (evento_id,)
+                ).fetchone()
+                if linha is None:
+                    return None
+                versao = linha['versao_resultados']
+
+                with self.__trava_quadros:
+                    quadro = self.__quadros.get(chave)
+                    if quadro is not None and quadro.versao == versao:
+                        self.__quadros.move_to_end(chave)
+                        return quadro
+
+                # Lido na mesma transação da versão, para que as duas correspondam
+                quadro = montar_quadro_resultados(
+                    evento_id, versao, self.__linhas_quadro_resultados(conexao, evento_id)
+                )
+
+        except sqlite3.Error as e:
+            print(f"Erro ao buscar quadro de resultados: {e}")
+            return None
+
+        with self.__trava_quadros:
+            self.__quadros[chave] = quadro
+            self.__quadros.move_to_end(chave)
+            while len(self.__quadros) > self.CAPACIDADE_CACHE_QUADROS:
+                self.__quadros.popitem(last=False)
+        return quadro
+
+    @staticmethod
+    def __linhas_quadro_resultados(conexao: sqlite3.Connection, evento_id: int) -> list:
+        """
+        Modelo de leitura da tela de resultados, baseado nas classificações
+        gravadas na importação (ver calcular_classificacoes).
+
+        Cada linha traz a aba em que aparece: 'PCD' para todos os atletas PCD
+        (que competem separadamente), 'Geral' para os demais com classificação
+        geral e a categoria do atleta para o restante. As linhas vêm ordenadas
+        por aba, gênero e classificação.
+
+        Returns:
+            Tuplas (aba, genero, nome, tempo, classificacao_geral, classificacao_categoria)
+        """
+        return conexao.execute(f"""
+            SELECT CASE WHEN pcd THEN 'PCD'
+                        WHEN classificacao_geral IS NOT NULL THEN '{ABA_GERAL}'
+                        ELSE categoria END AS aba,
+                   genero_atleta, nome_atleta, tempo_final,
+                   classificacao_geral, classificacao_categoria
+            FROM Resultados
+            WHERE evento_id = ?
+            ORDER BY aba, genero_atleta,
+                     classificacao_geral IS NULL, classificacao_geral,
+                     classificacao_categoria IS NULL, classificacao_categoria,
+                     tempo_ms, id;
+        """, (evento_id,)).fetchall()
+
+    def buscar_lote_resultados_por_evento(self, evento_id: int) -> LoteResultados:
+        """
+        Busca todos os resultados de um evento em um lote compacto, ordenados por tempo.
+
+        Indicado para leituras volumosas (relatórios e exportações), em que
+        manter um objeto Resultado por linha ocuparia muita memória.
+
+        Args:
+            evento_id: ID do evento
+
+        Returns:
+            LoteResultados ordenado por tempo (vazio em caso de erro)
+        """
+        lote = LoteResultados()
+        try:
+            conexao = self.__conectar()
+            cursor = conexao.execute("""
+                SELECT * FROM Resultados
+                WHERE evento_id = ?
+                ORDER BY tempo_ms ASC, id ASC
+            """, (evento_id,))
+
+            for row in cursor:
+                lote.adicionar_linha(row)
+
+            return lote
+
+        except sqlite3.Error as e:
+            print(f"Erro ao buscar lote de resultados por evento: {e}")
+            return LoteResultados()
+
+    def buscar_resultados_por_grupo(self, evento_id: int, genero_atleta: str,
+                                    categoria: Optional[str] = None) -> List[Resultado]:
+        """
+        Busca os resultados de um gênero (e opcionalmente de uma categoria) de um
+        evento, já ordenados por tempo pelo índice (evento_id, genero_atleta, categoria, tempo_ms).
+        
+        Args:
+            evento_id: ID do evento
+            genero_atleta: 'Masculino' ou 'Feminino'
+            categoria: Categoria ('Júnior', 'Adulto', 'Master', 'PCD') ou None para todas
+            
+        Returns:
+            Lista de objetos Resultado ordenados por tempo
+        """
+        try:
+            conexao = self.__conectar()
+            cursor = conexao.cursor()
+            
+            if categoria is None:
+                cursor.execute("""
+                    SELECT * FROM Resultados
+                    WHERE evento_id = ? AND genero_atleta = ?
+                    ORDER BY tempo_ms ASC, id ASC
+                """, (evento_id, genero_atleta))
+            else:
+                cursor.execute("""
+                    SELECT * FROM Resultados
+                    WHERE evento_id = ? AND genero_atleta = ? AND categoria = ?
+                    ORDER BY tempo_ms ASC, id ASC
+                """, (evento_id, genero_atleta, categoria))
+            
+            resultados = []
+            for row in cursor.fetchall():
+                resultado = Resultado(
+                    cpf_atleta=row['cpf_atleta'],
+                    nome_atleta=row['nome_atleta'],
+                    genero_atleta=row['genero_atleta'],
+                    tempo_final=row['tempo_final'],
+                    categoria=row['categoria'],
+                    pcd=bool(row['pcd']),
+                    tempo_ms=row['tempo_ms']
+                )
+                resultado.id = row['id']
+                resultado.evento_id = row['evento_id']
+                resultado.classificacao_geral = row['classificacao_geral']
+                resultado.classificacao_categoria = row['classificacao_categoria']
+                resultados.append(resultado)
+            
+            return resultados
+            
+        except sqlite3.Error as e:
+            print(f"Erro ao buscar resultados do grupo: {e}")
+            return []
 
     def buscar_resultado_por_cpf(self, cpf: str, evento_id: int) -> Optional[Resultado]:
         """
@@ -170,7 +385,6 @@ class ResultadoDAO:
         Returns:
             Objeto Resultado se encontrado, None caso contrário
         """
-        conexao = None
         try:
             conexao = self.__conectar()
             cursor = conexao.cursor()
@@ -189,7 +403,8 @@ class ResultadoDAO:
                     genero_atleta=row['genero_atleta'],
                     tempo_final=row['tempo_final'],
                     categoria=row['categoria'],
-                    pcd=bool(row['pcd'])
+                    pcd=bool(row['pcd']),
+                    tempo_ms=row['tempo_ms']
                 )
                 resultado.id = row['id']
                 resultado.evento_id = row['evento_id']
@@ -202,9 +417,6 @@ class ResultadoDAO:
         except sqlite3.Error as e:
             print(f"Erro ao buscar resultado por CPF: {e}")
             return None
-        finally:
-            if conexao:
-                conexao.close()
 
     def limpar_resultados_evento(self, evento_id: int) -> int:
         """
@@ -216,25 +428,37 @@ class ResultadoDAO:
         Returns:
             Número de resultados removidos
         """
-        conexao = None
         try:
-            conexao = self.__conectar()
-            cursor = conexao.cursor()
-            
-            cursor.execute("DELETE FROM Resultados WHERE evento_id = ?", (evento_id,))
-            
-            removidos = cursor.rowcount
-            conexao.commit()
+            with self.__banco.transacao(imediata=True) as conexao:
+                cursor = conexao.cursor()
+
+                cursor.execute("DELETE FROM Resultados WHERE evento_id = ?", (evento_id,))
+
+                removidos = cursor.rowcount
             return removidos
             
         except sqlite3.Error as e:
-            if conexao:
-                conexao.rollback()
             print(f"Erro ao limpar resultados do evento: {e}")
             return 0
-        finally:
-            if conexao:
-                conexao.close()
+
+    def checkpoint(self, modo: str = 'TRUNCATE') -> bool:
+        """
+        Descarrega o WAL no arquivo do banco, após gravações volumosas.
+
+        Args:
+            modo: Modo do PRAGMA wal_checkpoint (TRUNCATE também zera o arquivo -wal)
+
+        Returns:
+            True se o checkpoint foi concluído, False se leitores o impediram ou houve erro
+        """
+        try:
+            ocupado, paginas_no_wal, paginas_copiadas = self.__banco.checkpoint(modo)
+            print(f"Checkpoint {modo}: {paginas_copiadas}/{paginas_no_wal} páginas copiadas")
+            return not ocupado
+
+        except sqlite3.Error as e:
+            print(f"Erro ao executar checkpoint: {e}")
+            return False
 
     def contar_resultados_evento(self, evento_id: int) -> int:
         """
@@ -246,7 +470,6 @@ class ResultadoDAO:
         Returns:
             Número de resultados
         """
-        conexao = None
         try:
             conexao = self.__conectar()
             cursor = conexao.cursor()
@@ -259,9 +482,6 @@ class ResultadoDAO:
         except sqlite3.Error as e:
             print(f"Erro ao contar resultados: {e}")
             return 0
-        finally:
-            if conexao:
-                conexao.close()
 
     def atualizar_resultado(self, resultado: Resultado) -> bool:
         """
@@ -273,39 +493,33 @@ class ResultadoDAO:
         Returns:
             True se atualizou com sucesso, False caso contrário
         """
-        conexao = None
         try:
-            conexao = self.__conectar()
-            cursor = conexao.cursor()
-            
-            cursor.execute("""
-                UPDATE Resultados SET
-                    nome_atleta = ?, genero_atleta = ?, tempo_final = ?,
-                    categoria = ?, classificacao_geral = ?, classificacao_categoria = ?, pcd = ?
-                WHERE id = ?
-            """, (
-                resultado.nome_atleta,
-                resultado.genero_atleta,
-                resultado.tempo_final,
-                resultado.categoria,
-                resultado.classificacao_geral,
-                resultado.classificacao_categoria,
-                1 if resultado.pcd else 0,
-                resultado.id
-            ))
-            
-            sucesso = cursor.rowcount > 0
-            conexao.commit()
+            with self.__banco.transacao(imediata=True) as conexao:
+                cursor = conexao.cursor()
+
+                cursor.execute("""
+                    UPDATE Resultados SET
+                        nome_atleta = ?, genero_atleta = ?, tempo_final = ?, tempo_ms = ?,
+                        categoria = ?, classificacao_geral = ?, classificacao_categoria = ?, pcd = ?
+                    WHERE id = ?
+                """, (
+                    resultado.nome_atleta,
+                    resultado.genero_atleta,
+                    resultado.tempo_final,
+                    resultado.tempo_ms,
+                    resultado.categoria,
+                    resultado.classificacao_geral,
+                    resultado.classificacao_categoria,
+                    1 if resultado.pcd else 0,
+                    resultado.id
+                ))
+
+                sucesso = cursor.rowcount > 0
             return sucesso
             
         except sqlite3.Error as e:
-            if conexao:
-                conexao.rollback()
             print(f"Erro ao atualizar resultado: {e}")
             return False
-        finally:
-            if conexao:
-                conexao.close()
 
     def deletar_resultado(self, resultado_id: int) -> bool:
         """
@@ -317,25 +531,18 @@ class ResultadoDAO:
         Returns:
             True se deletou com sucesso, False caso contrário
         """
-        conexao = None
         try:
-            conexao = self.__conectar()
-            cursor = conexao.cursor()
-            
-            cursor.execute("DELETE FROM Resultados WHERE id = ?", (resultado_id,))
-            
-            sucesso = cursor.rowcount > 0
-            conexao.commit()
+            with self.__banco.transacao(imediata=True) as conexao:
+                cursor = conexao.cursor()
+
+                cursor.execute("DELETE FROM Resultados WHERE id = ?", (resultado_id,))
+
+                sucesso = cursor.rowcount > 0
             return sucesso
             
         except sqlite3.Error as e:
-            if conexao:
-                conexao.rollback()
             print(f"Erro ao deletar resultado: {e}")
             return False
-        finally:
-            if conexao:
-                conexao.close()
 
     def buscar_resultados_por_cpf_em_eventos_publicados(self, cpf: str) -> List[dict]:
         """
@@ -347,7 +554,6 @@ class ResultadoDAO:
         Returns:
             Lista de dicionários com dados do resultado e nome do evento
         """
-        conexao = None
         try:
             conexao = self.__conectar()
             cursor = conexao.cursor()
@@ -384,7 +590,4 @@ class ResultadoDAO:
         except sqlite3.Error as e:
             print(f"Erro ao buscar resultados por CPF em eventos publicados: {e}")
             return []
-        finally:
-            if conexao:
-                conexao.close()
 
@@ -1,60 +1,69 @@
 import sqlite3
 from entidade.atleta import Atleta
 from entidade.organizador import Organizador
+from persistencia.conexao import GerenciadorConexao
 
 
 class UsuarioDAO:
+    # Limite de parâmetros por consulta IN (...), abaixo do máximo do SQLite
+    TAMANHO_LOTE_CONSULTA = 500
 
     def __init__(self, db_path='banco.db'):
-        self.__db_path = db_path
+        self.__banco = GerenciadorConexao.para(db_path)
 
     def __conectar(self):
-        return sqlite3.connect(self.__db_path)
+        return self.__banco.conexao()
 
     def add(self, usuario):
-        conexao = self.__conectar()
-        cursor = conexao.cursor()
+        with self.__banco.transacao(imediata=True) as conexao:
+            cursor = conexao.cursor()
+
+            if isinstance(usuario, Atleta):
+                dados = (
+                    usuario.cpf,
+                    usuario.nome,
+                    usuario.email,
+                    usuario.senha_hash,
+                    '1',
+                    usuario.data_nascimento_str,
+                    usuario.genero,
+                    int(usuario.pcd)
+                )
 
+                sql = """
+                INSERT INTO usuarios (cpf, nome, email, senha_hash, perfil, data_nascimento, genero, pcd)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?);
+                """
+
+                cursor.execute(sql, dados)
+
+            if isinstance(usuario, Organizador):
+                dados = (
+                    usuario.cpf,
+                    usuario.nome,
+                    usuario.email,
+                    usuario.senha_hash,
+                    '0',
+                    None,
+                    None,
+                    None
+                )
 
-        if isinstance(usuario, Atleta):
-            dados = (
-                usuario.cpf,
-                usuario.nome,
-                usuario.email,
-                usuario.senha_hash,
-                '1',
-                usuario.data_nascimento_str,
-                usuario.genero,
-                int(usuario.pcd)
-            )
-
-            sql = """
-            INSERT INTO usuarios (cpf, nome, email, senha_hash, perfil, data_nascimento, genero, pcd)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?);
-            """
-
-            cursor.execute(sql, dados)
-
-        if isinstance(usuario, Organizador):
-            dados = (
-                usuario.cpf,
-                usuario.nome,
-                usuario.email,
-                usuario.senha_hash,
-                '0',
-                None,
-                None,
-                None
-            )
-
-            sql = """
-            INSERT INTO usuarios (cpf, nome, email, senha_hash, perfil, data_nascimento, genero, pcd)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?);
-            """
-
-            cursor.execute(sql, dados)
-        conexao.commit()
-        conexao.close()
+                sql = """
+                INSERT INTO usuarios (cpf, nome, email, senha_hash, perfil, data_nascimento, genero, pcd)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?);
+                """
+
+                cursor.execute(sql, dados)
+
+    @staticmethod
+    def __montar_usuario(dados):
+        """Monta o Atleta ou Organizador de uma linha da tabela usuarios (sem revalidação)."""
+        if dados['perfil'] == '1':
+            return Atleta.from_row(dados)
+        if dados['perfil'] == '0':
+            return Organizador.from_row(dados)
+        return None
 
     def get(self, cpf):
         conexao = self.__conectar()
@@ -63,33 +72,40 @@ class UsuarioDAO:
         sql = "SELECT * FROM usuarios WHERE cpf = ?;"
         cursor.execute(sql, (cpf,))
         dados_tupla = cursor.fetchone()
-        conexao.close()
 
         if not dados_tupla:
             return None
 
-        if dados_tupla[4] == '1':
-            data_nascimento_str_banco = dados_tupla[5]
-            usuario = Atleta(
-                nome = dados_tupla[1],
-                cpf=dados_tupla[0],
-                email=dados_tupla[2],
-                senha_hash=dados_tupla[3],
-                data_nascimento = data_nascimento_str_banco.split(' ')[0],
-                genero=dados_tupla[6],
-                pcd=bool(dados_tupla[7])
-            )
-            return usuario
-
-        if dados_tupla[4] == '0':
-            usuario = Organizador(
-                nome = dados_tupla[1],
-                cpf=dados_tupla[0],
-                email=dados_tupla[2],
-                senha_hash=dados_tupla[3]
-            )
-            return usuario
-        return None
+        return self.__montar_usuario(dados_tupla)
+
+    def get_many(self, cpfs):
+        """
+        Busca vários usuários de uma vez, em consultas IN (...) divididas em lotes.
+
+        Args:
+            cpfs: Coleção de CPFs (somente dígitos)
+
+        Returns:
+            Dicionário {cpf: Atleta | Organizador} apenas com os CPFs encontrados
+        """
+        cpfs = list(dict.fromkeys(cpfs))
+        usuarios = {}
+        if not cpfs:
+            return usuarios
+
+        conexao = self.__conectar()
+        cursor = conexao.cursor()
+
+        for inicio in range(0, len(cpfs), self.TAMANHO_LOTE_CONSULTA):
+            lote = cpfs[inicio:inicio + self.TAMANHO_LOTE_CONSULTA]
+            marcadores = ', '.join('?' * len(lote))
+            sql = f"SELECT * FROM usuarios WHERE cpf IN ({marcadores});"
+            cursor.execute(sql, lote)
+            for dados_tupla in cursor.fetchall():
+                usuario = self.__montar_usuario(dados_tupla)
+                if usuario is not None:
+                    usuarios[dados_tupla['cpf']] = usuario
+        return usuarios
 
     def get_all(self):
         conexao = self.__conectar()
@@ -97,90 +113,66 @@ class UsuarioDAO:
 
         sql = "SELECT * FROM usuarios"
         cursor.execute(sql)
-        lista_dados = cursor.fetchall()
-        conexao.close()
 
         usuarios = []
-        for dados_tupla in lista_dados:
-            if dados_tupla[4] == '1':
-                usuario = Atleta(
-                    nome=dados_tupla[1],
-                    cpf=dados_tupla[0],
-                    email=dados_tupla[2],
-                    senha_hash=dados_tupla[3],
-                    data_nascimento=dados_tupla[5],
-                    genero=dados_tupla[6],
-                    pcd=bool(dados_tupla[7])
-                )
-            if dados_tupla[4] == '0':
-                usuario = Organizador(
-                    nome=dados_tupla[1],
-                    cpf=dados_tupla[0],
-                    email=dados_tupla[2],
-                    senha_hash=dados_tupla[3]
-                )
-            usuarios.append(usuario)
+        for dados_tupla in cursor:
+            usuario = self.__montar_usuario(dados_tupla)
+            if usuario is not None:
+                usuarios.append(usuario)
         return usuarios
 
     def update(self, usuario):
-        conexao = self.__conectar()
-        cursor = conexao.cursor()
-
-        if isinstance(usuario, Atleta):
-            dados = (
-                usuario.nome,
-                usuario.email,
-                usuario.senha_hash,
-                '1',
-                usuario.genero,
-                int(usuario.pcd),
-                usuario.cpf
-            )
-            sql = """UPDATE usuarios SET 
-            NOME = ?,
-            EMAIL = ?,
-            SENHA_HASH = ?,
-            PERFIL = ?,
-            GENERO = ?,
-            pcd = ?
-            WHERE cpf = ?; """
-            cursor.execute(sql, dados)
-
-        if isinstance(usuario, Organizador):
-            dados = (
-                usuario.nome,
-                usuario.email,
-                usuario.senha_hash,
-                usuario.cpf
-            )
-            sql = """UPDATE usuarios SET 
-            NOME = ?,
-            EMAIL = ?,
-            SENHA_HASH = ?
-            WHERE cpf = ?;"""
-            cursor.execute(sql, dados)
-        conexao.commit()
-        conexao.close()
+        with self.__banco.transacao(imediata=True) as conexao:
+            cursor = conexao.cursor()
+
+            if isinstance(usuario, Atleta):
+                dados = (
+                    usuario.nome,
+                    usuario.email,
+                    usuario.senha_hash,
+                    '1',
+                    usuario.genero,
+                    int(usuario.pcd),
+                    usuario.cpf
+                )
+                sql = """UPDATE usuarios SET
+                NOME = ?,
+                EMAIL = ?,
+                SENHA_HASH = ?,
+                PERFIL = ?,
+                GENERO = ?,
+                pcd = ?
+                WHERE cpf = ?; """
+                cursor.execute(sql, dados)
+
+            if isinstance(usuario, Organizador):
+                dados = (
+                    usuario.nome,
+                    usuario.email,
+                    usuario.senha_hash,
+                    usuario.cpf
+                )
+                sql = """UPDATE usuarios SET
+                NOME = ?,
+                EMAIL = ?,
+                SENHA_HASH = ?
+                WHERE cpf = ?;"""
+                cursor.execute(sql, dados)
         return True
 
     def remove(self, cpf):
-        conexao = self.__conectar()
-        cursor = conexao.cursor()
-
         try:
-            sql_delete_inscricoes = "DELETE FROM inscricoes WHERE atleta_cpf = ?;"
-            cursor.execute(sql_delete_inscricoes, (cpf,))
+            with self.__banco.transacao(imediata=True) as conexao:
+                cursor = conexao.cursor()
+
+                sql_delete_inscricoes = "DELETE FROM inscricoes WHERE atleta_cpf = ?;"
+                cursor.execute(sql_delete_inscricoes, (cpf,))
 
-            sql_delete_usuario = "DELETE FROM usuarios WHERE cpf = ?;"
-            cursor.execute(sql_delete_usuario, (cpf,))
+                sql_delete_usuario = "DELETE FROM usuarios WHERE cpf = ?;"
+                cursor.execute(sql_delete_usuario, (cpf,))
 
-            conexao.commit()
             return True
 
         except sqlite3.Error as e:
             print(f"Erro ao excluir usuário: {e}")
-            conexao.rollback()
             return False
-
-        finally:
-            conexao.close()
\ No newline at end of file
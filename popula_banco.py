@@ -4,6 +4,7 @@ from datetime import datetime
 
 # Script gerador de evento, inscrições e CSV de resultados válidos
 import gerar_evento_teste
+from entidade.evento import converter_data_iso
 
 
 STATUS_PENDENTE = 1
@@ -159,11 +160,11 @@ def popular_eventos(cursor):
 
     sql = """
     INSERT INTO Eventos
-    (id, nome, data, distancia, local_largada, tempo_corte, data_limite_cred, organizador_cpf)
-    VALUES (?, ?, ?, ?, ?, ?, ?, ?);
+    (id, nome, data, distancia, local_largada, tempo_corte, data_limite_cred, organizador_cpf, data_iso)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);
     """
 
-    cursor.executemany(sql, dados_eventos)
+    cursor.executemany(sql, [(*dados, converter_data_iso(dados[2])) for dados in dados_eventos])
     print(f"{cursor.rowcount} eventos inseridos.")
 
 
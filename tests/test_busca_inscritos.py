@@ -0,0 +1,131 @@
+import contextlib
+import io
+import random
+import sqlite3
+import time
+
+import pytest
+
+from persistencia.conexao import GerenciadorConexao
+from persistencia.inscricao_dao import InscricaoDAO
+from persistencia.migracoes import aplicar_migracoes
+
+# Critério do balcão de kits: busca em menos de 10 ms em um evento com 30 mil inscritos
+ORCAMENTO_BUSCA_MS = 10
+TOTAL_INSCRITOS_EVENTO_GRANDE = 30000
+
+
+def criar_banco(db_path: str, inscritos_por_evento: dict) -> GerenciadorConexao:
+    """Cria os eventos {evento_id: [(cpf, nome), ...]} com um kit e as inscrições indicadas."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        aplicar_migracoes(db_path)
+    banco = GerenciadorConexao.para(db_path)
+    with banco.transacao(imediata=True) as conexao:
+        conexao.execute("INSERT INTO usuarios VALUES ('00000000000', 'Org', 'o@o', 'x', 'organizador', NULL, NULL, 0);")
+        for evento_id, inscritos in inscritos_por_evento.items():
+            conexao.execute("""
+                INSERT INTO Eventos (id, nome, data, distancia, organizador_cpf)
+                VALUES (?, 'Corrida', '01/01/2025', 10, '00000000000');
+            """, (evento_id,))
+            kit_id = conexao.execute(
+                "INSERT INTO KitsDeCorrida (nome, valor, evento_id) VALUES ('Básico', 50, ?);", (evento_id,)
+            ).lastrowid
+            conexao.executemany(
+                "INSERT OR IGNORE INTO usuarios VALUES (?, ?, 'a@a', 'x', 'atleta', '01/01/1990', 'Feminino', 0);",
+                inscritos)
+            conexao.executemany("""
+                INSERT INTO Inscricoes (data_inscricao, status, atleta_cpf, evento_id, kit_id)
+                VALUES ('01/12/2024', 1, ?, ?, ?);
+            """, [(cpf, evento_id, kit_id) for cpf, _ in inscritos])
+    return banco
+
+
+@pytest.fixture
+def dao(tmp_path):
+    db_path = str(tmp_path / 'banco.db')
+    banco = criar_banco(db_path, {
+        1: [('11122233344', 'João Pedro Álvares'), ('55566677788', 'Joana Silva'),
+            ('99988877766', 'MARIA JOSÉ'), ('12312312312', 'Pedro Joaquim')],
+        2: [('44455566677', 'João Pedro Outro Evento')],
+    })
+    yield InscricaoDAO(db_path)
+    banco.fechar()
+
+
+def nomes(resultados):
+    return [resultado['atleta_nome'] for resultado in resultados]
+
+
+@pytest.mark.parametrize('termo, esperado', [
+    ('joao ped', ['João Pedro Álvares']),
+    ('JOÃO PEDRO', ['João Pedro Álvares']),
+    ('alvares', ['João Pedro Álvares']),
+    ('maria jose', ['MARIA JOSÉ']),
+    ('José', ['MARIA JOSÉ']),
+    ('111.222', ['João Pedro Álvares']),
+    ('xavier', []),
+])
+def test_busca_ignora_acentos_e_maiusculas_e_casa_prefixos(dao, termo, esperado):
+    assert nomes(dao.buscar_por_nome_ou_cpf(1, termo)) == esperado
+
+
+def test_busca_fica_restrita_ao_evento(dao):
+    assert nomes(dao.buscar_por_nome_ou_cpf(2, 'joao')) == ['João Pedro Outro Evento']
+
+
+def test_prefixo_curto_retorna_em_ordem_alfabetica(dao):
+    assert nomes(dao.buscar_por_nome_ou_cpf(1, 'jo')) == [
+        'Joana Silva', 'João Pedro Álvares', 'MARIA JOSÉ', 'Pedro Joaquim']
+
+
+def test_muitos_casamentos_dispensam_relevancia(dao, monkeypatch):
+    monkeypatch.setattr(InscricaoDAO, 'MAXIMO_CASAMENTOS_RELEVANCIA', 1)
+    assert nomes(dao.buscar_por_nome_ou_cpf(1, 'pedro', limite=1)) == ['João Pedro Álvares']
+
+
+@pytest.mark.parametrize('termo, consulta', [
+    ('joao ped', 'nome : "joao"* AND nome : "ped"*'),
+    ('123.456.789-0', 'cpf : "1234567890"*'),
+    ('ana" OR cpf:*', 'nome : "ana"* AND nome : "OR"* AND nome : "cpf"*'),
+    ('NEAR(ana (silva', 'nome : "NEAR"* AND nome : "ana"* AND nome : "silva"*'),
+    ('-', None),
+    ('', None),
+])
+def test_consulta_busca_escapa_sintaxe_fts(termo, consulta):
+    assert InscricaoDAO.montar_consulta_busca(termo) == consulta
+
+
+@pytest.mark.parametrize('termo', ['ana" OR cpf:*', 'NEAR(ana (silva', "o'brien ^ana", 'a:b -c +d'])
+def test_consulta_com_sintaxe_fts_e_valida(termo):
+    # Aspas, operadores e parênteses digitados viram texto comum, nunca erro de sintaxe
+    conexao = sqlite3.connect(':memory:')
+    conexao.execute("CREATE VIRTUAL TABLE busca USING fts5(nome, cpf);")
+    conexao.execute("SELECT * FROM busca WHERE busca MATCH ?;", (InscricaoDAO.montar_consulta_busca(termo),))
+
+
+def test_busca_em_evento_grande_respeita_orcamento(tmp_path):
+    aleatorio = random.Random(1)
+    prenomes = ['João', 'José', 'Joana', 'Ana', 'Ana Clara', 'Maria', 'Mariana', 'Marcos',
+                'Pedro', 'Paulo', 'Lucas', 'Luana', 'Carlos', 'Carla', 'Sofia', 'Antônio']
+    sobrenomes = ['Silva', 'Santos', 'Oliveira', 'Souza', 'Martins', 'Pereira', 'Pedrosa',
+                  'Lima', 'Costa', 'Sá', 'Almeida', 'Andrade']
+    inscritos = [
+        (f'{i:011d}', f'{aleatorio.choice(prenomes)} {aleatorio.choice(sobrenomes)} {aleatorio.choice(sobrenomes)}')
+        for i in range(1, TOTAL_INSCRITOS_EVENTO_GRANDE + 1)
+    ]
+    db_path = str(tmp_path / 'banco.db')
+    banco = criar_banco(db_path, {1: inscritos})
+    dao = InscricaoDAO(db_path)
+    try:
+        for termo in ['j', 'jo', 'ana s', 'mar', 'silva', 'joao ped', 'maria silva s', '00000']:
+            dao.buscar_por_nome_ou_cpf(1, termo)
+            tempos = []
+            for _ in range(5):
+                inicio = time.perf_counter()
+                resultados = dao.buscar_por_nome_ou_cpf(1, termo)
+                tempos.append((time.perf_counter() - inicio) * 1000)
+            assert resultados, termo
+            mediana_ms = sorted(tempos)[len(tempos) // 2]
+            assert mediana_ms < ORCAMENTO_BUSCA_MS, f'{termo!r}: {mediana_ms:.1f} ms'
+    finally:
+        banco.fechar()
@@ -0,0 +1,41 @@
+from datetime import date
+
+import pytest
+
+from entidade.atleta import Atleta
+
+
+def atleta(data_nascimento, pcd=False):
+    return Atleta.from_row({
+        'cpf': '12345678901', 'nome': 'Atleta', 'email': 'atleta@teste.com',
+        'senha_hash': '', 'data_nascimento': data_nascimento,
+        'genero': 'Masculino', 'pcd': pcd,
+    })
+
+
+def categoria_pela_idade_em_31_12(nascimento: date, ano_evento: int) -> str:
+    # Referência direta da RN04/RN07: idade completa em 31/12 do ano do evento
+    fim_do_ano = date(ano_evento, 12, 31)
+    idade = fim_do_ano.year - nascimento.year - (
+        (fim_do_ano.month, fim_do_ano.day) < (nascimento.month, nascimento.day))
+    if idade <= 17:
+        return 'Júnior'
+    if idade <= 49:
+        return 'Adulto'
+    return 'Master'
+
+
+@pytest.mark.parametrize('data_evento', ['01/01/2025', '15/06/2025', '31/12/2025'])
+@pytest.mark.parametrize('nascimento', [
+    date(2007, 12, 31), date(2008, 1, 1),    # fronteira Júnior/Adulto
+    date(1975, 12, 31), date(1976, 1, 1),    # fronteira Adulto/Master
+    date(2007, 1, 1), date(2008, 12, 31), date(1975, 1, 1), date(1976, 12, 31),
+])
+def test_categoria_segue_idade_em_31_de_dezembro(nascimento, data_evento):
+    esperado = categoria_pela_idade_em_31_12(nascimento, 2025)
+    assert atleta(nascimento.isoformat()).calcular_categoria(data_evento) == esperado
+
+
+@pytest.mark.parametrize('nascimento', ['2010-05-05', '1990-05-05', '1950-05-05'])
+def test_pcd_prevalece_sobre_a_idade(nascimento):
+    assert atleta(nascimento, pcd=True).calcular_categoria('31/12/2025') == 'PCD'
@@ -0,0 +1,163 @@
+import contextlib
+import io
+import threading
+
+from entidade.resultado import Resultado
+from persistencia.conexao import GerenciadorConexao
+from persistencia.estatistica_dao import EstatisticaDAO
+from persistencia.inscricao_dao import InscricaoDAO
+from persistencia.migracoes import aplicar_migracoes
+from persistencia.resultado_dao import ResultadoDAO
+
+TOTAL_INSCRITOS = 200
+REPETICOES = 100
+
+
+def criar_banco(db_path: str) -> tuple:
+    """Cria um evento com TOTAL_INSCRITOS inscrições e retorna (evento_id, IDs das inscrições)."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        aplicar_migracoes(db_path)
+    banco = GerenciadorConexao.para(db_path)
+    with banco.transacao(imediata=True) as conexao:
+        conexao.execute("INSERT INTO usuarios VALUES ('00000000000', 'Org', 'o@o', 'x', 'organizador', NULL, NULL, 0);")
+        evento_id = conexao.execute(
+            "INSERT INTO Eventos (nome, data, distancia, organizador_cpf) VALUES ('Corrida', '01/01/2025', 10, '00000000000');"
+        ).lastrowid
+        kit_id = conexao.execute(
+            "INSERT INTO KitsDeCorrida (nome, valor, evento_id) VALUES ('Básico', 50, ?);", (evento_id,)
+        ).lastrowid
+        for i in range(1, TOTAL_INSCRITOS + 1):
+            cpf = f'{i:011d}'
+            conexao.execute("INSERT INTO usuarios VALUES (?, ?, 'a@a', 'x', 'atleta', '01/01/1990', 'Feminino', 0);",
+                            (cpf, f'Atleta {i}'))
+            conexao.execute("""
+                INSERT INTO Inscricoes (data_inscricao, status, atleta_cpf, evento_id, kit_id)
+                VALUES ('01/12/2024', 1, ?, ?, ?);
+            """, (cpf, evento_id, kit_id))
+    ids = [linha[0] for linha in banco.conexao().execute("SELECT ID FROM Inscricoes;")]
+    banco.fechar()
+    return evento_id, ids
+
+
+def test_escritas_simultaneas_nao_falham_com_banco_bloqueado(tmp_path):
+    # Dois balcões de kits e a atualização das estatísticas gravando ao mesmo
+    # tempo: cada unidade lê e depois grava, o caso em que uma transação
+    # adiada falharia com SQLITE_BUSY_SNAPSHOT ("database is locked")
+    db_path = str(tmp_path / 'banco.db')
+    evento_id, ids = criar_banco(db_path)
+    erros = []
+    inicio = threading.Barrier(3)
+
+    def executar(unidade):
+        try:
+            inicio.wait()
+            with contextlib.redirect_stdout(io.StringIO()):
+                for repeticao in range(REPETICOES):
+                    unidade(repeticao)
+        except Exception as e:
+            erros.append(e)
+        finally:
+            GerenciadorConexao.fechar_conexoes_da_thread()
+
+    def balcao(metade):
+        def unidade(repeticao):
+            InscricaoDAO(db_path).atualizar_kits_por_ids(evento_id, ids[metade::2], repeticao % 2 == 0)
+        return unidade
+
+    def estatisticas(_):
+        # O DAO trata sqlite3.Error e retorna None
+        assert EstatisticaDAO(db_path).atualizar(evento_id) is not None
+
+    threads = [threading.Thread(target=executar, args=(unidade,))
+               for unidade in (balcao(0), balcao(1), estatisticas)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not erros, erros
+
+
+TOTAL_RESULTADOS_LOTE = 50000
+LEITORES = 3
+
+
+def test_leituras_nao_esperam_pela_gravacao_de_um_lote(tmp_path):
+    # Uma importação grande de resultados aberta enquanto atletas consultam os
+    # próprios resultados: no WAL, as leituras seguem sem esperar pela gravação
+    db_path = str(tmp_path / 'banco.db')
+    criar_banco(db_path)
+    cpf = f'{1:011d}'
+    banco = GerenciadorConexao.para(db_path)
+    with banco.transacao(imediata=True) as conexao:
+        publicado_id = conexao.execute("""
+            INSERT INTO Eventos (nome, data, distancia, organizador_cpf, resultados_publicados)
+            VALUES ('Publicada', '01/06/2024', 5, '00000000000', 1);
+        """).lastrowid
+        conexao.execute("""
+            INSERT INTO Resultados (evento_id, cpf_atleta, nome_atleta, genero_atleta, tempo_final, tempo_ms, categoria)
+            VALUES (?, ?, 'Atleta 1', 'Feminino', '00:30:00', 1800000, 'Adulto');
+        """, (publicado_id, cpf))
+        importado_id = conexao.execute(
+            "INSERT INTO Eventos (nome, data, distancia, organizador_cpf) VALUES ('Importada', '01/01/2025', 10, '00000000000');"
+        ).lastrowid
+    banco.fechar()
+
+    lote = []
+    for i in range(TOTAL_RESULTADOS_LOTE):
+        resultado = Resultado(f'{i:011d}', f'Atleta {i}', 'Masculino', '00:45:00', 'Adulto')
+        resultado.evento_id = importado_id
+        lote.append(resultado)
+
+    transacao_aberta = threading.Event()
+    transacao_fechada = threading.Event()
+    leituras_durante_gravacao = []
+    erros = []
+    salvos = []
+    inicio = threading.Barrier(LEITORES + 1)
+
+    def acompanhar(sql):
+        # Chamado pelo SQLite a cada comando da conexão de gravação
+        comando = sql.lstrip().upper()
+        if comando.startswith('INSERT'):
+            transacao_aberta.set()
+        elif comando.startswith('COMMIT') and transacao_aberta.is_set():
+            transacao_fechada.set()
+
+    def gravar():
+        try:
+            GerenciadorConexao.para(db_path).conexao().set_trace_callback(acompanhar)
+            inicio.wait()
+            # Retorna 0 se a gravação falhar (o DAO trata sqlite3.Error)
+            salvos.append(ResultadoDAO(db_path).salvar_lote_resultados(lote))
+        except Exception as e:
+            erros.append(e)
+        finally:
+            transacao_fechada.set()
+            GerenciadorConexao.fechar_conexoes_da_thread()
+
+    def ler():
+        try:
+            inicio.wait()
+            dao = ResultadoDAO(db_path)
+            while not transacao_fechada.is_set():
+                durante = transacao_aberta.is_set()
+                resultados = dao.buscar_resultados_por_cpf_em_eventos_publicados(cpf)
+                # O DAO trata sqlite3.Error (inclusive "database is locked") e retorna []
+                assert [r['evento_id'] for r in resultados] == [publicado_id], resultados
+                if durante and not transacao_fechada.is_set():
+                    leituras_durante_gravacao.append(1)
+        except Exception as e:
+            erros.append(e)
+        finally:
+            GerenciadorConexao.fechar_conexoes_da_thread()
+
+    threads = [threading.Thread(target=gravar)] + [threading.Thread(target=ler) for _ in range(LEITORES)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not erros, erros
+    assert salvos == [TOTAL_RESULTADOS_LOTE]
+    assert leituras_durante_gravacao, 'nenhuma leitura terminou com a gravação em andamento'
@@ -0,0 +1,29 @@
+import contextlib
+import io
+
+from controle.controlador_entrega_kits import ControladorEntregaKits
+from persistencia.conexao import GerenciadorConexao
+from persistencia.inscricao_dao import InscricaoDAO
+from tests.test_concorrencia import criar_banco
+
+
+def test_conciliacao_lista_os_cpfs_sem_inscricao(tmp_path):
+    db_path = str(tmp_path / 'banco.db')
+    evento_id, _ = criar_banco(db_path)
+    arquivo = tmp_path / 'kits.csv'
+    arquivo.write_text('cpf\n000.000.000-01\n99999999999\n00000000002\n88888888888\nabc\n', encoding='utf-8')
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            controlador = ControladorEntregaKits(InscricaoDAO(db_path), evento_id)
+            controlador.conciliar_cpfs_csv(str(arquivo))
+            resumo = controlador.conciliar_cpfs_csv(str(arquivo))
+    finally:
+        GerenciadorConexao.para(db_path).fechar()
+
+    # A tela lista os CPFs sem interpretar as situações gravadas pelo DAO
+    assert resumo['cpfs_nao_encontrados'] == ['99999999999', '88888888888']
+    assert resumo['nao_encontrados'] == 2
+    assert resumo['inalterados'] == 2
+    assert resumo['atualizados'] == 0
+    assert resumo['linhas_invalidas'] == 1
@@ -0,0 +1,71 @@
+import json
+import os
+import re
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_import_pacehub_nao_carrega_gui_nem_bcrypt():
+    # A linha de comando não deve carregar a interface gráfica nem o bcrypt;
+    # um import antecipado em controle/ ou entidade/ desfaria isso sem aviso
+    codigo = ("import pacehub, sys; "
+              "assert 'FreeSimpleGUI' not in sys.modules, 'FreeSimpleGUI carregado'; "
+              "assert 'bcrypt' not in sys.modules, 'bcrypt carregado'")
+    processo = subprocess.run([sys.executable, '-c', codigo], cwd=RAIZ,
+                              capture_output=True, text=True)
+    assert processo.returncode == 0, processo.stderr
+
+
+# Orçamento da partida até a janela de login: `import main`, a checagem de
+# migrações e a construção do ControladorSistema. Medido em ~15 ms; o
+# FreeSimpleGUI sozinho custa ~45 ms, então carregá-lo cedo estoura o limite
+ORCAMENTO_PARTIDA_MS = 30
+
+SCRIPT_PARTIDA = """
+import contextlib, io, json, sys
+import main
+from controle.controlador_sistema import ControladorSistema
+from persistencia.migracoes import aplicar_migracoes
+with contextlib.redirect_stdout(io.StringIO()):
+    aplicar_migracoes(sys.argv[1])
+ControladorSistema()
+print(json.dumps(sorted(sys.modules)))
+"""
+
+LINHA_IMPORTTIME = re.compile(r'import time:\s+\d+ \|\s+(\d+) \|( +)(\S+)')
+
+
+def tempo_total_importacoes_us(saida_importtime):
+    # Soma o tempo acumulado apenas dos imports de primeiro nível (um espaço
+    # antes do nome); os aninhados já estão contados no módulo que os importou
+    total = 0
+    for linha in saida_importtime.splitlines():
+        correspondencia = LINHA_IMPORTTIME.match(linha)
+        if correspondencia and len(correspondencia.group(2)) == 1:
+            total += int(correspondencia.group(1))
+    return total
+
+
+def test_partida_ate_o_login_respeita_orcamento(tmp_path):
+    processo = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', SCRIPT_PARTIDA,
+         str(tmp_path / 'banco.db')],
+        cwd=RAIZ, capture_output=True, text=True)
+    assert processo.returncode == 0, processo.stderr
+
+    total_ms = tempo_total_importacoes_us(processo.stderr) / 1000
+    assert total_ms < ORCAMENTO_PARTIDA_MS, (
+        f"imports da partida levaram {total_ms:.1f} ms "
+        f"(orçamento: {ORCAMENTO_PARTIDA_MS} ms)")
+
+    modulos = set(json.loads(processo.stdout))
+    assert 'FreeSimpleGUI' not in modulos
+    assert 'bcrypt' not in modulos
+    carregados_cedo = sorted(
+        nome for nome in modulos
+        if (nome.startswith('limite.') and nome != 'limite.tela_principal')
+        or (nome.startswith('controle.') and nome != 'controle.controlador_sistema')
+        or (nome.startswith('persistencia.') and nome.endswith('_dao')))
+    assert not carregados_cedo, f"carregados antes do login: {carregados_cedo}"
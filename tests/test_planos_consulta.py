@@ -0,0 +1,138 @@
+import contextlib
+import io
+import re
+
+import pytest
+
+from entidade.evento import Evento
+from persistencia.conexao import GerenciadorConexao
+from persistencia.evento_dao import EventoDAO
+from persistencia.ficha_medica_dao import FichaMedicaDAO
+from persistencia.inscricao_dao import InscricaoDAO
+from persistencia.migracoes import aplicar_migracoes
+from persistencia.resultado_dao import ResultadoDAO
+from persistencia.usuario_dao import UsuarioDAO
+
+CPF = '12345678901'
+EVENTO_ID = 1
+
+
+@pytest.fixture
+def banco(tmp_path):
+    db_path = str(tmp_path / 'banco.db')
+    with contextlib.redirect_stdout(io.StringIO()):
+        aplicar_migracoes(db_path)
+    yield GerenciadorConexao.para(db_path)
+    GerenciadorConexao.para(db_path).fechar()
+
+
+def planos_das_consultas(banco, chamada, tabela, comando='SELECT'):
+    """Executa a chamada de DAO e retorna o plano de cada comando emitido sobre a tabela."""
+    conexao = banco.conexao()
+    comandos = []
+    conexao.set_trace_callback(comandos.append)
+    try:
+        chamada()
+    finally:
+        conexao.set_trace_callback(None)
+
+    consultas = [sql for sql in comandos
+                 if sql.lstrip().upper().startswith(comando) and tabela.lower() in sql.lower()]
+    assert consultas, f'nenhum {comando} sobre {tabela}'
+    # Os DAOs escrevem o nome das tabelas ora em minúsculas, ora não
+    return [
+        ' | '.join(linha['detail'] for linha in conexao.execute('EXPLAIN QUERY PLAN ' + sql)).lower()
+        for sql in consultas
+    ]
+
+
+def evento_sem_kits():
+    evento = Evento('Corrida', '01/01/2025', 10, 'Centro', '02:00:00', '31/12/2024', CPF)
+    evento.id = EVENTO_ID
+    return evento
+
+
+# (DAO, chamada, tabela, comando, índice esperado no plano). Os comandos de
+# remoção incluem as verificações de chave estrangeira das tabelas filhas
+CASOS = {
+    'inscricao_por_atleta_e_evento': (
+        InscricaoDAO, lambda dao: dao.get_by_atleta_e_evento(CPF, EVENTO_ID),
+        'Inscricoes', 'SELECT', 'idx_inscricoes_atleta_evento'),
+    'cpfs_inscritos': (
+        InscricaoDAO, lambda dao: dao.get_cpfs_inscritos(EVENTO_ID, [CPF]),
+        'Inscricoes', 'SELECT', 'idx_inscricoes_atleta_evento'),
+    'inscricoes_do_atleta': (
+        InscricaoDAO, lambda dao: dao.get_all_by_atleta(CPF),
+        'Inscricoes', 'SELECT', 'idx_inscricoes_atleta_evento'),
+    'inscricoes_do_evento': (
+        InscricaoDAO, lambda dao: dao.get_all_by_evento(EVENTO_ID),
+        'Inscricoes', 'SELECT', 'idx_inscricoes_evento'),
+    'contagem_de_inscricoes': (
+        InscricaoDAO, lambda dao: dao.count_by_evento(EVENTO_ID),
+        'Inscricoes', 'SELECT', 'idx_inscricoes_evento'),
+    'ficha_medica_da_inscricao': (
+        FichaMedicaDAO, lambda dao: dao.get_by_inscricao_id(1),
+        'FichasMedicas', 'SELECT', 'sqlite_autoindex_fichasmedicas_1'),
+    'kits_do_evento': (
+        EventoDAO, lambda dao: dao.get_kits_by_evento_id(EVENTO_ID),
+        'KitsDeCorrida', 'SELECT', 'idx_kits_evento'),
+    'remocao_de_kits_na_edicao': (
+        EventoDAO, lambda dao: dao.update_evento(evento_sem_kits()),
+        'KitsDeCorrida', 'DELETE', 'idx_inscricoes_kit'),
+    'remocao_de_kits_do_evento': (
+        EventoDAO, lambda dao: dao.delete_evento(EVENTO_ID),
+        'KitsDeCorrida', 'DELETE', 'idx_kits_evento'),
+    'eventos_disponiveis': (
+        EventoDAO, lambda dao: dao.get_all_disponiveis(),
+        'Eventos', 'SELECT', 'idx_eventos_data_iso'),
+    'eventos_do_periodo': (
+        EventoDAO, lambda dao: dao.get_all_por_periodo('01/01/2025', '31/12/2025'),
+        'Eventos', 'SELECT', 'idx_eventos_data_iso'),
+    'eventos_do_organizador': (
+        EventoDAO, lambda dao: dao.get_all_by_organizador(CPF),
+        'Eventos', 'SELECT', 'idx_eventos_organizador'),
+    'resultados_do_evento': (
+        ResultadoDAO, lambda dao: dao.buscar_resultados_por_evento(EVENTO_ID),
+        'Resultados', 'SELECT', 'idx_resultados_evento'),
+    'resultados_do_genero': (
+        ResultadoDAO, lambda dao: dao.buscar_resultados_por_grupo(EVENTO_ID, 'Masculino'),
+        'Resultados', 'SELECT', 'idx_resultados_evento_genero_categoria_tempo'),
+    'resultados_da_categoria': (
+        ResultadoDAO, lambda dao: dao.buscar_resultados_por_grupo(EVENTO_ID, 'Masculino', 'Adulto'),
+        'Resultados', 'SELECT', 'idx_resultados_evento_genero_categoria_tempo'),
+    'resultados_publicados_do_atleta': (
+        ResultadoDAO, lambda dao: dao.buscar_resultados_por_cpf_em_eventos_publicados(CPF),
+        'Resultados', 'SELECT', 'idx_resultados_cpf'),
+    'usuarios_por_cpf': (
+        UsuarioDAO, lambda dao: dao.get_many([CPF, '98765432100']),
+        'usuarios', 'SELECT', 'sqlite_autoindex_usuarios_1'),
+    'remocao_de_usuario': (
+        UsuarioDAO, lambda dao: dao.remove(CPF),
+        'usuarios', 'DELETE', 'idx_eventos_organizador'),
+}
+
+
+@pytest.mark.parametrize('dao_cls, chamada, tabela, comando, indice',
+                         list(CASOS.values()), ids=list(CASOS))
+def test_consultas_usam_indice(banco, dao_cls, chamada, tabela, comando, indice):
+    dao = dao_cls(banco.db_path)
+    for plano in planos_das_consultas(banco, lambda: chamada(dao), tabela, comando):
+        assert re.search(rf'index {indice}\b', plano), plano
+        assert 'scan ' not in plano, plano
+
+
+def test_resultados_da_categoria_saem_ordenados_pelo_indice(banco):
+    dao = ResultadoDAO(banco.db_path)
+    chamada = lambda: dao.buscar_resultados_por_grupo(EVENTO_ID, 'Masculino', 'Adulto')
+    for plano in planos_das_consultas(banco, chamada, 'Resultados'):
+        assert 'temp b-tree' not in plano, plano
+
+
+def test_todo_indice_do_esquema_tem_consulta_coberta(banco):
+    # Um índice novo precisa de um caso acima; um índice removido faz o seu caso falhar
+    indices = {
+        nome.lower() for (nome,) in banco.conexao().execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index';")
+    }
+    cobertos = {indice for *_, indice in CASOS.values()}
+    assert indices - cobertos == set()